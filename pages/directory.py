@@ -0,0 +1,115 @@
+import streamlit as st
+from shared.navigation import render_navigation
+from shared.styles import render_reusable_styles
+from shared.data_loader import get_dataset
+from shared.directory import build_directory_index
+from shared.job_titles import build_title_index
+from shared.aggregates import to_dollars
+
+
+##################################################
+# Page initialization and setup
+##################################################
+st.set_page_config(
+    page_title="Memphis Employee Insights – Employee Directory",
+    page_icon=":chart_with_upwards_trend:",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Render navigation
+render_navigation()
+
+# Render reusable styles
+render_reusable_styles('directory')
+
+# Columns shown in the results table
+RESULT_COLUMNS = ['Person Name', 'Job Title', 'Division Name', 'Employment Type']
+RESULT_LIMIT = 50
+TITLE_LIMIT = 10
+
+##################################################
+# Page content
+##################################################
+dataset = get_dataset()
+index = build_directory_index(dataset, dataset.version)
+title_index = build_title_index(dataset, dataset.version)
+
+st.space()
+
+st.title("Employee Directory")
+st.markdown('<h3 class="pt-0">Search City of Memphis employees by name or job title</h3>', unsafe_allow_html=True)
+
+employees_tab, titles_tab = st.tabs(["Employees", "Job Titles"])
+
+with employees_tab:
+    query = st.text_input(
+        "Search",
+        placeholder="e.g. smith j, police officer, fire",
+        label_visibility="collapsed",
+        icon=":material/search:",
+    )
+
+    if query.strip():
+        positions, matches = index.search(query, limit=RESULT_LIMIT)
+        if not matches:
+            st.info(f'No employees match "{query}".', icon=":material/person_search:")
+        else:
+            results = dataset.frame.iloc[positions]
+            shown = f"the first {len(positions)} of " if matches > len(positions) else ""
+            st.caption(f"Showing {shown}{matches:,} matching employees, by name.")
+
+            selection = st.dataframe(
+                results[RESULT_COLUMNS],
+                hide_index=True,
+                width="stretch",
+                on_select="rerun",
+                selection_mode="single-row",
+            )
+
+            selected_rows = selection.selection.rows
+            if selected_rows:
+                employee = results.iloc[selected_rows[0]]
+                with st.container(border=True):
+                    st.subheader(employee['Person Name'])
+                    st.markdown(f"**{employee['Job Title']}**")
+                    card_cols = st.columns(3)
+                    card_cols[0].metric("Division", employee['Division Name'])
+                    card_cols[1].metric("Division Category", employee['Division Category'])
+                    if employee['Employment Type'] == 'Full-time':
+                        card_cols[2].metric("Annual Salary", f"${to_dollars(employee['Annual Salary']):,.0f}")
+                    else:
+                        card_cols[2].metric("Hourly Rate", f"${to_dollars(employee['Hourly/Per Event Rate']):,.2f}")
+                    st.caption(f"{employee['Employment Type']} employee")
+            else:
+                st.caption("Select a row to see the employee's details.")
+    else:
+        st.caption(f"{len(dataset):,} employees are searchable by any part of their name or job title.")
+
+with titles_tab:
+    title_query = st.text_input(
+        "Job title",
+        placeholder="e.g. police officer, libarian, sanitation driver",
+        label_visibility="collapsed",
+        icon=":material/badge:",
+    )
+    if title_query.strip():
+        titles = title_index.search(title_query, limit=TITLE_LIMIT)
+        if titles.empty:
+            st.info(f'No job titles resemble "{title_query}".', icon=":material/badge:")
+        else:
+            st.caption("Closest job titles first, with headcount and pay across the city.")
+            st.dataframe(
+                titles,
+                hide_index=True,
+                width="stretch",
+                column_config={
+                    "Average Salary": st.column_config.NumberColumn(format="dollar"),
+                    "Max Salary": st.column_config.NumberColumn(format="dollar"),
+                    "Average Hourly Rate": st.column_config.NumberColumn(format="dollar"),
+                    "Max Hourly Rate": st.column_config.NumberColumn(format="dollar"),
+                    "Score": st.column_config.ProgressColumn("Match", min_value=0, max_value=1, format="percent"),
+                },
+            )
+    else:
+        st.caption(f"{len(title_index.title_sizes):,} job titles, searchable even when misspelled.")
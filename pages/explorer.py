@@ -0,0 +1,147 @@
+import streamlit as st
+import altair as alt
+import pandas as pd
+from shared.navigation import render_navigation
+from shared.styles import render_reusable_styles
+from shared.data_loader import get_dataset
+from shared.data_server import render_export_popover
+from shared.explorer import ExplorerFilter, SALARY_STEP, RATE_STEP, build_explorer_index, cached_summary
+from shared.colors import TEAL, LIGHT_TEAL
+
+
+##################################################
+# Page initialization and setup
+##################################################
+st.set_page_config(
+    page_title="Memphis Employee Insights – Explorer",
+    page_icon=":chart_with_upwards_trend:",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Render navigation
+render_navigation()
+
+# Render reusable styles
+render_reusable_styles('explorer')
+
+##################################################
+# Page content
+##################################################
+dataset = get_dataset()
+index = build_explorer_index(dataset, dataset.version)
+
+def options(column):
+    return list(index.bitmaps.labels[column])
+
+def pay_bounds(column, step):
+    # Whole bins spanned by everyone paid this way, in dollars
+    bins = [bin for bin in options(column) if bin >= 0]
+    return int(min(bins) * step / 100), int((max(bins) + 1) * step / 100)
+
+def pay_range(value, bounds):
+    # The full range filters nothing, not even people paid the other way
+    return None if tuple(value) == bounds else tuple(value)
+
+st.space()
+
+st.title("Explorer")
+st.markdown('<h3 class="pt-0">Filter the city\'s workforce and see every figure update together</h3>', unsafe_allow_html=True)
+
+with st.container(border=True):
+    filter_cols = st.columns(4)
+    categories = filter_cols[0].multiselect("Division Category", options('Division Category'), placeholder="All categories")
+    divisions = filter_cols[1].multiselect("Division", options('Division Name'), placeholder="All divisions")
+    employment_types = filter_cols[2].multiselect("Employment Type", options('Employment Type'), placeholder="All employment types")
+    job_titles = filter_cols[3].multiselect("Job Title", options('Job Title'), placeholder="All job titles")
+
+    range_cols = st.columns(2, gap="xlarge")
+    salary_bounds = pay_bounds('Salary Bin', SALARY_STEP)
+    salary_range = range_cols[0].slider(
+        "Annual Salary", *salary_bounds, value=salary_bounds, step=SALARY_STEP // 100, format="$%d"
+    )
+    rate_bounds = pay_bounds('Rate Bin', RATE_STEP)
+    rate_range = range_cols[1].slider(
+        "Hourly Rate", *rate_bounds, value=rate_bounds, step=RATE_STEP // 100, format="$%d/hr"
+    )
+
+spec = ExplorerFilter(
+    categories=tuple(categories),
+    divisions=tuple(divisions),
+    employment_types=tuple(employment_types),
+    job_titles=tuple(job_titles),
+    salary_range=pay_range(salary_range, salary_bounds),
+    rate_range=pay_range(rate_range, rate_bounds),
+)
+summary = cached_summary(index, spec)
+
+st.space()
+
+if not summary.employees:
+    st.info("No employees match these filters.", icon=":material/filter_alt_off:")
+    st.stop()
+
+with st.container(horizontal=True):
+    st.metric("Employees", f"{summary.employees:,}")
+    st.metric("Full-time", f"{summary.full_time_employees:,}")
+    st.metric("Part-time", f"{summary.part_time_employees:,}")
+    st.metric("Total Salaries", f"${summary.total_salary / 1e6:,.1f}M")
+    st.metric("Average Salary", "–" if pd.isna(summary.average_salary) else f"${summary.average_salary / 1e3:,.1f}k")
+    st.metric("Average Hourly Rate", "–" if pd.isna(summary.average_hourly_rate) else f"${summary.average_hourly_rate:,.2f}/hr")
+
+render_export_popover(spec, f"{summary.employees:,}", key="explorer export")
+
+st.space()
+
+chart_cols = st.columns(2, gap="xlarge")
+
+with chart_cols[0]:
+    st.markdown("### Employees by Division")
+    st.altair_chart(
+        alt.Chart(summary.division_employees).mark_bar().encode(
+            x=alt.X('Count:Q', axis=alt.Axis(format=',d', title='Employees')),
+            y=alt.Y('Division Name:N', sort=None, axis=alt.Axis(title=None, labelLimit=300)),
+            order=alt.Order('Employment Type', sort='ascending'),
+            color=alt.Color('Employment Type:N', scale=alt.Scale(domain=['Full-time', 'Part-time'], range=[TEAL, LIGHT_TEAL])),
+            tooltip=[
+                alt.Tooltip('Division Name:N', title='Division'),
+                alt.Tooltip('Employment Type:N'),
+                alt.Tooltip('Count:Q', title='Employees', format=',d'),
+            ],
+        ),
+        width="stretch",
+    )
+
+    st.markdown("### Most Common Job Titles")
+    st.dataframe(
+        summary.top_titles,
+        hide_index=True,
+        width="stretch",
+        column_config={
+            "Average Salary": st.column_config.NumberColumn(format="dollar"),
+            "Average Hourly Rate": st.column_config.NumberColumn(format="dollar"),
+        },
+    )
+
+with chart_cols[1]:
+    for title, bins, axis_format in [
+        ("Annual Salaries", summary.salary_histogram, '$,s'),
+        ("Hourly Rates", summary.rate_histogram, '$,.0f'),
+    ]:
+        st.markdown(f"### {title}")
+        if bins.empty:
+            st.caption("Nobody matching these filters is paid this way.")
+            continue
+        st.altair_chart(
+            alt.Chart(bins).mark_bar(color=TEAL).encode(
+                x=alt.X('Bin Start:Q', title=None, axis=alt.Axis(format=axis_format)),
+                x2='Bin End:Q',
+                y=alt.Y('Count:Q', title='Employees'),
+                tooltip=[
+                    alt.Tooltip('Bin Start:Q', format='$,.2f', title='From'),
+                    alt.Tooltip('Bin End:Q', format='$,.2f', title='To'),
+                    alt.Tooltip('Count:Q', format=',', title='Employees'),
+                ],
+            ).properties(height=250),
+            width="stretch",
+        )
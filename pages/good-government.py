@@ -1,12 +1,8 @@
 import streamlit as st
-import altair as alt
-import pandas as pd
 from shared.navigation import render_navigation
 from shared.styles import render_reusable_styles
-from shared.data_loader import initialize_data
-from shared.processing import get_division_details
-from shared.utilities import employment_type_table, employment_type_pie_chart
-from shared.colors import ORANGE, YELLOW, LIGHT_YELLOW
+from shared.category_page import CategoryPage, DivisionSection, render_category_page
+from shared.colors import YELLOW, LIGHT_YELLOW
 
 
 ##################################################
@@ -23,733 +19,80 @@ st.set_page_config(
 render_navigation()
 
 # Render reusable styles
-render_reusable_styles()
-
-# Page-specific CSS (only runs here on page)
-st.markdown("""
-<style>
-    /* Set background color for active page link */
-    [data-testid="stPageLink-NavLink"][href="good-government"] {
-        background: #FEEFC3;
-        border-left: 5px solid #FBBC04;
-        padding-left: 0.2rem;
-    }
-
-    /* Override metric delta colors */
-    [data-testid="stMetricDelta"] {
-        background: #FEEFC3 !important;
-        color: #202124 !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+render_reusable_styles('good-government')
 
 ##################################################
-# Data Preparation
+# Page content
 ##################################################
-
-# Get data from session state
-df = initialize_data()
-
-# Filter DataFrame to Good Government divisions
-df = df[df['Division Category'] == 'Good Government']
-
-def get_category(row):
-    division = row['Division Name']
-    governance = ['Executive', 'Legislative', 'Judicial']
-    legal = ['City Attorney', 'City Court Clerk']
-
-    if division in governance:
-        return 'Governance'
-    elif division in legal:
-        return 'Legal'
-    elif division == 'Finance and Administration':
-        return 'Finance'
-    elif division == 'Human Resources':
-        return 'HR'
-    elif division == 'Information Technology':
-        return 'IT'
-    else:
-        return
-
-# Define category to group divisions
-df['Category'] = df.apply(get_category, axis=1)
-
-# Calculating the sum of all salaries in each division
-division_salary_totals = pd.DataFrame(
-    df.groupby('Category')['Annual Salary'].sum()
-).reset_index()
-
-# Sort divisions by the sum of all salaries in descending order
-division_salary_totals.sort_values(
-    by='Annual Salary',
-    ascending=False,
-    inplace=True
-)
-
-# Get the total salary of Good Government workforce (in millions)
-good_government_total_salary = df['Annual Salary'].sum() / 1e6
-
-# Get total number of employees
-total_employees = len(df)
-# Get total number of full-time employees
-total_full_time_employees = (df['Employment Type'] == 'Full-time').sum()
-# Get total number of part-time employees
-total_part_time_employees = (df['Employment Type'] == 'Part-time').sum()
-
-# Create DataFrame for categorizing division category's employees by employment type
-employment_type_totals_df = pd.DataFrame({
-    "Employment Type": ["Full-time", "Part-time"],
-    "Value": [total_full_time_employees / total_employees, total_part_time_employees / total_employees],
-    "Count": [total_full_time_employees, total_part_time_employees]
-})
-
-# Make a copy of the original DataFrame
-governance_df = df.copy()
-# Filter employees to only those in Governance
-governance_df = governance_df[governance_df['Category'] == 'Governance']
-
-# Get total number of Governance employees
-total_governance_employees = len(governance_df)
-# Get total number of full-time employees
-total_full_time_governance_employees = (governance_df['Employment Type'] == 'Full-time').sum()
-# Get total number of part-time employees
-total_part_time_governance_employees = (governance_df['Employment Type'] == 'Part-time').sum()
-
-# Create DataFrame for categorizing Governance employees by employment type
-employment_type_governance_totals_df = pd.DataFrame({
-    "Employment Type": ["Full-time", "Part-time"],
-    "Value": [
-        total_full_time_governance_employees / total_governance_employees,
-        total_part_time_governance_employees / total_governance_employees
-    ],
-    "Count": [
-        total_full_time_governance_employees,
-        total_part_time_governance_employees
-    ]
-})
-
-# Make a copy of the original DataFrame
-finance_df = df.copy()
-# Filter employees to only those in Finance
-finance_df = finance_df[finance_df['Category'] == 'Finance']
-
-# Get total number of Finance employees
-total_finance_employees = len(finance_df)
-# Get total number of full-time employees
-total_full_time_finance_employees = (finance_df['Employment Type'] == 'Full-time').sum()
-# Get total number of part-time employees
-total_part_time_finance_employees = (finance_df['Employment Type'] == 'Part-time').sum()
-
-# Create DataFrame for categorizing Finance employees by employment type
-employment_type_finance_totals_df = pd.DataFrame({
-    "Employment Type": ["Full-time", "Part-time"],
-    "Value": [
-        total_full_time_finance_employees / total_finance_employees,
-        total_part_time_finance_employees / total_finance_employees
-    ],
-    "Count": [
-        total_full_time_finance_employees,
-        total_part_time_finance_employees
-    ]
-})
-
-# Make a copy of the original DataFrame
-hr_df = df.copy()
-# Filter employees to only those in Human Resources
-hr_df = hr_df[hr_df['Category'] == 'HR']
-
-# Get total number of Human Resources employees
-total_hr_employees = len(hr_df)
-# Get total number of full-time employees
-total_full_time_hr_employees = (hr_df['Employment Type'] == 'Full-time').sum()
-# Get total number of part-time employees
-total_part_time_hr_employees = (hr_df['Employment Type'] == 'Part-time').sum()
-
-# Create DataFrame for categorizing Human Resources employees by employment type
-employment_type_hr_totals_df = pd.DataFrame({
-    "Employment Type": ["Full-time", "Part-time"],
-    "Value": [
-        total_full_time_hr_employees / total_hr_employees,
-        total_part_time_hr_employees / total_hr_employees
-    ],
-    "Count": [
-        total_full_time_hr_employees,
-        total_part_time_hr_employees
-    ]
-})
-
-# Make a copy of the original DataFrame
-it_df = df.copy()
-# Filter employees to only those in Information Technology
-it_df = it_df[it_df['Category'] == 'IT']
-
-# Get total number of Information Technology employees
-total_it_employees = len(it_df)
-# Get total number of full-time employees
-total_full_time_it_employees = (it_df['Employment Type'] == 'Full-time').sum()
-# Get total number of part-time employees
-total_part_time_it_employees = (it_df['Employment Type'] == 'Part-time').sum()
-
-# Create DataFrame for categorizing Information Technology employees by employment type
-employment_type_it_totals_df = pd.DataFrame({
-    "Employment Type": ["Full-time", "Part-time"],
-    "Value": [
-        total_full_time_it_employees / total_it_employees,
-        total_part_time_it_employees / total_it_employees
+GOOD_GOVERNMENT_PAGE = CategoryPage(
+    category="Good Government",
+    subtitle="Finance, HR, IT, Legal, and Governance",
+    icon="account_balance",
+    salary_text="Good Government employees are organized into five primary categories: Governance, Finance, Legal, HR, and IT. These categories together account for more than $31.7 million in total salaries within the city's salaried full-time workforce.",
+    breakdown_text="Governance, Finance, Legal, HR, and IT together maintain a workforce of 681 individuals. These roles provide essential backbone support in areas such as financial management, legal counsel, human resources, information technology, and overall city administration. Salaried full-time employees make up more than 73% of the group, while part-time and hourly staff account for nearly 27%.",
+    color=YELLOW,
+    light_color=LIGHT_YELLOW,
+    by='Division Group',
+    sections=[
+        DivisionSection(
+            key="Governance",
+            title="Governance",
+            salary_text=[
+                "Governance serves as the central hub for city leadership and legislative operations. The department supports the Mayor’s office, City Council activities, policy development, and coordination across city government. Entry-level positions such as Office Support Clerk typically start around $37,000 per year. With experience and career progression, compensation can exceed $227,000 annually for senior leadership, managerial, and director-level roles",
+                "Part-time and hourly positions generally start at $12 per hour and can reach up to $80 per hour for highly specialized or senior support roles.",
+            ],
+            breakdown_text="Governance maintains a compact team of 254 individuals spread across 105 unique job titles. These positions support core city leadership functions, including mayoral operations, City Council support, policy coordination, and administrative services for city government. Full-time employees make up 61% of the workforce, while part-time and hourly staff account for 39%.",
+            job_icon="gavel",
+            part_time_job_icon="pets",
+        ),
+        DivisionSection(
+            key="Finance and Administration",
+            title="Finance",
+            salary_text=[
+                "The Finance department delivers essential fiscal leadership for the City of Memphis through budgeting, accounting, payroll, procurement, revenue collection, and financial reporting. Entry-level positions such as Finance Payroll Specialist typically start around $43,000 per year. Compensation increases significantly with experience and expertise, with senior and specialized financial roles exceeding $175,000 annually.",
+                "Part-time and hourly pay generally begins at $15 per hour for entry-level support roles and can reach up to $34 per hour for specialized positions, such as Accountant III.",
+            ],
+            breakdown_text="Finance maintains a lean workforce of 118 individuals across 64 unique job titles. These roles support critical city functions including budgeting, accounting, payroll processing, procurement, and financial analysis. Full-time staff make up more than 86% of the department, while part-time and hourly employees account for nearly 14%.",
+            job_icon="paid",
+            part_time_job_icon="checkbook",
+        ),
+        DivisionSection(
+            key="Human Resources",
+            title="Human Resources",
+            label="HR",
+            salary_text=[
+                "Human Resources handles recruitment, employee relations, benefits administration, training and development, and compliance across all Memphis city departments. Entry-level roles such as Junior Recruiter typically start around $38,000 per year. Salaries increase substantially with experience and responsibility, exceeding $165,000 annually for supervisory, managerial, and director-level positions.",
+                "Part-time and hourly staff generally start at $15.50 per hour, with rates reaching up to $34 per hour for more senior or specialized positions.",
+            ],
+            breakdown_text="Human Resources operates with a workforce of 119 individuals across 74 unique job titles. These roles span recruitment, benefits administration, employee relations, training, compliance, and strategic workforce planning. Full-time employees make up nearly 54% of the department while part-time and hourly staff account for more than 46%. This creates an almost balanced split between full-time and part-time workers.",
+            job_icon="person_celebrate",
+            part_time_job_icon="universal_currency",
+        ),
+        DivisionSection(
+            key="Information Technology",
+            title="Information Technology",
+            label="IT",
+            salary_text=[
+                "Information Technology plays a vital role in keeping the City of Memphis running efficiently through technology infrastructure, cybersecurity, system modernization, digital services, and technical support across all city departments. Entry-level positions such as Service Desk Agent typically start around $46,000 per year, with compensation rising significantly through experience and career progression to exceed $165,000 annually for senior technical, managerial, and director-level roles. Most positions in the department are full-time, with the only part-time or hourly opportunity being internships that generally start at $15 per hour.",
+            ],
+            breakdown_text="Information Technology operates with a compact team of 67 individuals across 47 unique job titles. These roles cover technology infrastructure, cybersecurity, application support, system administration, and digital service delivery for the entire city government. Full-time employees make up over 98% of the core workforce, with part-time and hourly staff representing just under 2%.",
+            job_icon="badge",
+            part_time_job_icon="laptop_chromebook",
+        ),
+        DivisionSection(
+            key="Legal",
+            title="Legal",
+            salary_text=[
+                "The Legal division provides essential legal counsel and representation for the City of Memphis across a wide range of matters, including litigation, contract review, regulatory compliance, and advisory services to city departments and leadership. Entry-level positions typically start around $34,000 per year, while compensation can reach $175,000 annually for senior attorneys, managerial, and director-level roles with experience and career progression. Part-time and hourly positions are limited, generally starting at $15 per hour and rising only slightly to $16 per hour for the highest hourly roles.",
+            ],
+            breakdown_text="The Legal division operates with a compact team of 123 individuals across 38 unique job titles. These roles focus on litigation support, contract review, regulatory compliance, risk management, and legal advisory services for city leadership and departments. Full-time employees make up more than 90% of the core workforce, with part-time and hourly staff representing less than 10%.",
+            job_icon="balance",
+            part_time_job_icon="fact_check",
+        ),
     ],
-    "Count": [
-        total_full_time_it_employees,
-        total_part_time_it_employees
-    ]
-})
-
-# Make a copy of the original DataFrame
-legal_df = df.copy()
-# Filter employees to only those in Legal
-legal_df = legal_df[legal_df['Category'] == 'Legal']
-
-# Get total number of Legal employees
-total_legal_employees = len(legal_df)
-# Get total number of full-time employees
-total_full_time_legal_employees = (legal_df['Employment Type'] == 'Full-time').sum()
-# Get total number of part-time employees
-total_part_time_legal_employees = (legal_df['Employment Type'] == 'Part-time').sum()
-
-# Create DataFrame for categorizing Legal employees by employment type
-employment_type_legal_totals_df = pd.DataFrame({
-    "Employment Type": ["Full-time", "Part-time"],
-    "Value": [
-        total_full_time_legal_employees / total_legal_employees,
-        total_part_time_legal_employees / total_legal_employees
-    ],
-    "Count": [
-        total_full_time_legal_employees,
-        total_part_time_legal_employees
-    ]
-})
-
-(
-    top_paying_governance_job,
-    max_governance_salary,
-    min_governance_salary,
-    top_paying_governance_part_time_job,
-    max_governance_hourly_rate,
-    min_governance_hourly_rate,
-    average_governance_salary,
-    average_governance_hourly_rate,
-    total_unique_governance_jobs,
-    total_governance_employees,
-    total_full_time_governance_employees,
-    total_part_time_governance_employees,
-    employment_type_governance_totals_df
-) = get_division_details('Governance')
-
-(
-    top_paying_finance_job,
-    max_finance_salary,
-    min_finance_salary,
-    top_paying_finance_part_time_job,
-    max_finance_hourly_rate,
-    min_finance_hourly_rate,
-    average_finance_salary,
-    average_finance_hourly_rate,
-    total_unique_finance_jobs,
-    total_finance_employees,
-    total_full_time_finance_employees,
-    total_part_time_finance_employees,
-    employment_type_finance_totals_df
-) = get_division_details('Finance and Administration')
-
-(
-    top_paying_human_resources_job,
-    max_human_resources_salary,
-    min_human_resources_salary,
-    top_paying_human_resources_part_time_job,
-    max_human_resources_hourly_rate,
-    min_human_resources_hourly_rate,
-    average_human_resources_salary,
-    average_human_resources_hourly_rate,
-    total_unique_human_resources_jobs,
-    total_human_resources_employees,
-    total_full_time_human_resources_employees,
-    total_part_time_human_resources_employees,
-    employment_type_human_resources_totals_df
-) = get_division_details('Human Resources')
-
-(
-    top_paying_info_tech_job,
-    max_info_tech_salary,
-    min_info_tech_salary,
-    top_paying_info_tech_part_time_job,
-    max_info_tech_hourly_rate,
-    min_info_tech_hourly_rate,
-    average_info_tech_salary,
-    average_info_tech_hourly_rate,
-    total_unique_info_tech_jobs,
-    total_info_tech_employees,
-    total_full_time_info_tech_employees,
-    total_part_time_info_tech_employees,
-    employment_type_info_tech_totals_df
-) = get_division_details('Information Technology')
-
-(
-    top_paying_legal_job,
-    max_legal_salary,
-    min_legal_salary,
-    top_paying_legal_part_time_job,
-    max_legal_hourly_rate,
-    min_legal_hourly_rate,
-    average_legal_salary,
-    average_legal_hourly_rate,
-    total_unique_legal_jobs,
-    total_legal_employees,
-    total_full_time_legal_employees,
-    total_part_time_legal_employees,
-    employment_type_legal_totals_df
-) = get_division_details('Legal')
+)
 
 ##################################################
 # UI Content
 ##################################################
-st.space()
-
-with st.spinner('Loading data and calculations...'):
-    st.title("Good Government")
-    st.markdown('<h3 class="pt-0">Finance, HR, IT, Legal, and Governance</h3>', unsafe_allow_html=True)
-
-    st.space()
-
-    st.markdown('<h2 class="pt-0">Salaries by Division</h2>', unsafe_allow_html=True)
-
-    salary_cols = st.columns(2, gap="xlarge")
-
-    with salary_cols[0]:
-        st.text("Good Government employees are organized into five primary categories: Governance, Finance, Legal, HR, and IT. These categories together account for more than $31.7 million in total salaries within the city's salaried full-time workforce.")
-
-        st.markdown(
-            """
-            <div class="table-row">
-                <span class="bold">Division</span>
-                <span class="bold">Percent of Good Government Salaries</span>
-            </div>
-            <div class="table-row">
-                <span>Governance</span>
-                <span>29.4%</span>
-            </div>
-            <div class="table-row"">
-                <span>Finance</span>
-                <span>20.9%</span>
-            </div>
-            <div class="table-row"">
-                <span>Legal</span>
-                <span>20.6%</span>
-            </div>
-            <div class="table-row"">
-                <span>HR</span>
-                <span>14.9%</span>
-            </div>
-            <div class="table-row"">
-                <span>IT</span>
-                <span>14.2%</span>
-            </div>
-            <div class="table-row">
-                <span class="bold">Total</span>
-                <span class="bold">100%</span>
-            </div>
-            """, unsafe_allow_html=True
-        )
-
-        st.space()
-
-        st.metric(
-            label=":material/account_balance: Good Government Workforce Salaries",
-            value=f"${good_government_total_salary:,.1f}M",  
-            delta=None,
-        )
-
-    with salary_cols[1]:
-        chart = alt.Chart(division_salary_totals).mark_bar(color=YELLOW).encode(
-            x=alt.X(
-                'Category',
-                axis=alt.Axis(labelAngle=0),  # Rotate labels
-                sort=None,
-                title=None,
-            ),
-            y=alt.Y(
-                'Annual Salary',
-                axis=alt.Axis(
-                    title='Annual Salary Total',
-                    format='$,s'  # Format numbers
-                ),
-            ),
-            tooltip=[
-                alt.Tooltip("Category:N", title="Category"),
-                alt.Tooltip("Annual Salary:Q", format="$,.2f", title="Salaries")
-            ]
-        )
-        st.altair_chart(chart)
-
-    st.space()
-
-    st.markdown('### Employment Breakdown')
-    
-    salary_row2_cols = st.columns(2, gap="xlarge")
-
-    with salary_row2_cols[0]:
-        st.text("Governance, Finance, Legal, HR, and IT together maintain a workforce of 681 individuals. These roles provide essential backbone support in areas such as financial management, legal counsel, human resources, information technology, and overall city administration. Salaried full-time employees make up more than 73% of the group, while part-time and hourly staff account for nearly 27%.")
-
-        st.markdown(
-            employment_type_table(
-                total_full_time_employees,
-                total_part_time_employees,
-                total_employees
-            ),
-            unsafe_allow_html=True
-        )
-
-    with salary_row2_cols[1]:
-        pie_chart_employment_type = employment_type_pie_chart(
-            employment_type_totals_df,
-            YELLOW,
-            LIGHT_YELLOW
-        )
-
-        st.altair_chart(pie_chart_employment_type, width="stretch")
-
-    st.space()
-    st.divider()
-    st.space()
-
-    st.markdown('<h2 class="pt-0">Governance</h2>', unsafe_allow_html=True)
-
-    salary_cols = st.columns(2, gap="xlarge")
-
-    with salary_cols[0]:
-        st.text("Governance serves as the central hub for city leadership and legislative operations. The department supports the Mayor’s office, City Council activities, policy development, and coordination across city government. Entry-level positions such as Office Support Clerk typically start around $37,000 per year. With experience and career progression, compensation can exceed $227,000 annually for senior leadership, managerial, and director-level roles")
-        st.text("Part-time and hourly positions generally start at $12 per hour and can reach up to $80 per hour for highly specialized or senior support roles.")
-
-    with salary_cols[1]:
-        with st.container(horizontal=True):
-            st.metric(
-                label=f":material/gavel: {top_paying_governance_job}",
-                value=(
-                    f"${max_governance_salary/1e3:,.0f}k"
-                    if round(max_governance_salary)%1000 == 0
-                    else f"${max_governance_salary/1e3:,.1f}k"
-                ),
-                delta="Top Full-Time Salary",
-            )
-            st.metric(
-                label=f":material/pets: {top_paying_governance_part_time_job}".replace("Veterinarian", "Vet"),
-                value=f"${max_governance_hourly_rate:.0f}/hr",
-                delta="Top Part-Time Rate",
-            )
-        st.space()
-        with st.container(horizontal=True):
-            st.metric(
-                label=f"Average full-time salary",
-                value=f"${average_governance_salary/1e3:,.1f}k",  
-                delta=None,
-            )
-            st.metric(
-                label=f"Average part-time rate ",
-                value=f"${average_governance_hourly_rate:.0f}/hr",
-                delta=None,
-            )
-
-    st.space()
-
-    st.markdown('### Governance Employment Breakdown')
-    
-    governance_row2_cols = st.columns(2, gap="xlarge")
-
-    with governance_row2_cols[0]:
-        st.text("Governance maintains a compact team of 254 individuals spread across 105 unique job titles. These positions support core city leadership functions, including mayoral operations, City Council support, policy coordination, and administrative services for city government. Full-time employees make up 61% of the workforce, while part-time and hourly staff account for 39%.")
-
-        st.markdown(
-            employment_type_table(
-                total_full_time_governance_employees,
-                total_part_time_governance_employees,
-                total_governance_employees
-            ),
-            unsafe_allow_html=True
-        )
-
-    with governance_row2_cols[1]:
-        pie_chart_employment_type = employment_type_pie_chart(
-            employment_type_governance_totals_df,
-            YELLOW,
-            LIGHT_YELLOW
-        )
-
-        st.altair_chart(pie_chart_employment_type, width="stretch")
-
-    st.space()
-    st.divider()
-    st.space()
-
-    st.markdown('<h2 class="pt-0">Finance</h2>', unsafe_allow_html=True)
-
-    salary_cols = st.columns(2, gap="xlarge")
-
-    with salary_cols[0]:
-        st.text("The Finance department delivers essential fiscal leadership for the City of Memphis through budgeting, accounting, payroll, procurement, revenue collection, and financial reporting. Entry-level positions such as Finance Payroll Specialist typically start around $43,000 per year. Compensation increases significantly with experience and expertise, with senior and specialized financial roles exceeding $175,000 annually.")
-        st.text("Part-time and hourly pay generally begins at $15 per hour for entry-level support roles and can reach up to $34 per hour for specialized positions, such as Accountant III.")
-
-    with salary_cols[1]:
-        with st.container(horizontal=True):
-            st.metric(
-                label=f":material/paid: {top_paying_finance_job}".replace("Financial Officer Chief", "Chief Financial Officer"),
-                value=(
-                    f"${max_finance_salary/1e3:,.0f}k"
-                    if round(max_finance_salary)%1000 == 0
-                    else f"${max_finance_salary/1e3:,.1f}k"
-                ),
-                delta="Top Full-Time Salary",
-            )
-            st.metric(
-                label=f":material/checkbook: {top_paying_finance_part_time_job}",
-                value=f"${max_finance_hourly_rate:.0f}/hr",
-                delta="Top Part-Time Rate",
-            )
-        st.space()
-        with st.container(horizontal=True):
-            st.metric(
-                label=f"Average full-time salary",
-                value=f"${average_finance_salary/1e3:,.1f}k",  
-                delta=None,
-            )
-            st.metric(
-                label=f"Average part-time rate ",
-                value=f"${average_finance_hourly_rate:.0f}/hr",
-                delta=None,
-            )
-
-    st.space()
-
-    st.markdown('### Finance Employment Breakdown')
-    
-    finance_row2_cols = st.columns(2, gap="xlarge")
-
-    with finance_row2_cols[0]:
-        st.text("Finance maintains a lean workforce of 118 individuals across 64 unique job titles. These roles support critical city functions including budgeting, accounting, payroll processing, procurement, and financial analysis. Full-time staff make up more than 86% of the department, while part-time and hourly employees account for nearly 14%.")
-
-        st.markdown(
-            employment_type_table(
-                total_full_time_finance_employees,
-                total_part_time_finance_employees,
-                total_finance_employees
-            ),
-            unsafe_allow_html=True
-        )
-
-    with finance_row2_cols[1]:
-        pie_chart_employment_type = employment_type_pie_chart(
-            employment_type_finance_totals_df,
-            YELLOW,
-            LIGHT_YELLOW
-        )
-
-        st.altair_chart(pie_chart_employment_type, width="stretch")
-
-    st.space()
-    st.divider()
-    st.space()
-
-    st.markdown('<h2 class="pt-0">Human Resources</h2>', unsafe_allow_html=True)
-
-    salary_cols = st.columns(2, gap="xlarge")
-
-    with salary_cols[0]:
-        st.text("Human Resources handles recruitment, employee relations, benefits administration, training and development, and compliance across all Memphis city departments. Entry-level roles such as Junior Recruiter typically start around $38,000 per year. Salaries increase substantially with experience and responsibility, exceeding $165,000 annually for supervisory, managerial, and director-level positions.")
-        st.text("Part-time and hourly staff generally start at $15.50 per hour, with rates reaching up to $34 per hour for more senior or specialized positions.")
-
-    with salary_cols[1]:
-        with st.container(horizontal=True):
-            st.metric(
-                label=f":material/person_celebrate: {top_paying_human_resources_job}".replace("Human Resources Officer Chief", "Chief Human Resources Officer"),
-                value=(
-                    f"${max_human_resources_salary/1e3:,.0f}k"
-                    if round(max_human_resources_salary)%1000 == 0
-                    else f"${max_human_resources_salary/1e3:,.1f}k"
-                ),
-                delta="Top Full-Time Salary",
-            )
-            st.metric(
-                label=f":material/universal_currency: {top_paying_human_resources_part_time_job}".replace("Compensation Coord Sr", "Sr. Compensation Coordinator"),
-                value=f"${max_human_resources_hourly_rate:.0f}/hr",
-                delta="Top Part-Time Rate",
-            )
-        st.space()
-        with st.container(horizontal=True):
-            st.metric(
-                label=f"Average full-time salary",
-                value=f"${average_human_resources_salary/1e3:,.1f}k",  
-                delta=None,
-            )
-            st.metric(
-                label=f"Average part-time rate ",
-                value=f"${average_human_resources_hourly_rate:.0f}/hr",
-                delta=None,
-            )
-
-    st.space()
-
-    st.markdown('### HR Employment Breakdown')
-    
-    hr_row2_cols = st.columns(2, gap="xlarge")
-
-    with hr_row2_cols[0]:
-        st.text("Human Resources operates with a workforce of 119 individuals across 74 unique job titles. These roles span recruitment, benefits administration, employee relations, training, compliance, and strategic workforce planning. Full-time employees make up nearly 54% of the department while part-time and hourly staff account for more than 46%. This creates an almost balanced split between full-time and part-time workers.")
-
-        st.markdown(
-            employment_type_table(
-                total_full_time_hr_employees,
-                total_part_time_hr_employees,
-                total_hr_employees
-            ),
-            unsafe_allow_html=True
-        )
-
-    with hr_row2_cols[1]:
-        pie_chart_employment_type = employment_type_pie_chart(
-            employment_type_hr_totals_df,
-            YELLOW,
-            LIGHT_YELLOW
-        )
-
-        st.altair_chart(pie_chart_employment_type, width="stretch")
-
-    st.space()
-    st.divider()
-    st.space()
-
-    st.markdown('<h2 class="pt-0">Information Technology</h2>', unsafe_allow_html=True)
-
-    salary_cols = st.columns(2, gap="xlarge")
-
-    with salary_cols[0]:
-        st.text("Information Technology plays a vital role in keeping the City of Memphis running efficiently through technology infrastructure, cybersecurity, system modernization, digital services, and technical support across all city departments. Entry-level positions such as Service Desk Agent typically start around $46,000 per year, with compensation rising significantly through experience and career progression to exceed $165,000 annually for senior technical, managerial, and director-level roles. Most positions in the department are full-time, with the only part-time or hourly opportunity being internships that generally start at $15 per hour.")
-
-    with salary_cols[1]:
-        with st.container(horizontal=True):
-            st.metric(
-                label=f":material/badge: {top_paying_info_tech_job}".replace("Info", "IT"),
-                value=(
-                    f"${max_info_tech_salary/1e3:,.0f}k"
-                    if round(max_info_tech_salary)%1000 == 0
-                    else f"${max_info_tech_salary/1e3:,.1f}k"
-                ),
-                delta="Top Full-Time Salary",
-            )
-            st.metric(
-                label=f":material/laptop_chromebook: {top_paying_info_tech_part_time_job}".replace("Internship Urban Fellow", "Internship (Urban Fellow)"),
-                value=f"${max_info_tech_hourly_rate:.0f}/hr",
-                delta="Top Part-Time Rate",
-            )
-        st.space()
-        with st.container(horizontal=True):
-            st.metric(
-                label=f"Average full-time salary",
-                value=f"${average_info_tech_salary/1e3:,.1f}k",  
-                delta=None,
-            )
-            st.metric(
-                label=f"Average part-time rate ",
-                value=f"${average_info_tech_hourly_rate:.0f}/hr",
-                delta=None,
-            )
-
-    st.space()
-
-    st.markdown('### IT Employment Breakdown')
-    
-    it_row2_cols = st.columns(2, gap="xlarge")
-
-    with it_row2_cols[0]:
-        st.text("Information Technology operates with a compact team of 67 individuals across 47 unique job titles. These roles cover technology infrastructure, cybersecurity, application support, system administration, and digital service delivery for the entire city government. Full-time employees make up over 98% of the core workforce, with part-time and hourly staff representing just under 2%.")
-
-        st.markdown(
-            employment_type_table(
-                total_full_time_it_employees,
-                total_part_time_it_employees,
-                total_it_employees
-            ),
-            unsafe_allow_html=True
-        )
-
-    with it_row2_cols[1]:
-        pie_chart_employment_type = employment_type_pie_chart(
-            employment_type_it_totals_df,
-            YELLOW,
-            LIGHT_YELLOW
-        )
-
-        st.altair_chart(pie_chart_employment_type, width="stretch")
-
-    st.space()
-    st.divider()
-    st.space()
-
-    st.markdown('<h2 class="pt-0">Legal</h2>', unsafe_allow_html=True)
-
-    salary_cols = st.columns(2, gap="xlarge")
-
-    with salary_cols[0]:
-        st.text("The Legal division provides essential legal counsel and representation for the City of Memphis across a wide range of matters, including litigation, contract review, regulatory compliance, and advisory services to city departments and leadership. Entry-level positions typically start around $34,000 per year, while compensation can reach $175,000 annually for senior attorneys, managerial, and director-level roles with experience and career progression. Part-time and hourly positions are limited, generally starting at $15 per hour and rising only slightly to $16 per hour for the highest hourly roles.")
-
-    with salary_cols[1]:
-        with st.container(horizontal=True):
-            st.metric(
-                label=f":material/balance: {top_paying_legal_job}".replace("Legal Officer Chief", "Chief Legal Officer"),
-                value=(
-                    f"${max_legal_salary/1e3:,.0f}k"
-                    if round(max_legal_salary)%1000 == 0
-                    else f"${max_legal_salary/1e3:,.1f}k"
-                ),
-                delta="Top Full-Time Salary",
-            )
-            st.metric(
-                label=f":material/fact_check: {top_paying_legal_part_time_job}".replace("Rec", "Records"),
-                value=f"${max_legal_hourly_rate:.0f}/hr",
-                delta="Top Part-Time Rate",
-            )
-        st.space()
-        with st.container(horizontal=True):
-            st.metric(
-                label=f"Average full-time salary",
-                value=f"${average_legal_salary/1e3:,.1f}k",  
-                delta=None,
-            )
-            st.metric(
-                label=f"Average part-time rate ",
-                value=f"${average_legal_hourly_rate:.0f}/hr",
-                delta=None,
-            )
-
-    st.space()
-
-    st.markdown('### Legal Employment Breakdown')
-    
-    legal_row2_cols = st.columns(2, gap="xlarge")
-
-    with legal_row2_cols[0]:
-        st.text("The Legal division operates with a compact team of 123 individuals across 38 unique job titles. These roles focus on litigation support, contract review, regulatory compliance, risk management, and legal advisory services for city leadership and departments. Full-time employees make up more than 90% of the core workforce, with part-time and hourly staff representing less than 10%.")
-
-        st.markdown(
-            employment_type_table(
-                total_full_time_legal_employees,
-                total_part_time_legal_employees,
-                total_legal_employees
-            ),
-            unsafe_allow_html=True
-        )
-
-    with legal_row2_cols[1]:
-        pie_chart_employment_type = employment_type_pie_chart(
-            employment_type_legal_totals_df,
-            YELLOW,
-            LIGHT_YELLOW
-        )
-
-        st.altair_chart(pie_chart_employment_type, width="stretch")
+render_category_page(GOOD_GOVERNMENT_PAGE)
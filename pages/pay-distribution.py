@@ -0,0 +1,127 @@
+import streamlit as st
+import altair as alt
+import pandas as pd
+from shared.navigation import render_navigation
+from shared.styles import render_reusable_styles
+from shared.data_loader import get_dataset
+from shared.distributions import PERCENTILES, build_pay_distributions
+from shared.chart_cache import cached_altair_chart
+from shared.colors import TEAL, LIGHT_TEAL, BLACK
+
+
+##################################################
+# Page initialization and setup
+##################################################
+st.set_page_config(
+    page_title="Memphis Employee Insights – Pay Distribution",
+    page_icon=":chart_with_upwards_trend:",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Render navigation
+render_navigation()
+
+# Render reusable styles
+render_reusable_styles('pay-distribution')
+
+# Grouping options -> distribution keys
+GROUPINGS = {'Division': 'division', 'Job Title': 'title'}
+# Pay options -> measure, histogram bin width (cents) and dollar format
+PAY_TYPES = {
+    'Annual Salary': ('Salary', 500_000, lambda dollars: f"${dollars / 1e3:,.1f}k"),
+    'Hourly Rate': ('Rate', 100, lambda dollars: f"${dollars:,.2f}/hr"),
+}
+
+##################################################
+# Page content
+##################################################
+dataset = get_dataset()
+distributions = build_pay_distributions(dataset, dataset.version)
+
+st.space()
+
+st.title("Pay Distribution")
+st.markdown('<h3 class="pt-0">How pay is spread within a division or job title</h3>', unsafe_allow_html=True)
+
+controls = st.columns([1, 2, 1], gap="large")
+with controls[0]:
+    # Deselecting the active option falls back to the default
+    grouping = st.segmented_control("Group by", list(GROUPINGS), default="Division") or "Division"
+key = GROUPINGS[grouping]
+
+with controls[2]:
+    pay_type = st.segmented_control("Pay", list(PAY_TYPES), default="Annual Salary") or "Annual Salary"
+measure, step, format_pay = PAY_TYPES[pay_type]
+sorted_pay = distributions[key, measure]
+
+with controls[1]:
+    # Only groups with someone paid this way, largest first
+    counts = pd.Series({label: sorted_pay.count(label) for label in sorted_pay.labels})
+    counts = counts[counts > 0].sort_values(ascending=False, kind='stable')
+    label = st.selectbox(grouping, counts.index, format_func=lambda label: f"{label} ({counts[label]:,})")
+
+st.space()
+
+box = sorted_pay.box(label) if label is not None else None
+if box is None:
+    st.info(f"Nobody in this {grouping.lower()} is paid an {pay_type.lower()}.", icon=":material/info:")
+    st.stop()
+
+quantiles = sorted_pay.quantiles(label) / 100
+
+with st.container(horizontal=True):
+    st.metric("Employees", f"{box.count:,}")
+    for percentile in PERCENTILES:
+        st.metric("Median" if percentile == 50 else f"{percentile}th percentile", format_pay(quantiles[percentile]))
+
+st.space()
+
+chart_cols = st.columns([3, 2], gap="xlarge")
+
+with chart_cols[0]:
+    st.markdown(f"### {pay_type} Histogram")
+
+    def build_histogram_chart():
+        bins = sorted_pay.histogram(label, step)
+        bins[['Bin Start', 'Bin End']] /= 100
+        return alt.Chart(bins).mark_bar(color=TEAL).encode(
+            x=alt.X('Bin Start:Q', title=pay_type, axis=alt.Axis(format='$,.0f')),
+            x2='Bin End:Q',
+            y=alt.Y('Count:Q', title='Employees'),
+            tooltip=[
+                alt.Tooltip('Bin Start:Q', format='$,.2f', title='From'),
+                alt.Tooltip('Bin End:Q', format='$,.2f', title='To'),
+                alt.Tooltip('Count:Q', format=',', title='Employees'),
+            ],
+        )
+    cached_altair_chart(f"pay-distribution/{key}/{measure}/{label}/histogram", build_histogram_chart, colors=(TEAL,), width="stretch")
+
+with chart_cols[1]:
+    st.markdown(f"### {pay_type} Box Summary")
+
+    def build_box_chart():
+        summary = pd.DataFrame([{
+            'Label': label,
+            'Lower Whisker': box.lower_whisker / 100,
+            'Q1': box.q1 / 100,
+            'Median': box.median / 100,
+            'Q3': box.q3 / 100,
+            'Upper Whisker': box.upper_whisker / 100,
+        }])
+        y = alt.Y('Label:N', title=None, axis=None)
+        tooltip = [alt.Tooltip(f'{column}:Q', format='$,.2f') for column in summary.columns[1:]]
+        whiskers = alt.Chart(summary).mark_rule(color=BLACK).encode(
+            x=alt.X('Lower Whisker:Q', title=pay_type, axis=alt.Axis(format='$,.0f'), scale=alt.Scale(zero=False)),
+            x2='Upper Whisker:Q',
+            y=y,
+        )
+        boxes = alt.Chart(summary).mark_bar(color=LIGHT_TEAL, size=40).encode(x='Q1:Q', x2='Q3:Q', y=y, tooltip=tooltip)
+        medians = alt.Chart(summary).mark_tick(color=TEAL, thickness=3, size=40).encode(x='Median:Q', y=y, tooltip=tooltip)
+        return (whiskers + boxes + medians).properties(height=120)
+    cached_altair_chart(f"pay-distribution/{key}/{measure}/{label}/box", build_box_chart, colors=(TEAL, LIGHT_TEAL), width="stretch")
+
+    st.caption(
+        f"Whiskers reach the lowest and highest pay within 1.5 interquartile ranges of the box; "
+        f"{box.outliers:,} of {box.count:,} employees fall beyond them."
+    )
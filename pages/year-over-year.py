@@ -0,0 +1,160 @@
+import streamlit as st
+import altair as alt
+import pandas as pd
+from shared.navigation import render_navigation
+from shared.styles import render_reusable_styles
+from shared.data_loader import get_snapshots
+from shared.payroll_diff import HIRED, SEPARATED, TRANSFERRED, get_payroll_diff
+from shared.colors import TEAL, LIGHT_TEAL
+
+
+##################################################
+# Page initialization and setup
+##################################################
+st.set_page_config(
+    page_title="Memphis Employee Insights – Year over Year",
+    page_icon=":chart_with_upwards_trend:",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Render navigation
+render_navigation()
+
+# Render reusable styles
+render_reusable_styles('year-over-year')
+
+##################################################
+# Page content
+##################################################
+snapshots = list(get_snapshots())
+
+st.space()
+
+st.title("Year over Year")
+st.markdown('<h3 class="pt-0">Hires, separations, raises and title changes between two payrolls</h3>', unsafe_allow_html=True)
+
+if len(snapshots) < 2:
+    st.info(
+        "Only one payroll snapshot is available. Add another year's payroll file to data/ to compare them.",
+        icon=":material/compare_arrows:",
+    )
+    st.stop()
+
+controls = st.columns(4)
+after = controls[1].selectbox("Compare", snapshots[1:], index=len(snapshots) - 2)
+earlier = snapshots[:snapshots.index(after)]
+before = controls[0].selectbox("With", earlier, index=len(earlier) - 1)
+
+diff = get_payroll_diff(before, after)
+totals = diff.totals
+
+with st.container(horizontal=True):
+    st.metric("Employees", f"{totals['Employees After']:,}", delta=f"{totals['Headcount Change']:+,}")
+    st.metric("Hires", f"{totals['Hires']:,}")
+    st.metric("Separations", f"{totals['Separations']:,}")
+    st.metric("Transfers", f"{totals['Transfers In']:,}")
+    st.metric("Title Changes", f"{totals['Title Changes']:,}")
+    change = totals['Payroll Change']
+    st.metric("Total Salaries", f"${totals['Payroll After'] / 1e6:,.1f}M", delta=f"{'+' if change >= 0 else '-'}${abs(change) / 1e6:,.1f}M")
+    st.metric(
+        "Median Raise",
+        "–" if pd.isna(totals['Median Raise']) else f"${totals['Median Raise']:,.0f}",
+        delta=None if pd.isna(totals['Median Raise %']) else f"{totals['Median Raise %']:+.1%}",
+    )
+
+st.space()
+
+st.markdown("### Changes by Division")
+
+chart_cols = st.columns(2, gap="xlarge")
+
+with chart_cols[0]:
+    flows = diff.divisions[['Hires', 'Transfers In', 'Separations', 'Transfers Out']].copy()
+    # People leaving a division are drawn below zero
+    flows[['Separations', 'Transfers Out']] *= -1
+    flows = flows.reset_index().melt('Division Name', var_name='Change', value_name='Employees')
+    st.altair_chart(
+        alt.Chart(flows).mark_bar().encode(
+            x=alt.X('Employees:Q', axis=alt.Axis(format=',d')),
+            y=alt.Y('Division Name:N', sort=None, axis=alt.Axis(title=None, labelLimit=300)),
+            color=alt.Color(
+                'Change:N',
+                scale=alt.Scale(domain=['Hires', 'Transfers In', 'Separations', 'Transfers Out'], range=[TEAL, LIGHT_TEAL, '#5F6368', '#BDC1C6']),
+            ),
+            tooltip=[
+                alt.Tooltip('Division Name:N', title='Division'),
+                alt.Tooltip('Change:N'),
+                alt.Tooltip('Employees:Q', format=',d'),
+            ],
+        ),
+        width="stretch",
+    )
+
+with chart_cols[1]:
+    st.altair_chart(
+        alt.Chart(diff.divisions.reset_index()).mark_bar(color=TEAL).encode(
+            x=alt.X('Payroll Change:Q', axis=alt.Axis(format='$,s', title='Change in Total Salaries')),
+            y=alt.Y('Division Name:N', sort=None, axis=alt.Axis(title=None, labelLimit=300)),
+            tooltip=[
+                alt.Tooltip('Division Name:N', title='Division'),
+                alt.Tooltip('Payroll Before:Q', format='$,.0f', title=f'Salaries {before}'),
+                alt.Tooltip('Payroll After:Q', format='$,.0f', title=f'Salaries {after}'),
+                alt.Tooltip('Median Raise:Q', format='$,.0f'),
+            ],
+        ),
+        width="stretch",
+    )
+
+st.dataframe(
+    diff.divisions,
+    width="stretch",
+    column_config={
+        "Payroll Before": st.column_config.NumberColumn(f"Salaries {before}", format="dollar"),
+        "Payroll After": st.column_config.NumberColumn(f"Salaries {after}", format="dollar"),
+        "Payroll Change": st.column_config.NumberColumn("Salaries Change", format="dollar"),
+        "Median Raise": st.column_config.NumberColumn(format="dollar"),
+        "Median Raise %": st.column_config.NumberColumn(format="percent"),
+    },
+)
+
+st.space()
+
+st.markdown("### People")
+
+division = st.selectbox("Division", diff.divisions.index)
+people = diff.people
+# Everyone who was or is in the division
+people = people[(people['Division Before'] == division) | (people['Division After'] == division)]
+
+changes = {
+    'Hires': (people['Status'] == HIRED, ['Person Name', 'Job Title After', 'Annual Salary After', 'Hourly Rate After']),
+    'Separations': (people['Status'] == SEPARATED, ['Person Name', 'Job Title Before', 'Annual Salary Before', 'Hourly Rate Before']),
+    'Transfers': (people['Status'] == TRANSFERRED, ['Person Name', 'Division Before', 'Division After', 'Job Title After']),
+    'Title Changes': (
+        people['Job Title Before'].notna() & people['Job Title After'].notna()
+        & (people['Job Title Before'] != people['Job Title After']),
+        ['Person Name', 'Job Title Before', 'Job Title After', 'Annual Salary Before', 'Annual Salary After'],
+    ),
+    'Largest Raises': (
+        people['Raise'].notna() & (people['Division After'] == division),
+        ['Person Name', 'Job Title After', 'Annual Salary Before', 'Annual Salary After', 'Raise', 'Raise %'],
+    ),
+}
+money = {
+    column: st.column_config.NumberColumn(format="dollar")
+    for column in ['Annual Salary Before', 'Annual Salary After', 'Hourly Rate Before', 'Hourly Rate After', 'Raise']
+}
+
+tabs = st.tabs([f"{label} ({mask.sum():,})" for label, (mask, _) in changes.items()])
+for tab, (label, (mask, shown)) in zip(tabs, changes.items()):
+    with tab:
+        rows = people.loc[mask, shown]
+        if label == 'Largest Raises':
+            rows = rows.sort_values('Raise', ascending=False).head(50)
+        st.dataframe(
+            rows,
+            hide_index=True,
+            width="stretch",
+            column_config={**money, "Raise %": st.column_config.NumberColumn(format="percent")},
+        )
@@ -0,0 +1,164 @@
+# ====================
+# Precomputed aggregate cube
+# ====================
+import numpy as np
+import pandas as pd
+from shared.taxonomy import ROW_KEYS
+
+
+# Dimensions of the cube, finest grain is one cell per job title within them
+CUBE_DIMENSIONS = ['Division Category', 'Division Name', 'Division Group', 'Employment Type']
+CELL_KEYS = CUBE_DIMENSIONS + ['Job Title']
+
+# Money measures: cell column prefix -> source column (integer cents)
+MEASURES = {
+    'Salary': 'Annual Salary',
+    'Rate': 'Hourly/Per Event Rate',
+}
+
+EMPLOYMENT_TYPES = ['Full-time', 'Part-time']
+
+
+def to_dollars(cents):
+    """
+    Convert integer cents from a money column (or an aggregate of one) to dollars.
+
+    :param cents: Scalar or Series of cents; missing values become NaN
+    """
+    if isinstance(cents, pd.Series):
+        return cents.astype('float64') / 100
+    if pd.isna(cents):
+        return float('nan')
+    return cents / 100
+
+
+def employment_type_frame(counts: pd.Series) -> pd.DataFrame:
+    """
+    Full-time vs part-time employee counts and shares, as used by the pie charts.
+
+    :param counts: Employee counts indexed by Employment Type
+    """
+    counts = counts.reindex(EMPLOYMENT_TYPES, fill_value=0)
+    return pd.DataFrame({
+        "Employment Type": EMPLOYMENT_TYPES,
+        "Value": (counts / counts.sum()).to_numpy(),
+        "Count": counts.to_numpy(),
+    })
+
+
+class AggregateCube:
+    """
+    Payroll statistics for every Division Category x Division Name x
+    Division Group x Employment Type x Job Title cell, built in one groupby.
+
+    Every coarser view (a category, a division, a sub-group, an employment
+    type, or the whole city) is rolled up from the cells, which are far fewer
+    than employees, so lookups don't depend on the size of the dataset.
+
+    :param df: Compact payroll DataFrame with a positional (Range) index
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        # Missing pay sorts below any real amount, so idxmax finds the first
+        # row with the highest pay in each cell
+        filled = {
+            f'{prefix} Filled': df[column].fillna(-1)
+            for prefix, column in MEASURES.items()
+        }
+        aggregations = {'Employees': ('Job Title', 'size')}
+        for prefix, column in MEASURES.items():
+            aggregations.update({
+                f'{prefix} Sum': (column, 'sum'),
+                f'{prefix} Count': (column, 'count'),
+                f'{prefix} Min': (column, 'min'),
+                f'{prefix} Max': (column, 'max'),
+                f'{prefix} Max Row': (f'{prefix} Filled', 'idxmax'),
+            })
+
+        self.cells = (
+            df.assign(**filled)
+            .groupby(CELL_KEYS, observed=True, dropna=False)
+            .agg(**aggregations)
+            .reset_index()
+        )
+
+    def select(self, **filters) -> pd.DataFrame:
+        """
+        Cells matching every filter given.
+
+        :param filters: Any of category, group, division, employment_type
+        """
+        cells = self.cells
+        for key, value in filters.items():
+            cells = cells[cells[ROW_KEYS[key]] == value]
+        return cells
+
+    def rollup(self, by=(), **filters) -> pd.DataFrame:
+        """
+        Statistics for each combination of the given dimensions, in dollars.
+
+        Columns: Employees, Job Titles, Annual Salary (total), Average Salary,
+        Min Salary, Max Salary, Top Paying Job, Average Hourly Rate,
+        Min Hourly Rate, Max Hourly Rate, Top Paying Part-Time Job.
+
+        :param by: Dimensions to group by; empty for a single total row
+        :param filters: Any of category, group, division, employment_type
+        """
+        by = list(by)
+        cells = self.select(**filters)
+        keys = by or np.zeros(len(cells), dtype=int)
+        grouped = cells.groupby(keys, observed=True)
+
+        result = pd.DataFrame({
+            'Employees': grouped['Employees'].sum(),
+            'Job Titles': grouped['Job Title'].nunique(),
+            'Annual Salary': to_dollars(grouped['Salary Sum'].sum()),
+            'Average Salary': to_dollars(grouped['Salary Sum'].sum() / grouped['Salary Count'].sum()),
+            'Min Salary': to_dollars(grouped['Salary Min'].min()),
+            'Max Salary': to_dollars(grouped['Salary Max'].max()),
+            'Top Paying Job': self._top_titles(cells, by, 'Salary'),
+            'Average Hourly Rate': to_dollars(grouped['Rate Sum'].sum() / grouped['Rate Count'].sum()),
+            'Min Hourly Rate': to_dollars(grouped['Rate Min'].min()),
+            'Max Hourly Rate': to_dollars(grouped['Rate Max'].max()),
+            'Top Paying Part-Time Job': self._top_titles(cells, by, 'Rate'),
+        })
+        if not by:
+            result.index = pd.RangeIndex(len(result))
+        return result
+
+    def total(self, **filters) -> pd.Series:
+        """
+        Statistics for all cells matching the filters, as a single row.
+
+        :param filters: Any of category, group, division, employment_type
+        """
+        return self.rollup(**filters).iloc[0]
+
+    def employment_type_totals(self, **filters) -> pd.DataFrame:
+        """
+        Full-time vs part-time employee counts and shares, as used by the pie charts.
+
+        :param filters: Any of category, group, division, employment_type
+        """
+        return employment_type_frame(
+            self.select(**filters)
+            .groupby('Employment Type', observed=True)['Employees']
+            .sum()
+        )
+
+    @staticmethod
+    def _top_titles(cells: pd.DataFrame, by: list, prefix: str) -> pd.Series:
+        # Highest pay first, ties broken by the earliest row like DataFrame.idxmax
+        ranked = cells.sort_values(
+            [f'{prefix} Max', f'{prefix} Max Row'],
+            ascending=[False, True],
+            na_position='last'
+        )
+        if by:
+            ranked = ranked.drop_duplicates(subset=by)
+            # Keep the key columns, Job Title being one of them in a per-title rollup
+            titles = ranked.set_index(by, drop=False)
+        else:
+            titles = ranked.head(1).set_index(np.zeros(min(len(ranked), 1), dtype=int))
+        # No title where nobody in the group is paid this way
+        return titles['Job Title'].astype(object).where(titles[f'{prefix} Max'].notna())
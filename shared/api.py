@@ -0,0 +1,133 @@
+# ====================
+# JSON aggregates API
+# ====================
+# Read-only JSON for dashboards that would otherwise scrape the pages: city,
+# category, division and sub-group totals, and the statistics of each
+# division section. Every document is serialized once per dataset version,
+# and its ETag is derived from the version alone, so a request is a dict
+# lookup: a poll carrying the ETag it was last sent gets a 304, anything
+# else the stored bytes, and neither touches pandas.
+import json
+import sys
+import time
+import numpy as np
+import pandas as pd
+import streamlit as st
+import tornado.web
+from shared.data_loader import get_dataset
+from shared.dataset import SalaryDataset
+from shared.processing import get_all_division_details
+
+
+# Bumped when the shape of the documents changes, so clients refetch them
+API_FORMAT_VERSION = 1
+
+# Documents listed at /api, by path, with what they hold
+API_DOCUMENTS = {
+    '/api/city': 'Totals for the whole city',
+    '/api/categories': 'Totals for each Division Category',
+    '/api/divisions': 'Totals for each division',
+    '/api/groups': 'Totals for each sub-group of divisions shown on the category pages',
+    '/api/divisions/{name}': 'Statistics of one division or sub-group, as shown on its category page',
+}
+
+# Columns the rollups are broken down by, for each list document
+ROLLUP_DOCUMENTS = {
+    '/api/categories': 'Division Category',
+    '/api/divisions': 'Division Name',
+    '/api/groups': 'Division Group',
+}
+
+
+def _field(column: str) -> str:
+    # 'Top Paying Part-Time Job' -> 'top_paying_part_time_job'
+    return '_'.join(''.join(c if c.isalnum() else ' ' for c in column.lower()).split())
+
+def _value(value):
+    # numpy scalars as Python ones, missing values as null
+    if pd.isna(value):
+        return None
+    return value.item() if isinstance(value, np.generic) else value
+
+def _records(df: pd.DataFrame) -> list[dict]:
+    return [
+        {_field(column): _value(value) for column, value in row.items()}
+        for row in df.to_dict('records')
+    ]
+
+def _document(version: str, data) -> bytes:
+    return json.dumps({'version': version, 'data': data}, separators=(',', ':')).encode()
+
+
+def api_etag(version: str) -> str:
+    """
+    Strong ETag of every API document of a dataset version.
+
+    :param version: Dataset version
+    """
+    return f'"{version}.api{API_FORMAT_VERSION}"'
+
+@st.cache_resource(show_spinner=False)
+def build_api_documents(_dataset: SalaryDataset, version: str) -> dict[str, bytes]:
+    """
+    Serialized body of every API document for one dataset version, by path.
+
+    :param _dataset: Shared dataset (not hashed)
+    :param version: Dataset version the documents are cached against
+    """
+    cube = _dataset.cube
+    documents = {
+        '/api': _document(version, API_DOCUMENTS),
+        '/api/city': _document(version, _records(cube.rollup())[0]),
+    }
+    for path, column in ROLLUP_DOCUMENTS.items():
+        employment_types = cube.rollup([column, 'Employment Type'])['Employees'].unstack(fill_value=0)
+        totals = cube.rollup([column]).assign(**{
+            f'{employment_type} Employees': employment_types[employment_type]
+            for employment_type in employment_types.columns
+        })
+        documents[path] = _document(version, _records(totals.rename_axis('Name').reset_index()))
+
+    for name, details in get_all_division_details(_dataset, version).items():
+        fields = {field: _value(value) for field, value in details._asdict().items() if field != 'employment_type_totals'}
+        fields['employment_type_totals'] = _records(details.employment_type_totals)
+        documents[f'/api/divisions/{name}'] = _document(version, {'name': name, **fields})
+    return documents
+
+
+class ApiHandler(tornado.web.RequestHandler):
+    """Serves the API documents, e.g. /api/divisions/Police%20Services"""
+
+    def compute_etag(self) -> str:
+        return api_etag(get_dataset().version)
+
+    def get(self, path: str):
+        dataset = get_dataset()
+        body = build_api_documents(dataset, dataset.version).get(path.rstrip('/'))
+        if body is None:
+            raise tornado.web.HTTPError(404)
+
+        self.set_header('Access-Control-Allow-Origin', '*')
+        # Clients may keep documents, but must check they're still current
+        self.set_header('Cache-Control', 'no-cache')
+        self.set_etag_header()
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+        self.set_header('Content-Type', 'application/json')
+        self.write(body)
+
+    def write_error(self, status_code: int, **kwargs):
+        self.set_header('Content-Type', 'application/json')
+        self.finish(json.dumps({'error': self._reason}))
+
+
+if __name__ == '__main__':
+    dataset = get_dataset()
+
+    start = time.perf_counter()
+    documents = build_api_documents(dataset, dataset.version)
+    print(f"Serialized {len(documents)} documents ({sum(map(len, documents.values())) / 1e3:.1f} kB) in {time.perf_counter() - start:.3f}s")
+    for path in sys.argv[1:] or ['/api/categories']:
+        print(path, api_etag(dataset.version))
+        print(json.dumps(json.loads(documents[path]), indent=2))
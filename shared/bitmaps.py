@@ -0,0 +1,81 @@
+# ====================
+# Bitmap filter index
+# ====================
+# Every value of a filterable column has a precomputed bitmap: one bit per
+# row, packed eight rows to a byte. A filter is then an OR of the bitmaps of
+# the values picked in each column and an AND across columns, over arrays
+# an eighth the size of a boolean mask, instead of one pass over the frame
+# per condition. Columns with many values (Job Title) keep each value's row
+# positions instead, since a bitmap per title would cost more than the frame.
+import numpy as np
+import pandas as pd
+
+
+# Columns with at most this many values get one bitmap per value
+MAX_BITMAPS_PER_COLUMN = 64
+
+
+def _pack(mask: np.ndarray) -> np.ndarray:
+    return np.packbits(mask, bitorder='little')
+
+
+class BitmapIndex:
+    """
+    Value bitmaps of some columns of a frame, for filtering with bitwise
+    operations. Bitmaps are packed row masks (numpy uint8 arrays).
+
+    :param df: Frame to index, rows or pre-aggregated cells
+    :param columns: Columns to index: categorical, text or integer
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: list[str]):
+        self.row_count = len(df)
+        self.labels = {}
+        self._bitmaps = {}
+        self._positions = {}
+        for column in columns:
+            codes, uniques = pd.factorize(df[column], sort=True)
+            self.labels[column] = {label: i for i, label in enumerate(uniques)}
+            if len(uniques) <= MAX_BITMAPS_PER_COLUMN:
+                self._bitmaps[column] = np.stack([_pack(codes == i) for i in range(len(uniques))])
+            else:
+                # Row positions grouped by value: positions[offsets[i]:offsets[i + 1]]
+                order = np.argsort(codes, kind='stable').astype(np.int32)
+                offsets = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+                self._positions[column] = (offsets, order)
+
+    def all_rows(self) -> np.ndarray:
+        """Bitmap with every row set"""
+        return _pack(np.ones(self.row_count, dtype=bool))
+
+    def any_of(self, column: str, values) -> np.ndarray:
+        """
+        Bitmap of rows whose column holds any of the values.
+
+        :param column: Indexed column
+        :param values: Values to match; unknown values match nothing
+        """
+        ids = [self.labels[column][value] for value in values if value in self.labels[column]]
+        if column in self._bitmaps:
+            if not ids:
+                return np.zeros(self._bitmaps[column].shape[1], dtype=np.uint8)
+            return np.bitwise_or.reduce(self._bitmaps[column][ids], axis=0)
+
+        offsets, positions = self._positions[column]
+        mask = np.zeros(self.row_count, dtype=bool)
+        for i in ids:
+            mask[positions[offsets[i]:offsets[i + 1]]] = True
+        return _pack(mask)
+
+    def mask(self, bitmap: np.ndarray) -> np.ndarray:
+        """Boolean row mask of a bitmap"""
+        return np.unpackbits(bitmap, count=self.row_count, bitorder='little').view(bool)
+
+    def positions(self, bitmap: np.ndarray) -> np.ndarray:
+        """Row positions set in a bitmap, in row order"""
+        return np.flatnonzero(self.mask(bitmap))
+
+    @staticmethod
+    def count(bitmap: np.ndarray) -> int:
+        """Number of rows set in a bitmap"""
+        return int(np.bitwise_count(bitmap).sum(dtype=np.int64))
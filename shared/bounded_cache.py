@@ -0,0 +1,89 @@
+# ====================
+# Byte-bounded LRU cache
+# ====================
+# The process-wide caches (query results, chart specs) hold values computed
+# from one dataset version and shared by every session. Each is bounded by
+# the memory its values take, evicting the least recently used first, and
+# drops everything computed from an older version once a newer one is seen.
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+
+class BoundedCache:
+    """
+    Process-wide LRU store bounded by bytes, with hit, miss, eviction and
+    time counters. Keys are tuples starting with the dataset version.
+
+    :param max_bytes: Memory the cached values may take
+    :param size: Function returning the bytes a value takes
+    """
+
+    def __init__(self, max_bytes: int, size: Callable[[object], int]):
+        self.max_bytes = max_bytes
+        self._size = size
+        self._entries = OrderedDict()   # key -> (value, size, compute seconds), least recently used first
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.compute_seconds = 0.0
+        self.saved_seconds = 0.0
+
+    def lookup(self, key: tuple, compute: Callable[[], object]):
+        """
+        Value of a key, computed with compute() when it isn't cached. Values
+        are shared between sessions and must not be modified.
+
+        :param key: Dataset version the value is computed from, then anything identifying it
+        :param compute: Function returning the value
+        """
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                # Computing it again would have cost about as long as the first time
+                self.saved_seconds += cached[2]
+                return cached[0]
+
+        start = time.perf_counter()
+        value = compute()
+        seconds = time.perf_counter() - start
+        size = self._size(value)
+
+        with self._lock:
+            self.misses += 1
+            self.compute_seconds += seconds
+            if key in self._entries or size > self.max_bytes:
+                # Another session stored it meanwhile, or it would evict everything
+                return value
+            # Values for older data versions are never asked for again
+            version = key[0]
+            for stale in [k for k in self._entries if k[0] != version]:
+                self.bytes -= self._entries.pop(stale)[1]
+            self._entries[key] = (value, size, seconds)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+        return value
+
+    def stats(self) -> dict:
+        """Counters since the process started"""
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                'Entries': len(self._entries),
+                'Bytes': self.bytes,
+                'Max bytes': self.max_bytes,
+                'Hits': self.hits,
+                'Misses': self.misses,
+                'Evictions': self.evictions,
+                'Hit rate': self.hits / requests if requests else 0.0,
+                'Compute seconds': self.compute_seconds,
+                'Saved seconds': self.saved_seconds,
+            }
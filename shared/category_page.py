@@ -0,0 +1,272 @@
+# ====================
+# Division Category page renderer
+# ====================
+# Every category page has the same layout: salaries by division, the
+# category's employment breakdown, then one section per division. Pages
+# describe their content with a CategoryPage config and render it here.
+from typing import NamedTuple
+import streamlit as st
+import altair as alt
+from shared.chart_cache import cached_altair_chart
+from shared.data_server import STATIC_EXPORT, render_export_popover
+from shared.explorer import ExplorerFilter
+from shared.page_models import get_category_page_model
+from shared.taxonomy import GROUP_DIVISIONS
+from shared.utilities import (
+    employment_type_table,
+    employment_type_pie_chart,
+    salary_share_table,
+    format_thousands,
+)
+
+
+class DivisionSection(NamedTuple):
+    """
+    One division (or sub-group) section of a category page.
+
+    Text may reference DivisionDetails fields, e.g. {total_employees:,}.
+    """
+    key: str                        # Division Name or Division Group to show
+    title: str                      # Section heading
+    salary_text: list[str]          # Paragraphs describing the salary range
+    breakdown_text: str             # Paragraph describing the workforce
+    job_icon: str                   # Material icon for the top full-time job
+    part_time_job_icon: str         # Material icon for the top part-time job
+    label: str = None               # Short name for tables and sub-headings, defaults to title
+
+
+class CategoryPage(NamedTuple):
+    """Content and colors of one Division Category page"""
+    category: str
+    subtitle: str
+    icon: str                       # Material icon for the workforce salaries metric
+    salary_text: str
+    breakdown_text: str
+    color: str
+    light_color: str
+    sections: list[DivisionSection]
+    by: str = 'Division Name'       # Column the salaries chart breaks down by
+    layout: str = 'stacked'         # Division sections: 'stacked', 'tabs' or 'expanders'
+
+
+def render_category_page(page: CategoryPage):
+    """
+    Render a Division Category page.
+
+    :param page: Page content and colors
+    """
+    model = get_category_page_model(page.category, page.by)
+
+    st.space()
+
+    with st.spinner('Loading data and calculations...'):
+        st.title(page.category)
+        st.markdown(f'<h3 class="pt-0">{page.subtitle}</h3>', unsafe_allow_html=True)
+
+        st.space()
+
+        st.markdown('<h2 class="pt-0">Salaries by Division</h2>', unsafe_allow_html=True)
+
+        salary_cols = st.columns(2, gap="xlarge")
+
+        with salary_cols[0]:
+            st.text(page.salary_text)
+            # Largest share first
+            shares = {
+                section.label or section.title: model.salary_shares[section.key]
+                for section in page.sections
+            }
+            st.markdown(
+                salary_share_table(dict(sorted(shares.items(), key=lambda item: -item[1])), page.category),
+                unsafe_allow_html=True
+            )
+
+            st.space()
+
+            st.metric(
+                label=f":material/{page.icon}: {page.category} Workforce Salaries",
+                value=f"${model.total_salary / 1e6:,.1f}M",
+                delta=None,
+            )
+
+        with salary_cols[1]:
+            def build_chart():
+                return alt.Chart(model.division_salary_totals).mark_bar(color=page.color).encode(
+                    x=alt.X(
+                        page.by,
+                        axis=alt.Axis(labelAngle=0),  # Rotate labels
+                        sort=None,
+                        title=None,
+                    ),
+                    y=alt.Y(
+                        'Annual Salary',
+                        axis=alt.Axis(
+                            title='Annual Salary Total',
+                            format='$,s'  # Format numbers
+                        ),
+                    ),
+                    tooltip=[
+                        alt.Tooltip(f"{page.by}:N", title="Division"),
+                        alt.Tooltip("Annual Salary:Q", format="$,.2f", title="Salaries")
+                    ]
+                )
+
+            cached_altair_chart(
+                f"{page.category}/division-salaries",
+                build_chart,
+                colors=(page.color,),
+            )
+
+        st.space()
+
+        st.markdown('### Employment Breakdown')
+
+        salary_row2_cols = st.columns(2, gap="xlarge")
+
+        with salary_row2_cols[0]:
+            st.text(page.breakdown_text)
+
+            st.markdown(
+                employment_type_table(
+                    model.total_full_time_employees,
+                    model.total_part_time_employees,
+                    model.total_employees
+                ),
+                unsafe_allow_html=True
+            )
+
+        with salary_row2_cols[1]:
+            cached_altair_chart(
+                f"{page.category}/employment-type",
+                lambda: employment_type_pie_chart(model.employment_type_totals, page.color, page.light_color),
+                colors=(page.color, page.light_color),
+                width="stretch"
+            )
+
+        if page.layout == 'stacked' or st.session_state.get(STATIC_EXPORT):
+            for section in page.sections:
+                st.space()
+                st.divider()
+                st.space()
+
+                render_division_section(page, section)
+        else:
+            st.space()
+            st.divider()
+            st.space()
+
+            render_lazy_division_sections(page)
+
+@st.fragment
+def render_division_section(page: CategoryPage, section: DivisionSection):
+    """
+    Render one division's section. Runs as a fragment, so interacting with
+    widgets inside a section reruns only that section.
+
+    :param page: Page the section belongs to
+    :param section: Division to render
+    """
+    _division_section(page, section)
+
+@st.fragment
+def render_lazy_division_sections(page: CategoryPage):
+    """
+    Render division sections on demand: only the selected tab, or only the
+    expanded sections, are built and sent to the browser. Opening one reruns
+    just this fragment.
+
+    :param page: Page whose sections to render
+    """
+    labels = [section.label or section.title for section in page.sections]
+
+    if page.layout == 'tabs':
+        selected = st.segmented_control(
+            "Division",
+            labels,
+            default=labels[0],
+            key=f"{page.category} division tab",
+            label_visibility="collapsed",
+        )
+        st.space()
+        for label, section in zip(labels, page.sections):
+            if label == selected:
+                _division_section(page, section)
+
+    elif page.layout == 'expanders':
+        for label, section in zip(labels, page.sections):
+            with st.container(border=True):
+                if st.toggle(label, key=f"{page.category} {label} expanded"):
+                    _division_section(page, section)
+
+    else:
+        raise ValueError(f"Unknown division section layout: {page.layout}")
+
+def _division_section(page: CategoryPage, section: DivisionSection):
+    details = get_category_page_model(page.category, page.by).divisions[section.key]
+    label = section.label or section.title
+
+    st.markdown(f'<h2 class="pt-0">{section.title}</h2>', unsafe_allow_html=True)
+
+    salary_cols = st.columns(2, gap="xlarge")
+
+    with salary_cols[0]:
+        for paragraph in section.salary_text:
+            st.text(paragraph)
+
+    with salary_cols[1]:
+        with st.container(horizontal=True):
+            st.metric(
+                label=f":material/{section.job_icon}: {details.top_paying_job}",
+                value=format_thousands(details.max_salary),
+                delta="Top Full-Time Salary",
+            )
+            st.metric(
+                label=f":material/{section.part_time_job_icon}: {details.top_paying_part_time_job}",
+                value=f"${details.max_hourly_rate:.0f}/hr",
+                delta="Top Part-Time Rate",
+            )
+        st.space()
+        with st.container(horizontal=True):
+            st.metric(
+                label="Average full-time salary",
+                value=f"${details.average_salary/1e3:,.1f}k",
+                delta=None,
+            )
+            st.metric(
+                label="Average part-time rate ",
+                value=f"${details.average_hourly_rate:.0f}/hr",
+                delta=None,
+            )
+
+    st.space()
+
+    st.markdown(f'### {label} Employment Breakdown')
+
+    row2_cols = st.columns(2, gap="xlarge")
+
+    with row2_cols[0]:
+        st.text(section.breakdown_text.format(**details._asdict()))
+        st.markdown(
+            employment_type_table(
+                details.total_full_time_employees,
+                details.total_part_time_employees,
+                details.total_employees
+            ),
+            unsafe_allow_html=True
+        )
+        # A sub-group section covers each of its divisions, a division section itself
+        divisions = GROUP_DIVISIONS.get(section.key, [section.key])
+        render_export_popover(
+            ExplorerFilter(divisions=tuple(divisions)),
+            label,
+            key=f"{page.category} {section.key} export",
+            employment_types=['Full-time', 'Part-time'],
+        )
+
+    with row2_cols[1]:
+        cached_altair_chart(
+            f"{page.category}/{section.key}/employment-type",
+            lambda: employment_type_pie_chart(details.employment_type_totals, page.color, page.light_color),
+            colors=(page.color, page.light_color),
+            width="stretch"
+        )
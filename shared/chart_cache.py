@@ -0,0 +1,73 @@
+# ====================
+# Vega-Lite chart spec cache
+# ====================
+# Building an Altair chart and converting it to a Vega-Lite spec costs more
+# than rendering it, and page charts only change with the data. Specs are
+# built once per (dataset version, chart id, colors) and reused by every
+# rerun and session, up to a memory budget: pages with a chart per job title
+# can ask for thousands, so the least recently used are evicted first.
+import json
+from typing import Callable
+import altair as alt
+import streamlit as st
+from shared.bounded_cache import BoundedCache
+from shared.data_loader import get_dataset
+
+
+# Memory the cached specs may take, in bytes of their JSON
+CHART_SPEC_CACHE_BYTES = 16 * 1024 * 1024
+
+
+def vega_lite_spec(chart: alt.Chart) -> dict:
+    """
+    Vega-Lite spec of an Altair chart, with its data inlined as datasets.
+
+    :param chart: Altair chart
+    """
+    spec = chart.to_dict()
+    # to_dict() merges in Altair's active theme, whose fixed 300px view is
+    # left out like st.altair_chart does, so charts size to their container
+    if spec.get('config') == alt.theme.get()().get('config'):
+        del spec['config']
+    return spec
+
+
+class ChartSpecCache(BoundedCache):
+    """
+    Process-wide LRU store of Vega-Lite specs bounded by the bytes of their
+    JSON.
+
+    :param max_bytes: Memory the cached specs may take
+    """
+
+    def __init__(self, max_bytes: int = CHART_SPEC_CACHE_BYTES):
+        super().__init__(max_bytes, lambda spec: len(json.dumps(spec)))
+
+    def get(self, version: str, chart_id: str, colors: tuple, build: Callable[[], alt.Chart]) -> dict:
+        """
+        Spec for a chart, built with build() the first time it is asked for.
+
+        :param version: Dataset version the chart's data comes from
+        :param chart_id: Identifier of the chart, unique across pages
+        :param colors: Colors the chart is drawn with
+        :param build: Function returning the Altair chart
+        """
+        return self.lookup((version, chart_id, tuple(colors)), lambda: vega_lite_spec(build()))
+
+
+@st.cache_resource
+def get_chart_spec_cache() -> ChartSpecCache:
+    """Chart spec cache shared by all sessions"""
+    return ChartSpecCache()
+
+def cached_altair_chart(chart_id: str, build: Callable[[], alt.Chart], colors=(), **kwargs):
+    """
+    Render an Altair chart from the spec cache, like st.altair_chart.
+
+    :param chart_id: Identifier of the chart, unique across pages
+    :param build: Function returning the Altair chart, called only on a cache miss
+    :param colors: Colors the chart is drawn with
+    :param kwargs: Passed on to st.vega_lite_chart (width, height, ...)
+    """
+    spec = get_chart_spec_cache().get(get_dataset().version, chart_id, colors, build)
+    return st.vega_lite_chart(spec, **kwargs)
@@ -0,0 +1,90 @@
+# ====================
+# Server-side chart data
+# ====================
+# Charts are sent data that is already aggregated, binned, sorted and cut to
+# the marks they draw, so Vega in the browser only lays it out. The payload
+# then grows with the number of bars or slices, not with the number of
+# employees, and row-level charts stay clear of Altair's 5,000 row limit.
+import numpy as np
+import pandas as pd
+
+
+def aggregate(df: pd.DataFrame, by: list[str], measure: str = None, op: str = 'sum', name: str = 'Count') -> pd.DataFrame:
+    """
+    One row per group, like an Altair aggregate transform.
+
+    :param df: Rows (or pre-aggregated cells) to reduce
+    :param by: Columns to group by
+    :param measure: Column to reduce, or None to count rows
+    :param op: Pandas reduction applied to the measure (sum, mean, min, max, ...)
+    :param name: Name of the reduced column
+    """
+    grouped = df.groupby(by, observed=True, sort=False)
+    values = grouped.size() if measure is None else grouped[measure].agg(op)
+    return values.rename(name).reset_index()
+
+def stacked_bars(df: pd.DataFrame, bar: str, segment: str, measure: str = 'Count') -> pd.DataFrame:
+    """
+    Order stacked bar data by bar total (largest first), then by segment.
+
+    Encode the result with sort=None and the measure un-aggregated; this
+    replaces sum() encodings and EncodingSortField(op='sum') in the browser.
+
+    :param df: One row per bar and segment
+    :param bar: Column each bar is drawn for
+    :param segment: Column the bars are stacked by
+    :param measure: Column holding each segment's size
+    """
+    totals = df.groupby(bar, observed=True)[measure].transform('sum')
+    return (
+        df.assign(_total=totals)
+        .sort_values(['_total', bar, segment], ascending=[False, True, True], kind='stable')
+        .drop(columns='_total')
+        .reset_index(drop=True)
+    )
+
+def top_n(df: pd.DataFrame, by: str, measure: str, n: int, other: str = 'Other') -> pd.DataFrame:
+    """
+    The n largest rows by a measure, largest first, with the rest summed
+    into one trailing row.
+
+    :param df: One row per value of by; every other column is summed into the remainder
+    :param by: Column labelling each row
+    :param measure: Column to rank by
+    :param n: Number of rows to keep
+    :param other: Label of the row holding the remainder
+    """
+    ranked = df.sort_values(measure, ascending=False, kind='stable')
+    top, rest = ranked.iloc[:n], ranked.iloc[n:]
+    if rest.empty:
+        return top.reset_index(drop=True)
+    remainder = pd.DataFrame({column: [other if column == by else rest[column].sum()] for column in df.columns})
+    return pd.concat([top.astype({by: 'object'}), remainder], ignore_index=True)
+
+def histogram(bins, step: float, counts=None, scale: float = 1, name: str = 'Count') -> pd.DataFrame:
+    """
+    Fixed-width histogram bars [Bin Start, Bin End), one row per non-empty
+    bin in bin order. Encode with x='Bin Start', x2='Bin End' and no bin
+    transform.
+
+    Values are binned by whoever knows them best (from raw values with
+    np.floor(values / step), from sorted values, from pre-binned cells):
+    bin i covers [i * step, (i + 1) * step).
+
+    :param bins: Bin number of each value, or of each count
+    :param step: Bin width
+    :param counts: Number of values each bin number stands for, one each if None
+    :param scale: Divisor of the bin edges, e.g. 100 for edges in cents shown in dollars
+    :param name: Name of the count column
+    """
+    bins = np.asarray(bins, dtype=np.int64)
+    counts = np.ones(len(bins), dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+    numbers, positions = np.unique(bins, return_inverse=True)
+    totals = np.bincount(positions, weights=counts, minlength=len(numbers)).astype(np.int64)
+    non_empty = totals > 0
+    numbers = numbers[non_empty]
+    return pd.DataFrame({
+        'Bin Start': numbers * step / scale,
+        'Bin End': (numbers + 1) * step / scale,
+        name: totals[non_empty],
+    })
@@ -1,35 +1,92 @@
 # ====================
 # Efficient Data Loading with Caching
 # ====================
+# Every payroll file under data/ is one snapshot, named by its date (e.g.
+# "City of Memphis Employee Salaries 2025.csv"). Each is cleaned once into
+# its own columnar partition and loaded on its own, the first time a page
+# asks for it, so older years cost nothing until someone looks at them.
+import datetime
+import hashlib
+import os
+import re
+from typing import NamedTuple
 import streamlit as st
 import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+from shared.aggregates import to_dollars
+from shared.dataset import CLUSTER_KEYS, SalaryDataset
+from shared.job_titles import normalize_job_titles
+from shared.taxonomy import DIVISIONS, add_division_columns
 
 
-def get_city_division_category(row):
-    division = row['Division Name']
-    public_safety = ['Police Services', 'Fire Services']
-    public_works = ['Public Works', 'Solid Waste', 'City Engineering', 'General Services']
-    stronger_neighborhoods = ['Memphis Parks', 'Library Services', 'Housing and Community Development']
-    good_government = ['Executive', 'Finance and Administration', 'Human Resources', 'Information Technology', 'City Attorney', 'City Court Clerk', 'Judicial', 'Legislative']
-
-    if division in public_safety:
-        return 'Public Safety'
-    elif division in public_works:
-        return 'Public Works'
-    elif division in stronger_neighborhoods:
-        return 'Stronger Neighborhoods'
-    elif division in good_government:
-        return 'Good Government'
-    else:
-        return
-
-@st.cache_data(ttl=3600, show_spinner="Loading salary data...")
-def load_salary_data() -> pd.DataFrame:
-    """Load salary data - cached globally"""
-    df = pd.read_csv('data/City of Memphis Employee Salaries 2025.csv')
-    
-    # Categorize city divisions/departments
-    df['Division Category'] = df.apply(get_city_division_category, axis=1)
+# Directory of the payroll files published by the City of Memphis
+PAYROLL_DIR = 'data'
+# Snapshot date in a payroll file name: a year, optionally with month and day
+SNAPSHOT_DATE = re.compile(r'(?<!\d)(\d{4})(?:-(\d{2}))?(?:-(\d{2}))?(?!\d)')
+# Directory holding the columnar partitions of the cleaned payroll data
+SNAPSHOT_DIR = 'data/.snapshots'
+# Bump whenever the cleaning below changes so existing snapshots are rebuilt
+SNAPSHOT_FORMAT_VERSION = 5
+
+# Money columns, stored as nullable integer cents (missing where not applicable)
+MONEY_COLUMNS = ['Annual Salary', 'Hourly/Per Event Rate']
+# Low-cardinality text columns, stored dictionary-encoded
+CATEGORICAL_COLUMNS = ['Division Name', 'Job Title', 'Employment Type']
+# Keep plain Arrow strings Arrow-backed when reading snapshots
+SNAPSHOT_TYPES = {
+    pa.string(): pd.StringDtype('pyarrow'),
+    pa.large_string(): pd.StringDtype('pyarrow'),
+}
+
+
+class PayrollSnapshot(NamedTuple):
+    """One payroll file under PAYROLL_DIR"""
+    key: str                        # Date as written in the file name, e.g. '2025' or '2025-06-30'
+    date: datetime.date             # Missing month and day count as the first
+    path: str
+
+
+def discover_snapshots(directory: str = PAYROLL_DIR) -> dict[str, PayrollSnapshot]:
+    """
+    Payroll CSV files in a directory, by snapshot key, oldest first. Files
+    without a valid date in their name are not snapshots and are left out.
+
+    :param directory: Directory to look in
+    """
+    snapshots = []
+    for name in os.listdir(directory):
+        match = SNAPSHOT_DATE.search(name)
+        if not name.endswith('.csv') or name.startswith('.') or match is None:
+            continue
+        year, month, day = (int(part or 1) for part in match.groups())
+        try:
+            date = datetime.date(year, month, day)
+        except ValueError:
+            # Not a real date (e.g. "2025-13"), so not a snapshot either
+            continue
+        snapshots.append(PayrollSnapshot(match.group(0), date, os.path.join(directory, name)))
+
+    snapshots.sort(key=lambda snapshot: snapshot.date)
+    by_key = {snapshot.key: snapshot for snapshot in snapshots}
+    if len(by_key) < len(snapshots):
+        raise ValueError(f"More than one payroll file per snapshot date in {directory}")
+    return by_key
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def parse_salary_csv(path: str) -> pd.DataFrame:
+    """Parse and clean a payroll CSV - slow path used to build snapshots"""
+    df = pd.read_csv(path)
+
+    # Categorize city divisions/departments into categories and sub-groups
+    df = add_division_columns(df)
 
     # Rename Category column to Employment Type
     df = df.rename(columns={'Category': 'Employment Type'})
@@ -37,18 +94,160 @@ def load_salary_data() -> pd.DataFrame:
     df['Employment Type'] = df['Employment Type'].replace('Regular', 'Full-time')
     # Replace 'Part-Time' with 'Part-time' in the Employment Type column
     df['Employment Type'] = df['Employment Type'].replace('Part-Time', 'Part-time')
-    
+
+    # Spell out abbreviated job titles ("Police Svcs Director" -> "Police Services Director")
+    df['Job Title'] = normalize_job_titles(df['Job Title'])
+
+    return df
+
+def compact_salary_data(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert a cleaned payroll frame to its compact in-memory representation.
+
+    Text columns become categoricals (Division Name in taxonomy order), person
+    names become Arrow-backed strings, and money columns become nullable Int64
+    cents so sums stay exact. Use to_dollars() to get dollar amounts back.
+    Rows are sorted by CLUSTER_KEYS for SalaryDataset's slicing.
+
+    :param df: Cleaned DataFrame from parse_salary_csv
+    """
+    df = df.copy()
+
+    for column in CATEGORICAL_COLUMNS:
+        df[column] = df[column].astype('category')
+    # Keep divisions in taxonomy order, with any unknown divisions after them
+    divisions = DIVISIONS + sorted(set(df['Division Name'].cat.categories) - set(DIVISIONS))
+    df['Division Name'] = df['Division Name'].cat.set_categories(divisions)
+
+    df['Person Name'] = df['Person Name'].astype(pd.StringDtype('pyarrow'))
+
+    for column in MONEY_COLUMNS:
+        df[column] = (df[column] * 100).round().astype('Int64')
+
+    # Cluster rows so each division (and category, sub-group, division +
+    # employment type) is one contiguous block; stable to keep file order within
+    return df.sort_values(CLUSTER_KEYS, kind='stable', ignore_index=True)
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per-column deep memory usage of two versions of the payroll frame.
+
+    :param before: Frame as parsed from the CSV
+    :param after: Compact frame
+    """
+    report = pd.DataFrame({
+        'Before dtype': before.dtypes.astype(str),
+        'Before bytes': before.memory_usage(index=False, deep=True),
+        'After dtype': after.dtypes.astype(str),
+        'After bytes': after.memory_usage(index=False, deep=True),
+    })
+    report.loc['Total'] = ['', report['Before bytes'].sum(), '', report['After bytes'].sum()]
+    report['Reduction'] = 1 - report['After bytes'] / report['Before bytes']
+    return report
+
+def snapshot_path(snapshot: PayrollSnapshot, digest: str) -> str:
+    """Location of the columnar partition of a given payroll file version"""
+    return os.path.join(_partition_dir(snapshot), f"payroll.v{SNAPSHOT_FORMAT_VERSION}.{digest[:16]}.arrow")
+
+def _partition_dir(snapshot: PayrollSnapshot) -> str:
+    return os.path.join(SNAPSHOT_DIR, f"date={snapshot.key}")
+
+def load_snapshot(snapshot: PayrollSnapshot, digest: str = None) -> pd.DataFrame:
+    """
+    Load a cleaned payroll file, parsing the CSV only when its contents change.
+
+    The cleaned, compact frame is written once as an uncompressed Arrow (Feather v2)
+    file in the snapshot's partition, keyed by the CSV's content hash, and
+    memory-mapped on later loads.
+
+    :param snapshot: Payroll file to load
+    :param digest: Content hash of the CSV, if already known
+    """
+    partition = snapshot_path(snapshot, digest or file_digest(snapshot.path))
+
+    # Fast path: partition for this exact file contents already exists
+    if os.path.exists(partition):
+        return feather.read_table(partition, memory_map=True).to_pandas(types_mapper=SNAPSHOT_TYPES.get)
+
+    df = compact_salary_data(parse_salary_csv(snapshot.path))
+
+    try:
+        os.makedirs(_partition_dir(snapshot), exist_ok=True)
+        # Write to a temporary file first so readers never see a partial partition
+        tmp_path = f"{partition}.{os.getpid()}.tmp"
+        try:
+            feather.write_feather(df, tmp_path, compression='uncompressed')
+            os.replace(tmp_path, partition)
+        except BaseException:
+            # Don't leave a partial file behind in the partition
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        # Remove partitions left behind by older versions of the same file,
+        # and its snapshot from before partitions were kept by date
+        stale = [
+            os.path.join(_partition_dir(snapshot), name)
+            for name in os.listdir(_partition_dir(snapshot))
+            if name.endswith('.arrow') and name != os.path.basename(partition)
+        ]
+        stem = os.path.splitext(os.path.basename(snapshot.path))[0]
+        stale += [
+            os.path.join(SNAPSHOT_DIR, name)
+            for name in os.listdir(SNAPSHOT_DIR)
+            if name.startswith(f"{stem}.v") and name.endswith('.arrow')
+        ]
+        for path in stale:
+            os.remove(path)
+    except OSError:
+        # Read-only deployments still work, they just parse the CSV each time
+        pass
+
     return df
 
-@st.cache_data(ttl=3600)
-def get_department_summary(df: pd.DataFrame) -> pd.DataFrame:
-    """Compute department statistics - cached"""
-    return df.groupby('department').agg({
-        'salary': ['count', 'mean', 'median', 'min', 'max']
-    }).round(0)
-
-def initialize_data():
-    """Initialize data in session state"""
-    if 'salary_data' not in st.session_state:
-        st.session_state.salary_data = load_salary_data()
-    return st.session_state.salary_data
+@st.cache_resource(ttl=60, show_spinner=False)
+def get_snapshots() -> dict[str, PayrollSnapshot]:
+    """Payroll snapshots available, by key, oldest first; rescanned every minute"""
+    return discover_snapshots()
+
+@st.cache_resource(ttl=3600, show_spinner="Loading salary data...")
+def load_dataset(key: str) -> SalaryDataset:
+    """
+    Load one payroll snapshot - one read-only instance shared by all sessions.
+
+    :param key: Snapshot key, e.g. '2025'
+    """
+    snapshot = get_snapshots()[key]
+    digest = file_digest(snapshot.path)
+    return SalaryDataset(
+        load_snapshot(snapshot, digest),
+        # Two snapshots of identical files are still different datasets
+        version=f"{key}.v{SNAPSHOT_FORMAT_VERSION}.{digest[:16]}"
+    )
+
+def get_dataset(snapshot: str | None = None) -> SalaryDataset:
+    """
+    Salary data of a snapshot, loaded the first time it is asked for.
+
+    :param snapshot: Snapshot key, e.g. '2024'; defaults to the latest
+    """
+    snapshots = get_snapshots()
+    if not snapshots:
+        raise FileNotFoundError(
+            f"No payroll snapshot in {PAYROLL_DIR}: expected a CSV dated in its name, "
+            f"*_YYYY*.csv (e.g. 'City of Memphis Employee Salaries 2025.csv')"
+        )
+    if snapshot is None:
+        snapshot = next(reversed(snapshots))
+    elif snapshot not in snapshots:
+        raise KeyError(f"No payroll snapshot {snapshot!r} in {PAYROLL_DIR}")
+    return load_dataset(snapshot)
+
+
+if __name__ == '__main__':
+    # Print the snapshots found, and how much memory the compact representation saves
+    snapshots = discover_snapshots()
+    for snapshot in snapshots.values():
+        print(f"{snapshot.key:12} {snapshot.date}  {snapshot.path}")
+    latest = next(reversed(snapshots.values()))
+    print(memory_report(parse_salary_csv(latest.path), load_snapshot(latest)).to_string())
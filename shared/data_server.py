@@ -0,0 +1,228 @@
+# ====================
+# Data server
+# ====================
+# A small Tornado server running next to Streamlit, in a thread of the same
+# process, so it reads the shared dataset and indexes the pages use. It
+# serves what doesn't fit in a Streamlit page: exports are streamed to the
+# browser a piece at a time (a download button would hold the whole file in
+# memory first), the JSON API answers dashboards, and /memory reports what
+# sessions hold to whoever runs the app, when DATA_SERVER_MEMORY is set. Streamlit builds its own Tornado application without a way
+# to add routes, hence a second port. Browsers are only sent to that port
+# when they are known to reach it (see data_server_url()); otherwise the
+# export popover falls back to download buttons served by Streamlit.
+import asyncio
+import ipaddress
+import json
+import os
+import threading
+from typing import Callable
+from urllib.parse import urlsplit
+import streamlit as st
+import tornado.httpserver
+import tornado.ioloop
+import tornado.netutil
+import tornado.web
+from shared.api import ApiHandler
+from shared.data_loader import get_dataset
+from shared.explorer import ExplorerFilter, build_explorer_index
+from shared.export import EXPORT_FORMATS, export_chunks, export_filename, export_query, export_rows, filter_from_query
+from shared.memory import memory_report
+
+
+# Port of the data server, and the URL browsers reach it at when it isn't
+# the app's host on that port (e.g. behind a reverse proxy)
+DATA_SERVER_PORT = int(os.environ.get('DATA_SERVER_PORT', 8502))
+DATA_SERVER_URL = os.environ.get('DATA_SERVER_URL')
+if DATA_SERVER_URL is None and 'CODESPACE_NAME' in os.environ:
+    # GitHub Codespaces forwards each port at a host of its own
+    domain = os.environ.get('GITHUB_CODESPACES_PORT_FORWARDING_DOMAIN', 'app.github.dev')
+    DATA_SERVER_URL = f"https://{os.environ['CODESPACE_NAME']}-{DATA_SERVER_PORT}.{domain}"
+# Serve /memory, which reports the sessions connected and the data and cache
+# sizes: off unless set to 1, and then only answered on this machine
+DATA_SERVER_MEMORY = os.environ.get('DATA_SERVER_MEMORY') == '1'
+# Hosts of an app opened on the machine it runs on, whose browser reaches
+# the data server's port without DATA_SERVER_URL
+LOCAL_HOSTS = {'localhost', '127.0.0.1', '::1'}
+
+# Session state flag set by the static site export, which renders pages
+# offline with every section shown, and without the data server
+STATIC_EXPORT = 'static_export'
+
+
+class ExportHandler(tornado.web.RequestHandler):
+    """Streams the rows matching the query's filter, e.g. /export.csv?division=Police%20Services"""
+
+    async def get(self, file_format: str):
+        dataset = get_dataset()
+        index = build_explorer_index(dataset, dataset.version)
+        try:
+            spec = filter_from_query({
+                name: [value.decode() for value in values]
+                for name, values in self.request.query_arguments.items()
+            })
+        except ValueError:
+            raise tornado.web.HTTPError(400, 'Pay ranges must be numbers')
+
+        self.set_header('Content-Type', EXPORT_FORMATS[file_format])
+        self.set_header('Content-Disposition', f'attachment; filename="{export_filename(spec, file_format)}"')
+        self.set_header('Cache-Control', 'no-store')
+
+        # Pieces are built off the event loop, and the next one only once the
+        # last has been sent, so a slow client never lets them pile up
+        blocks, row_mask = export_rows(dataset, index, spec)
+        chunks = export_chunks(dataset.frame, file_format, row_mask, blocks)
+        loop = asyncio.get_running_loop()
+        while (chunk := await loop.run_in_executor(None, next, chunks, None)) is not None:
+            if chunk:
+                self.write(chunk)
+                await self.flush()
+
+
+class MemoryHandler(tornado.web.RequestHandler):
+    """Reports the memory shared by every session and held by each, as JSON, to local clients"""
+
+    def prepare(self):
+        if not ipaddress.ip_address(self.request.remote_ip).is_loopback:
+            raise tornado.web.HTTPError(404)
+
+    def get(self):
+        self.set_header('Content-Type', 'application/json')
+        self.set_header('Cache-Control', 'no-store')
+        self.write(json.dumps(memory_report()))
+
+
+def make_app(memory: bool = DATA_SERVER_MEMORY) -> tornado.web.Application:
+    """
+    Routes of the data server.
+
+    :param memory: Whether to serve /memory
+    """
+    formats = '|'.join(EXPORT_FORMATS)
+    routes = [
+        (rf'/export\.({formats})', ExportHandler),
+        (r'(/api(?:/.*)?)', ApiHandler),
+    ]
+    if memory:
+        routes.append((r'/memory', MemoryHandler))
+    return tornado.web.Application(routes)
+
+def _serve(sockets: list):
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    server = tornado.httpserver.HTTPServer(make_app())
+    server.add_sockets(sockets)
+    asyncio.get_event_loop().run_forever()
+
+
+def start_data_server() -> int | None:
+    """
+    Start the data server once per process. Returns its port, or None if
+    the port is taken (e.g. by another app) or the page is being exported,
+    in which case pages do without it.
+    """
+    if st.session_state.get(STATIC_EXPORT):
+        return None
+    return _start_data_server()
+
+@st.cache_resource(show_spinner=False)
+def _start_data_server() -> int | None:
+    try:
+        sockets = tornado.netutil.bind_sockets(DATA_SERVER_PORT)
+    except OSError:
+        return None
+    threading.Thread(target=_serve, args=(sockets,), name='data-server', daemon=True).start()
+    return DATA_SERVER_PORT
+
+def data_server_url(path: str) -> str | None:
+    """
+    Browser URL of a data server path, or None if the server isn't running
+    or the browser may not reach it: without DATA_SERVER_URL, only an app
+    opened on its own machine is known to reach the data server's port.
+
+    :param path: Path and query, e.g. '/export.csv?division=Fire%20Services'
+    """
+    port = start_data_server()
+    if port is None:
+        return None
+    if DATA_SERVER_URL:
+        return DATA_SERVER_URL.rstrip('/') + path
+    host = urlsplit(st.context.url or 'http://localhost').hostname
+    if host not in LOCAL_HOSTS:
+        return None
+    return f"http://{f'[{host}]' if ':' in host else host}:{port}{path}"
+
+def export_url(spec: ExplorerFilter, file_format: str) -> str | None:
+    """
+    Download URL of the rows matching a filter.
+
+    :param spec: Rows to export
+    :param file_format: 'csv' or 'parquet'
+    """
+    query = export_query(spec)
+    return data_server_url(f"/export.{file_format}" + (f"?{query}" if query else ''))
+
+def export_file(spec: ExplorerFilter, file_format: str) -> Callable[[], bytes]:
+    """
+    Function building the whole export file of the rows matching a filter,
+    for a download button to call when it is clicked.
+
+    :param spec: Rows to export
+    :param file_format: 'csv' or 'parquet'
+    """
+    # Read here, in the page's script run: the button calls it from another thread
+    dataset = get_dataset()
+    index = build_explorer_index(dataset, dataset.version)
+
+    def build() -> bytes:
+        blocks, row_mask = export_rows(dataset, index, spec)
+        return b''.join(export_chunks(dataset.frame, file_format, row_mask, blocks))
+    return build
+
+def render_export_popover(spec: ExplorerFilter, label: str, key: str, employment_types: list[str] = None):
+    """
+    Render a popover with downloads of the rows matching a filter: links
+    streaming them from the data server, or download buttons building the
+    file in the app when the browser can't reach the data server. Nothing
+    is rendered when the page is being exported.
+
+    :param spec: Rows to export
+    :param label: What the rows are, e.g. 'Police Services'
+    :param key: Widget key prefix, unique on the page
+    :param employment_types: Employment types to offer narrowing the export to
+    """
+    if st.session_state.get(STATIC_EXPORT):
+        return
+    with st.popover(f"Download {label} rows", icon=":material/download:"):
+        if employment_types:
+            employment_type = st.segmented_control(
+                "Employment Type", ['All', *employment_types], default='All', key=f"{key} employment type"
+            )
+            # Deselecting every option exports all rows too
+            if employment_type in employment_types:
+                spec = spec._replace(employment_types=(employment_type,))
+        urls = {file_format: export_url(spec, file_format) for file_format in EXPORT_FORMATS}
+        if all(urls.values()):
+            st.caption("Streamed straight from the payroll, so large extracts start downloading right away.")
+        else:
+            st.caption("Built from the payroll when you click, then downloaded.")
+        with st.container(horizontal=True):
+            for file_format, url in urls.items():
+                if url:
+                    st.link_button(file_format.upper(), url, icon=":material/download:")
+                else:
+                    st.download_button(
+                        file_format.upper(),
+                        export_file(spec, file_format),
+                        file_name=export_filename(spec, file_format),
+                        mime=EXPORT_FORMATS[file_format],
+                        on_click='ignore',
+                        icon=":material/download:",
+                        key=f"{key} {file_format}",
+                    )
+
+
+if __name__ == '__main__':
+    # Serve without the app, e.g. for dashboards polling the API
+    server = tornado.httpserver.HTTPServer(make_app())
+    server.add_sockets(tornado.netutil.bind_sockets(DATA_SERVER_PORT))
+    print(f"Serving on port {DATA_SERVER_PORT}")
+    tornado.ioloop.IOLoop.current().start()
@@ -0,0 +1,104 @@
+# ====================
+# Shared, read-only payroll dataset
+# ====================
+import numpy as np
+import pandas as pd
+from shared.aggregates import AggregateCube
+from shared.taxonomy import ROW_KEYS
+
+
+# Row order of the dataset: every prefix of these columns forms contiguous
+# blocks, and divisions of a sub-group are adjacent in taxonomy order
+CLUSTER_KEYS = ['Division Category', 'Division Name', 'Employment Type']
+
+
+class SalaryDataset:
+    """
+    Process-wide handle on the payroll frame, shared by every session.
+
+    Rows are expected in CLUSTER_KEYS order (the loader sorts them), so each
+    category, division, sub-group, or division + employment type occupies one
+    contiguous block, found in the offset table without scanning rows (see
+    blocks()), and selecting it is a zero-copy slice. The frame's
+    buffers are read-only: sessions share them without copying, and a write
+    into them raises instead of changing what every other session sees.
+
+    :param frame: Compact payroll DataFrame
+    :param version: Identifier of the source data, changes when the CSV does
+    """
+
+    def __init__(self, frame: pd.DataFrame, version: str):
+        self._frame = _read_only(frame)
+        self.version = version
+        self._runs = _find_runs(self._frame)
+        # Page statistics are rolled up from here instead of scanning rows
+        self.cube = AggregateCube(self._frame)
+
+    def __len__(self):
+        return len(self._frame)
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """
+        The full frame, sharing the dataset's buffers. Columns can be added or
+        replaced, but values can't be written in place.
+        """
+        # Each column is a new view, so even replacing the values of an Arrow
+        # column (which swaps the array the view holds) leaves the dataset as is
+        return pd.DataFrame(
+            {column: self._frame[column].array[:] for column in self._frame.columns},
+            index=self._frame.index,
+            copy=False,
+        )
+
+    def blocks(self, **filters) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Starts and stops of the contiguous blocks of rows matching every
+        filter given, in row order, read from the offset table. A division,
+        category, sub-group or division + employment type is one block; an
+        employment type on its own is one block per division.
+
+        :param filters: Any of category, group, division, employment_type,
+            each a value or a list of values any of which may match
+        """
+        matches = np.ones(len(self._runs['start']), dtype=bool)
+        for key, values in filters.items():
+            values = list(values) if isinstance(values, (list, tuple, set)) else [values]
+            matches &= np.isin(self._runs[ROW_KEYS[key]], values)
+        starts, stops = self._runs['start'][matches], self._runs['stop'][matches]
+        # Runs that follow each other are one block
+        joined = np.flatnonzero(starts[1:] == stops[:-1])
+        return np.delete(starts, joined + 1), np.delete(stops, joined)
+
+
+def _read_only(frame: pd.DataFrame) -> pd.DataFrame:
+    # The frame over read-only buffers. Arrow-backed columns are immutable
+    # already; categorical codes and nullable integers get read-only copies.
+    def freeze(values: np.ndarray) -> np.ndarray:
+        values = np.array(values)
+        values.flags.writeable = False
+        return values
+
+    columns = {}
+    for column in frame.columns:
+        values = frame[column].array
+        if isinstance(values, pd.Categorical):
+            values = pd.Categorical.from_codes(freeze(values.codes), dtype=values.dtype)
+        elif isinstance(values, pd.arrays.IntegerArray):
+            values = pd.arrays.IntegerArray(freeze(values.to_numpy('int64', na_value=0)), freeze(values.isna()))
+        columns[column] = values
+    return pd.DataFrame(columns, index=frame.index, copy=False)
+
+def _find_runs(frame: pd.DataFrame) -> dict:
+    # Offset table: one entry per maximal block of consecutive rows sharing
+    # every filterable value, with that block's [start, stop) row range
+    columns = list(ROW_KEYS.values())
+    codes = np.column_stack([frame[column].cat.codes.to_numpy() for column in columns])
+    boundaries = np.flatnonzero((codes[1:] != codes[:-1]).any(axis=1)) + 1
+    starts = np.concatenate([[0], boundaries]) if len(frame) else np.array([], dtype=np.intp)
+    stops = np.concatenate([boundaries, [len(frame)]]) if len(frame) else np.array([], dtype=np.intp)
+
+    runs = {column: frame[column].to_numpy(dtype=object)[starts] for column in columns}
+    runs['start'] = starts
+    runs['stop'] = stops
+    return runs
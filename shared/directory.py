@@ -0,0 +1,221 @@
+# ====================
+# Employee directory search
+# ====================
+# Prefix search over the words of Person Name and Job Title. Names and
+# titles repeat (every Police Officer II shares one title, multi-year files
+# repeat every name), so words are indexed per distinct value rather than per
+# row: a query narrows to distinct values first and only then expands to rows.
+import re
+import sys
+import time
+import unicodedata
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import streamlit as st
+from shared.dataset import SalaryDataset
+
+
+# Columns searched, in the order results are sorted by
+SEARCH_COLUMNS = ['Person Name', 'Job Title']
+
+
+def normalize(text: str) -> str:
+    """
+    Lowercase ASCII words separated by single spaces, as stored in the index.
+
+    :param text: Name, title or query
+    """
+    # Accents are dropped, apostrophes joined (O'Neal -> oneal), and any other
+    # punctuation splits words (Smith-Jones -> smith jones)
+    text = unicodedata.normalize('NFKD', text).encode('ascii', errors='ignore').decode('ascii').lower()
+    return re.sub(r'[^a-z0-9]+', ' ', re.sub(r"['`]", '', text)).strip()
+
+def _words(values: pa.Array) -> pa.ListArray:
+    # Same as normalize(), for a whole column, split into lists of words
+    values = pc.utf8_normalize(pc.fill_null(values, ''), 'NFKD')
+    values = pc.utf8_lower(pc.replace_substring_regex(values, r'[^\x00-\x7f]', ''))
+    values = pc.replace_substring_regex(values, r"['`]", '')
+    values = pc.replace_substring_regex(values, r'[^a-z0-9]+', ' ')
+    return pc.split_pattern(pc.utf8_trim_whitespace(values), ' ')
+
+def _group(keys: np.ndarray, size: int) -> tuple[np.ndarray, np.ndarray]:
+    # Positions grouped by key: positions[offsets[k]:offsets[k + 1]] have key k
+    positions = np.argsort(keys, kind='stable').astype(np.int32)
+    offsets = np.searchsorted(keys[positions], np.arange(size + 1))
+    return offsets, positions
+
+def _gather(offsets: np.ndarray, values: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    # Concatenation of values[offsets[k]:offsets[k + 1]] for every key, without a Python loop
+    starts, counts = offsets[keys], offsets[keys + 1] - offsets[keys]
+    positions = np.arange(counts.sum()) + np.repeat(starts - np.cumsum(counts) + counts, counts)
+    return values[positions]
+
+
+class _ColumnIndex:
+    """
+    Words of one text column, indexed by distinct value.
+
+    :param codes: Distinct value of each row
+    :param words: List of words of each distinct value
+    :param vocabulary: Sorted words of every searched column
+    """
+
+    def __init__(self, codes: np.ndarray, words: pa.ListArray, vocabulary: pa.Array):
+        self.codes = codes
+        # Word ids (sorted vocabulary positions) of each distinct value's words
+        word_ids = pc.index_in(pc.list_flatten(words), value_set=vocabulary).to_numpy().astype(np.int32)
+        value_ids = pc.list_parent_indices(words).to_numpy().astype(np.int32)
+        # Word id -> distinct values, and distinct value -> rows
+        self.value_offsets, positions = _group(word_ids, len(vocabulary))
+        self.values = value_ids[positions]
+        self.row_offsets, self.rows = _group(codes, len(words))
+        # Running total of rows per word id, to size a prefix's matches up front
+        rows_per_value = np.diff(self.row_offsets)
+        rows_per_word = np.bincount(word_ids, weights=rows_per_value[value_ids], minlength=len(vocabulary))
+        self.cumulative_rows = np.concatenate([[0], np.cumsum(rows_per_word)])
+
+    def row_count(self, first_word: int, last_word: int) -> int:
+        """Rows with a word in [first_word, last_word), counting a row once per such word"""
+        return int(self.cumulative_rows[last_word] - self.cumulative_rows[first_word])
+
+    def matching_rows(self, first_word: int, last_word: int) -> np.ndarray:
+        """Rows with a word in [first_word, last_word), possibly repeated"""
+        values = self.values[self.value_offsets[first_word]:self.value_offsets[last_word]]
+        return _gather(self.row_offsets, self.rows, values)
+
+    def has_word(self, rows: np.ndarray, first_word: int, last_word: int) -> np.ndarray:
+        """Which of the rows have a word in [first_word, last_word)"""
+        # Decided once per distinct value, then looked up per row
+        matching = np.zeros(len(self.row_offsets) - 1, dtype=bool)
+        matching[self.values[self.value_offsets[first_word]:self.value_offsets[last_word]]] = True
+        return matching[self.codes[rows]]
+
+
+class DirectoryIndex:
+    """
+    Prefix and word search over Person Name and Job Title, built once per
+    dataset. Every query word must start a word of the row's name or title,
+    in any order: "off pol" finds Police Officers, "smith j" finds every
+    Smith with a first or middle name starting with J.
+
+    :param df: Payroll DataFrame with Person Name and Job Title columns
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.row_count = len(df)
+        encoded = []
+        for column in SEARCH_COLUMNS:
+            # Codes follow the sorted distinct values, so sorting by code sorts by text
+            codes, uniques = pd.factorize(df[column].astype('string').fillna(''), sort=True)
+            encoded.append((codes.astype(np.int32), _words(pa.array(uniques, type=pa.string()))))
+
+        vocabulary = pc.unique(pa.chunked_array([pc.list_flatten(words) for _, words in encoded]))
+        vocabulary = vocabulary.take(pc.sort_indices(vocabulary))
+        self.vocabulary = vocabulary.to_numpy(zero_copy_only=False).astype(str)
+        self.columns = [_ColumnIndex(codes, words, vocabulary) for codes, words in encoded]
+
+        # Result order (name, then title, then row) and each row's place in it
+        self.order = np.lexsort([column.codes for column in reversed(self.columns)]).astype(np.int32)
+        self.rank = np.empty_like(self.order)
+        self.rank[self.order] = np.arange(self.row_count, dtype=np.int32)
+
+    def _word_range(self, prefix: str) -> tuple[int, int]:
+        # Words starting with the prefix are a contiguous run of the sorted vocabulary
+        first = np.searchsorted(self.vocabulary, prefix, side='left')
+        last = np.searchsorted(self.vocabulary, prefix + '\U0010ffff', side='left')
+        return int(first), int(last)
+
+    def search(self, query: str, limit: int = 50) -> tuple[np.ndarray, int]:
+        """
+        Rows matching every word of the query, sorted by name then title.
+
+        :param query: Words or word prefixes, e.g. "smith jo"
+        :param limit: Maximum number of rows returned
+        :return: Positions of up to limit matching rows, and the number of matches
+        """
+        ranges = [self._word_range(prefix) for prefix in set(normalize(query).split())]
+        if not ranges or any(first == last for first, last in ranges):
+            return np.empty(0, dtype=np.int32), 0
+
+        # Expand the most selective query word to rows, then check the others on those rows only
+        ranges.sort(key=lambda words: sum(column.row_count(*words) for column in self.columns))
+        rows = np.concatenate([column.matching_rows(*ranges[0]) for column in self.columns])
+        for words in ranges[1:]:
+            if len(rows):
+                keep = np.zeros(len(rows), dtype=bool)
+                for column in self.columns:
+                    keep |= column.has_word(rows, *words)
+                rows = rows[keep]
+
+        # Ranks are distinct per row, so dropping repeats and sorting is one step
+        ranks = self.rank[rows]
+        if len(ranks) < self.row_count // 32:
+            ranks = np.unique(ranks)
+        else:
+            found = np.zeros(self.row_count, dtype=bool)
+            found[ranks] = True
+            ranks = np.flatnonzero(found)
+        return self.order[ranks[:limit]], len(ranks)
+
+
+@st.cache_resource(show_spinner="Building the employee directory...")
+def build_directory_index(_dataset: SalaryDataset, version: str) -> DirectoryIndex:
+    """
+    Directory index for one dataset version, shared by all sessions.
+
+    :param _dataset: Shared dataset (not hashed)
+    :param version: Dataset version the index is cached against
+    """
+    return DirectoryIndex(_dataset.frame)
+
+
+def synthetic_frame(rows: int, df: pd.DataFrame, seed: int = 0) -> pd.DataFrame:
+    """
+    A larger, multi-year-like frame: real titles with names recombined from
+    the real first and last names, so most names are distinct.
+
+    :param rows: Number of rows
+    :param df: Payroll DataFrame to draw names and titles from
+    :param seed: Random seed
+    """
+    rng = np.random.default_rng(seed)
+    last, _, first = df['Person Name'].astype(str).str.partition(', ').T.to_numpy()
+    return pd.DataFrame({
+        'Person Name': pd.Series(rng.choice(last, rows), dtype='string') + ', ' + rng.choice(first, rows),
+        'Job Title': pd.Categorical(rng.choice(df['Job Title'].astype(str).to_numpy(), rows)),
+    })
+
+def benchmark(index: DirectoryIndex, queries: list[str], repeats: int = 20) -> pd.DataFrame:
+    """
+    Median search time and match count for each query.
+
+    :param index: Index to search
+    :param queries: Queries to time
+    :param repeats: Searches timed per query
+    """
+    results = []
+    for query in queries:
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            _, matches = index.search(query)
+            timings.append(time.perf_counter() - start)
+        results.append({'Query': query, 'Matches': matches, 'Median (ms)': np.median(timings) * 1e3})
+    return pd.DataFrame(results)
+
+
+if __name__ == '__main__':
+    from shared.data_loader import get_dataset
+
+    frame = get_dataset().frame
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else len(frame)
+    if rows != len(frame):
+        frame = synthetic_frame(rows, frame)
+
+    start = time.perf_counter()
+    index = DirectoryIndex(frame)
+    print(f"Indexed {rows:,} rows, {len(index.vocabulary):,} words in {time.perf_counter() - start:.1f}s")
+    queries = ['smith', 'smith j', 'police officer', 'off pol', 'fire', 'p', 'a b', 'zzz']
+    print(benchmark(index, queries).round(2).to_string(index=False))
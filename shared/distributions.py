@@ -0,0 +1,212 @@
+# ====================
+# Pay distributions
+# ====================
+# Percentiles, histograms and box summaries per division and per job title.
+# Each pay column is sorted once per dataset version, grouped by division
+# (and by title), so a group's pay is one sorted slice: a percentile is a
+# lookup, and counting employees below an amount is a binary search.
+# Annual salaries and hourly rates live in separate columns and are kept
+# apart, since a row has one or the other.
+import sys
+import time
+from typing import NamedTuple
+import numpy as np
+import pandas as pd
+import streamlit as st
+from shared.aggregates import MEASURES
+from shared.chart_data import histogram
+from shared.dataset import SalaryDataset
+
+
+# Groupings a distribution can be asked for, mapped to their columns
+DISTRIBUTION_KEYS = {
+    'division': 'Division Name',
+    'title': 'Job Title',
+}
+
+# Percentiles shown for every distribution
+PERCENTILES = [10, 25, 50, 75, 90]
+
+
+class BoxSummary(NamedTuple):
+    """Box plot statistics of one distribution, in cents"""
+    count: int
+    lower_whisker: float            # Lowest value within 1.5 IQR of Q1
+    q1: float
+    median: float
+    q3: float
+    upper_whisker: float            # Highest value within 1.5 IQR of Q3
+    outliers: int                   # Values beyond the whiskers
+
+
+class SortedPay:
+    """
+    One pay column sorted within each group of a grouping column.
+
+    :param groups: Grouping column (categorical)
+    :param pay: Pay column in integer cents; missing values are left out
+    """
+
+    def __init__(self, groups: pd.Series, pay: pd.Series):
+        self.labels = list(groups.cat.categories)
+        codes = groups.cat.codes.to_numpy()
+        present = pay.notna().to_numpy() & (codes >= 0)
+        codes, values = codes[present], pay.to_numpy(dtype='float64', na_value=np.nan)[present]
+
+        # Sorted by group, then by pay, so every group is one sorted slice
+        order = np.lexsort([values, codes])
+        self.values = values[order]
+        self.offsets = np.searchsorted(codes[order], np.arange(len(self.labels) + 1))
+        self._positions = {label: i for i, label in enumerate(self.labels)}
+
+    def slice(self, label=None) -> np.ndarray:
+        """
+        Sorted pay of one group (a view, not a copy).
+
+        :param label: Group, or None for every group together (not sorted across groups)
+        """
+        if label is None:
+            return self.values
+        i = self._positions.get(label)
+        if i is None:
+            return self.values[:0]
+        return self.values[self.offsets[i]:self.offsets[i + 1]]
+
+    def count(self, label) -> int:
+        """Number of employees of a group paid this way"""
+        i = self._positions.get(label)
+        return 0 if i is None else int(self.offsets[i + 1] - self.offsets[i])
+
+    def quantiles(self, label, percentiles=PERCENTILES) -> pd.Series:
+        """
+        Percentiles of a group's pay, in cents, interpolated like numpy's
+        default (linear) method. Constant time per percentile.
+
+        :param label: Group
+        :param percentiles: Percentiles to return, 0 to 100
+        """
+        values = self.slice(label)
+        result = pd.Series(np.nan, index=list(percentiles), dtype='float64')
+        if len(values):
+            positions = np.asarray(percentiles, dtype='float64') / 100 * (len(values) - 1)
+            below = np.floor(positions).astype(int)
+            above = np.minimum(below + 1, len(values) - 1)
+            fraction = positions - below
+            result[:] = values[below] * (1 - fraction) + values[above] * fraction
+        return result
+
+    def rank(self, label, amount: float) -> float:
+        """
+        Share of a group paid less than an amount, by binary search.
+
+        :param label: Group
+        :param amount: Pay in cents
+        """
+        values = self.slice(label)
+        if not len(values):
+            return float('nan')
+        return np.searchsorted(values, amount, side='left') / len(values)
+
+    def box(self, label) -> BoxSummary | None:
+        """
+        Box plot statistics of a group's pay (Tukey whiskers), or None if
+        nobody in it is paid this way.
+
+        :param label: Group
+        """
+        values = self.slice(label)
+        if not len(values):
+            return None
+        q1, median, q3 = self.quantiles(label, [25, 50, 75])
+        fence = 1.5 * (q3 - q1)
+        # Whisker ends are the most extreme values inside the fences
+        low = np.searchsorted(values, q1 - fence, side='left')
+        high = np.searchsorted(values, q3 + fence, side='right')
+        return BoxSummary(
+            count=len(values),
+            lower_whisker=float(values[low]),
+            q1=q1,
+            median=median,
+            q3=q3,
+            upper_whisker=float(values[high - 1]),
+            outliers=int(low + len(values) - high),
+        )
+
+    def histogram(self, label, step: float) -> pd.DataFrame:
+        """
+        Counts of a group's pay in fixed-width bins (see chart_data.histogram),
+        from one binary search per bin edge.
+
+        :param label: Group
+        :param step: Bin width, in cents
+        """
+        values = self.slice(label)
+        if not len(values):
+            return histogram([], step)
+        bins = np.arange(np.floor(values[0] / step), np.floor(values[-1] / step) + 1)
+        counts = np.diff(np.searchsorted(values, bins * step, side='left'), append=len(values))
+        return histogram(bins, step, counts)
+
+
+class PayDistributions:
+    """
+    Sorted pay for every grouping and pay column of the dataset.
+
+    Use distributions[key, measure], e.g. distributions['title', 'Rate'].
+
+    :param df: Compact payroll DataFrame
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self._sorted = {
+            (key, measure): SortedPay(df[column], df[MEASURES[measure]])
+            for key, column in DISTRIBUTION_KEYS.items()
+            for measure in MEASURES
+        }
+
+    def __getitem__(self, key_and_measure: tuple[str, str]) -> SortedPay:
+        return self._sorted[key_and_measure]
+
+
+@st.cache_resource(show_spinner="Sorting pay distributions...")
+def build_pay_distributions(_dataset: SalaryDataset, version: str) -> PayDistributions:
+    """
+    Pay distributions for one dataset version, shared by all sessions.
+
+    :param _dataset: Shared dataset (not hashed)
+    :param version: Dataset version the distributions are cached against
+    """
+    return PayDistributions(_dataset.frame)
+
+
+if __name__ == '__main__':
+    from shared.data_loader import get_dataset
+
+    frame = get_dataset().frame
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else len(frame)
+    if rows != len(frame):
+        # Real rows resampled, so every group keeps its real pay spread
+        frame = frame.sample(rows, replace=True, random_state=0, ignore_index=True)
+
+    start = time.perf_counter()
+    distributions = PayDistributions(frame)
+    print(f"Sorted {rows:,} rows in {time.perf_counter() - start:.2f}s")
+
+    salaries = distributions['title', 'Salary']
+    title = 'Police Officer II'
+    for label, query in [
+        ('quantiles', lambda: salaries.quantiles(title)),
+        ('box', lambda: salaries.box(title)),
+        ('rank', lambda: salaries.rank(title, 7_500_000)),
+        ('histogram', lambda: salaries.histogram(title, 500_000)),
+    ]:
+        timings = []
+        for _ in range(200):
+            start = time.perf_counter()
+            query()
+            timings.append(time.perf_counter() - start)
+        print(f"{label:10} {np.median(timings) * 1e6:8.1f} µs")
+    # Baseline: the same percentiles computed from the rows
+    start = time.perf_counter()
+    frame.loc[frame['Job Title'] == title, 'Annual Salary'].quantile([q / 100 for q in PERCENTILES])
+    print(f"{'scan':10} {(time.perf_counter() - start) * 1e6:8.1f} µs")
@@ -0,0 +1,261 @@
+# ====================
+# Payroll explorer
+# ====================
+# Every explorer filter is on a column the payroll is already grouped by
+# (division, employment type, title) or on pay in whole histogram bins, so
+# the rows matching any filter are a union of cells: employees sharing a
+# division, employment type, title and pay bin. Bitmaps index the cells, a
+# filter is a few ANDs over them, and every metric and chart of the page is
+# summed from the selected cells, so recomputing never scans the rows. Rows
+# are only reached (through each row's cell) when they are asked for.
+import sys
+import time
+from typing import NamedTuple
+import numpy as np
+import pandas as pd
+import streamlit as st
+from shared.bitmaps import BitmapIndex
+from shared.chart_data import aggregate, histogram, stacked_bars, top_n
+from shared.dataset import SalaryDataset
+from shared.result_cache import cached_result
+
+
+# Histogram bin widths, in cents; pay ranges are applied in whole bins
+SALARY_STEP = 500_000
+RATE_STEP = 100
+# Job titles listed by name; the rest share one trailing row
+TOP_TITLES = 10
+OTHER_TITLES = 'All other titles'
+
+# Columns a cell is keyed by, Division Category being implied by Division Name
+CELL_KEYS = ['Division Category', 'Division Name', 'Employment Type', 'Job Title', 'Salary Bin', 'Rate Bin']
+
+
+class ExplorerFilter(NamedTuple):
+    """
+    Rows to explore. An empty selection leaves its column unfiltered, and a
+    pay range of None leaves its pay column unfiltered; a pay range keeps
+    only rows paid that way.
+    """
+    categories: tuple = ()
+    divisions: tuple = ()
+    employment_types: tuple = ()
+    job_titles: tuple = ()
+    salary_range: tuple = None      # [low, high) annual salary in dollars, widened to whole bins
+    rate_range: tuple = None        # [low, high) hourly rate in dollars, widened to whole bins
+
+
+class ExplorerSummary(NamedTuple):
+    """Metrics and chart data for the rows matching an ExplorerFilter"""
+    employees: int
+    full_time_employees: int
+    part_time_employees: int
+    total_salary: float
+    average_salary: float
+    average_hourly_rate: float
+    division_employees: pd.DataFrame    # Division Name, Employment Type, Count
+    salary_histogram: pd.DataFrame      # Bin Start, Bin End, Count (dollars)
+    rate_histogram: pd.DataFrame        # Bin Start, Bin End, Count (dollars)
+    top_titles: pd.DataFrame            # Job Title, Employees, Average Salary, Average Hourly Rate
+
+
+class ExplorerIndex:
+    """
+    Payroll cells with bitmaps over them, and the cell of every row.
+
+    :param df: Compact payroll DataFrame
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        salaries = df['Annual Salary'].to_numpy(dtype='float64', na_value=np.nan)
+        rates = df['Hourly/Per Event Rate'].to_numpy(dtype='float64', na_value=np.nan)
+        rows = df[CELL_KEYS[:4]].assign(**{
+            # Bin number of each row's pay, -1 where it isn't paid that way
+            'Salary Bin': np.nan_to_num(salaries // SALARY_STEP, nan=-1).astype(np.int64),
+            'Rate Bin': np.nan_to_num(rates // RATE_STEP, nan=-1).astype(np.int64),
+            'Salary': salaries,
+            'Rate': rates,
+        })
+        grouped = rows.groupby(CELL_KEYS, observed=True, sort=False)
+        self.row_cells = grouped.ngroup().to_numpy().astype(np.int32)
+        self.cells = grouped.agg(
+            Rows=('Salary Bin', 'size'),
+            **{'Salary Sum': ('Salary', 'sum'), 'Salary Count': ('Salary', 'count')},
+            **{'Rate Sum': ('Rate', 'sum'), 'Rate Count': ('Rate', 'count')},
+        ).reset_index()
+        self.bitmaps = BitmapIndex(self.cells, CELL_KEYS)
+
+    def filter(self, spec: ExplorerFilter) -> np.ndarray:
+        """
+        Bitmap of the cells matching every part of a filter.
+
+        :param spec: Filter to apply
+        """
+        bitmaps = [
+            self.bitmaps.any_of(column, values)
+            for column, values in [
+                ('Division Category', spec.categories),
+                ('Division Name', spec.divisions),
+                ('Employment Type', spec.employment_types),
+                ('Job Title', spec.job_titles),
+            ]
+            if values
+        ]
+        for column, pay_range, step in [('Salary Bin', spec.salary_range, SALARY_STEP), ('Rate Bin', spec.rate_range, RATE_STEP)]:
+            if pay_range is not None:
+                low, high = pay_range[0] * 100 // step, -(-pay_range[1] * 100 // step)
+                bitmaps.append(self.bitmaps.any_of(column, range(int(low), int(high))))
+
+        if not bitmaps:
+            return self.bitmaps.all_rows()
+        return np.bitwise_and.reduce(bitmaps)
+
+    def canonical(self, spec: ExplorerFilter) -> ExplorerFilter:
+        """
+        The simplest filter selecting the same rows: selections sorted and
+        deduplicated, a selection of every value dropped, and pay ranges
+        widened to the bin edges they are applied at. Equal slices asked for
+        in any way get equal (hashable) filters.
+
+        :param spec: Filter as given by the page
+        """
+        selections = []
+        for column, values in [
+            ('Division Category', spec.categories),
+            ('Division Name', spec.divisions),
+            ('Employment Type', spec.employment_types),
+            ('Job Title', spec.job_titles),
+        ]:
+            labels = self.bitmaps.labels[column]
+            values = tuple(sorted(set(values), key=lambda value: labels.get(value, len(labels))))
+            selections.append(() if set(values) == set(labels) else values)
+
+        ranges = []
+        for pay_range, step in [(spec.salary_range, SALARY_STEP), (spec.rate_range, RATE_STEP)]:
+            if pay_range is not None:
+                low, high = pay_range[0] * 100 // step, -(-pay_range[1] * 100 // step)
+                pay_range = (int(low) * step // 100, int(high) * step // 100)
+            ranges.append(pay_range)
+        return ExplorerFilter(*selections, *ranges)
+
+    def rows(self, bitmap: np.ndarray) -> np.ndarray:
+        """
+        Positions of the payroll rows in the cells of a bitmap, in row order.
+        Unlike filtering and summarizing, this visits every row.
+
+        :param bitmap: Cells, e.g. from filter()
+        """
+        return np.flatnonzero(self.bitmaps.mask(bitmap)[self.row_cells])
+
+    def summarize(self, bitmap: np.ndarray) -> ExplorerSummary:
+        """
+        Metrics and chart data for the rows in the cells of a bitmap.
+
+        :param bitmap: Cells to summarize, e.g. from filter()
+        """
+        cells = self.cells[self.bitmaps.mask(bitmap)]
+        employees = cells.groupby('Employment Type', observed=True)['Rows'].sum()
+        totals = cells[['Rows', 'Salary Sum', 'Salary Count', 'Rate Sum', 'Rate Count']].sum()
+
+        division_employees = stacked_bars(
+            aggregate(cells, ['Division Name', 'Employment Type'], 'Rows'),
+            'Division Name', 'Employment Type'
+        )
+        titles = cells.groupby('Job Title', observed=True)[['Rows', 'Salary Sum', 'Salary Count', 'Rate Sum', 'Rate Count']].sum()
+        titles = top_n(titles.reset_index(), 'Job Title', 'Rows', TOP_TITLES, other=OTHER_TITLES)
+        top_titles = pd.DataFrame({
+            'Job Title': titles['Job Title'].astype(str).to_numpy(),
+            'Employees': titles['Rows'].to_numpy(),
+            'Average Salary': (titles['Salary Sum'] / titles['Salary Count'] / 100).to_numpy(),
+            'Average Hourly Rate': (titles['Rate Sum'] / titles['Rate Count'] / 100).to_numpy(),
+        })
+
+        return ExplorerSummary(
+            employees=int(totals['Rows']),
+            full_time_employees=int(employees.get('Full-time', 0)),
+            part_time_employees=int(employees.get('Part-time', 0)),
+            total_salary=totals['Salary Sum'] / 100,
+            average_salary=totals['Salary Sum'] / totals['Salary Count'] / 100 if totals['Salary Count'] else float('nan'),
+            average_hourly_rate=totals['Rate Sum'] / totals['Rate Count'] / 100 if totals['Rate Count'] else float('nan'),
+            division_employees=division_employees,
+            salary_histogram=_histogram(cells, 'Salary', SALARY_STEP),
+            rate_histogram=_histogram(cells, 'Rate', RATE_STEP),
+            top_titles=top_titles,
+        )
+
+
+def _histogram(cells: pd.DataFrame, measure: str, step: int) -> pd.DataFrame:
+    # Bins are part of the cell key, so a bin's count is a sum over cells, in dollars
+    paid = cells[cells[f'{measure} Bin'] >= 0]
+    return histogram(paid[f'{measure} Bin'], step, paid[f'{measure} Count'], scale=100)
+
+
+def cached_summary(index: ExplorerIndex, spec: ExplorerFilter) -> ExplorerSummary:
+    """
+    Summary of a filter from the shared result cache, so every session asking
+    for the same slice reuses one computation.
+
+    :param index: Explorer index of the current dataset
+    :param spec: Filter to summarize
+    """
+    spec = index.canonical(spec)
+    return cached_result('explorer/summary', spec, lambda: index.summarize(index.filter(spec)))
+
+
+@st.cache_resource(show_spinner="Building filter bitmaps...")
+def build_explorer_index(_dataset: SalaryDataset, version: str) -> ExplorerIndex:
+    """
+    Explorer index for one dataset version, shared by all sessions.
+
+    :param _dataset: Shared dataset (not hashed)
+    :param version: Dataset version the index is cached against
+    """
+    return ExplorerIndex(_dataset.frame)
+
+
+def benchmark(index: ExplorerIndex, specs: dict, repeats: int = 10) -> pd.DataFrame:
+    """
+    Median filter and summary time for each filter.
+
+    :param index: Explorer index to filter
+    :param specs: Filters to time, by name
+    :param repeats: Runs timed per filter
+    """
+    results = []
+    for name, spec in specs.items():
+        filter_timings, summary_timings = [], []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            bitmap = index.filter(spec)
+            filtered = time.perf_counter()
+            summary = index.summarize(bitmap)
+            filter_timings.append(filtered - start)
+            summary_timings.append(time.perf_counter() - filtered)
+        results.append({
+            'Filter': name,
+            'Rows': summary.employees,
+            'Filter (ms)': np.median(filter_timings) * 1e3,
+            'Summary (ms)': np.median(summary_timings) * 1e3,
+        })
+    return pd.DataFrame(results)
+
+
+if __name__ == '__main__':
+    from shared.data_loader import get_dataset
+
+    frame = get_dataset().frame
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else len(frame)
+    if rows != len(frame):
+        # Real rows resampled, keeping each column's real values and mix
+        frame = frame.sample(rows, replace=True, random_state=0, ignore_index=True)
+
+    start = time.perf_counter()
+    index = ExplorerIndex(frame)
+    print(f"Indexed {rows:,} rows as {len(index.cells):,} cells in {time.perf_counter() - start:.2f}s")
+    print(benchmark(index, {
+        'Everything': ExplorerFilter(),
+        'Public Safety': ExplorerFilter(categories=('Public Safety',)),
+        'Two divisions, part-time': ExplorerFilter(divisions=('Memphis Parks', 'Library Services'), employment_types=('Part-time',)),
+        'Police Officer II, $70k+': ExplorerFilter(job_titles=('Police Officer II',), salary_range=(70_000, 250_000)),
+        'Full-time, $50k-$90k': ExplorerFilter(employment_types=('Full-time',), salary_range=(50_000, 90_000)),
+    }).round(1).to_string(index=False))
@@ -0,0 +1,300 @@
+# ====================
+# Streaming row export
+# ====================
+# Extracts of the payroll (e.g. every part-time row of Police Services) are
+# written as CSV or Parquet a chunk of rows at a time, straight from the
+# shared frame's columns. Only the blocks of rows the dataset's offset table
+# gives for the filter's categories, divisions and employment types are
+# read; each chunk of them is a zero-copy slice, filtered by the explorer
+# cells of its rows when titles or pay are filtered too, converted to an
+# Arrow batch and serialized into a small buffer that is handed out and
+# emptied before the next one.
+# Neither a filtered copy of the frame nor the whole file is ever held, so
+# memory stays flat however many rows are exported.
+import sys
+import time
+import tracemalloc
+from typing import Callable, Iterator
+from urllib.parse import urlencode
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from shared.dataset import CLUSTER_KEYS, SalaryDataset
+from shared.explorer import ExplorerFilter, ExplorerIndex
+
+
+# Rows serialized at a time; also the Parquet row group size
+CHUNK_ROWS = 65_536
+
+# Columns of an export, in order
+EXPORT_COLUMNS = [
+    'Division Category',
+    'Division Group',
+    'Division Name',
+    'Employment Type',
+    'Job Title',
+    'Person Name',
+    'Annual Salary',
+    'Hourly/Per Event Rate',
+]
+
+# Pay columns, stored in cents and exported in dollars
+MONEY_COLUMNS = ['Annual Salary', 'Hourly/Per Event Rate']
+
+# Export formats and their content types
+EXPORT_FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+# Query parameters of an export, mapped to ExplorerFilter fields
+FILTER_PARAMETERS = {
+    'category': 'categories',
+    'division': 'divisions',
+    'employment_type': 'employment_types',
+    'job_title': 'job_titles',
+}
+
+
+class _ChunkSink:
+    # Write-only file that keeps what was written until it is drained
+    def __init__(self):
+        self._parts = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b''.join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def record_batch(chunk: pd.DataFrame) -> pa.RecordBatch:
+    """
+    Export columns of some payroll rows as an Arrow batch, pay in dollars.
+    Categorical columns stay dictionary encoded and names are not copied.
+
+    :param chunk: Rows of the compact payroll frame
+    """
+    batch = pa.RecordBatch.from_pandas(chunk[EXPORT_COLUMNS], preserve_index=False)
+    for column in MONEY_COLUMNS:
+        i = batch.schema.get_field_index(column)
+        dollars = pc.divide(batch.column(i).cast(pa.float64()), 100)
+        batch = batch.set_column(i, column, dollars)
+    return batch.replace_schema_metadata(None)
+
+def export_batches(
+    df: pd.DataFrame,
+    row_mask: Callable[[int, int], np.ndarray] = None,
+    blocks: tuple[np.ndarray, np.ndarray] = None,
+    chunk_rows: int = CHUNK_ROWS,
+) -> Iterator[pa.RecordBatch]:
+    """
+    Rows of a frame as Arrow batches, one chunk of rows at a time.
+
+    :param df: Compact payroll frame
+    :param row_mask: Function of a [start, stop) row range returning the
+        boolean mask of the rows to export in it; None exports every row read
+    :param blocks: Starts and stops of the row ranges to read, e.g. from
+        SalaryDataset.blocks(); None reads every row
+    :param chunk_rows: Rows read per batch
+    """
+    starts, stops = blocks if blocks is not None else ([0], [len(df)])
+    for block_start, block_stop in zip(starts, stops):
+        for start in range(int(block_start), int(block_stop), chunk_rows):
+            stop = min(start + chunk_rows, int(block_stop))
+            chunk = df.iloc[start:stop]
+            if row_mask is not None:
+                mask = row_mask(start, stop)
+                if not mask.any():
+                    continue
+                chunk = chunk[mask]
+            yield record_batch(chunk)
+
+def iter_csv(df: pd.DataFrame, batches: Iterator[pa.RecordBatch]) -> Iterator[bytes]:
+    """
+    CSV file of some batches, a header then one piece per batch.
+
+    :param df: Frame the batches come from, for the header
+    :param batches: Batches from export_batches
+    """
+    sink = _ChunkSink()
+    with pacsv.CSVWriter(sink, record_batch(df.iloc[:0]).schema) as writer:
+        yield sink.drain()
+        for batch in batches:
+            writer.write_batch(batch)
+            yield sink.drain()
+    yield sink.drain()
+
+def iter_parquet(df: pd.DataFrame, batches: Iterator[pa.RecordBatch]) -> Iterator[bytes]:
+    """
+    Parquet file of some batches, one row group per batch, then the footer.
+
+    :param df: Frame the batches come from, for the schema
+    :param batches: Batches from export_batches
+    """
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, record_batch(df.iloc[:0]).schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch, row_group_size=len(batch))
+            yield sink.drain()
+    yield sink.drain()
+
+def export_chunks(
+    df: pd.DataFrame,
+    file_format: str,
+    row_mask: Callable[[int, int], np.ndarray] = None,
+    blocks: tuple[np.ndarray, np.ndarray] = None,
+) -> Iterator[bytes]:
+    """
+    Pieces of an export file, to be sent in order.
+
+    :param df: Compact payroll frame
+    :param file_format: 'csv' or 'parquet'
+    :param row_mask: Rows to export, see export_batches
+    :param blocks: Row ranges to read, see export_batches
+    """
+    writers = {'csv': iter_csv, 'parquet': iter_parquet}
+    if file_format not in writers:
+        raise ValueError(f"Unknown export format: {file_format}")
+    return writers[file_format](df, export_batches(df, row_mask, blocks))
+
+
+def explorer_row_mask(index: ExplorerIndex, spec: ExplorerFilter) -> Callable[[int, int], np.ndarray] | None:
+    """
+    Row mask function of an explorer filter, read from each row's cell, or
+    None if the filter keeps every row.
+
+    :param index: Explorer index of the frame being exported
+    :param spec: Rows to export
+    """
+    spec = index.canonical(spec)
+    if spec == ExplorerFilter():
+        return None
+    cells = index.bitmaps.mask(index.filter(spec))
+    return lambda start, stop: cells[index.row_cells[start:stop]]
+
+def export_rows(
+    dataset: SalaryDataset,
+    index: ExplorerIndex,
+    spec: ExplorerFilter,
+) -> tuple[tuple[np.ndarray, np.ndarray], Callable[[int, int], np.ndarray] | None]:
+    """
+    Where the rows of an explorer filter are: the blocks of rows holding its
+    categories, divisions and employment types, from the dataset's offset
+    table, and the row mask of the rest of the filter (titles and pay), or
+    None if nothing else is filtered.
+
+    :param dataset: Dataset being exported
+    :param index: Explorer index of the dataset
+    :param spec: Rows to export
+    """
+    spec = index.canonical(spec)
+    blocks = dataset.blocks(**{
+        key: values
+        for key, values in [('category', spec.categories), ('division', spec.divisions), ('employment_type', spec.employment_types)]
+        if values
+    })
+    return blocks, explorer_row_mask(index, spec._replace(categories=(), divisions=(), employment_types=()))
+
+def export_query(spec: ExplorerFilter) -> str:
+    """
+    Query string of an export of a filter's rows.
+
+    :param spec: Rows to export
+    """
+    parameters = [
+        (parameter, value)
+        for parameter, field in FILTER_PARAMETERS.items()
+        for value in getattr(spec, field)
+    ]
+    for name, pay_range in [('salary', spec.salary_range), ('rate', spec.rate_range)]:
+        if pay_range is not None:
+            parameters += [(f'{name}_min', pay_range[0]), (f'{name}_max', pay_range[1])]
+    return urlencode(parameters)
+
+def filter_from_query(arguments: dict[str, list[str]]) -> ExplorerFilter:
+    """
+    Filter of an export request; the inverse of export_query.
+
+    :param arguments: Query parameters, each with its list of values
+    """
+    def pay_range(name):
+        if f'{name}_min' not in arguments or f'{name}_max' not in arguments:
+            return None
+        return (float(arguments[f'{name}_min'][-1]), float(arguments[f'{name}_max'][-1]))
+
+    return ExplorerFilter(
+        **{field: tuple(arguments.get(parameter, [])) for parameter, field in FILTER_PARAMETERS.items()},
+        salary_range=pay_range('salary'),
+        rate_range=pay_range('rate'),
+    )
+
+def export_filename(spec: ExplorerFilter, file_format: str) -> str:
+    """
+    Download name of an export, from the values it is filtered by.
+
+    :param spec: Rows to export
+    :param file_format: 'csv' or 'parquet'
+    """
+    values = [value for field in FILTER_PARAMETERS.values() for value in getattr(spec, field)]
+    if spec.salary_range is not None or spec.rate_range is not None or len(values) > 3:
+        values = ['filtered']
+    name = '-'.join(['memphis-employees', *values]).lower()
+    name = ''.join(c if c.isalnum() else '-' for c in name)
+    return '-'.join(filter(None, name.split('-'))) + '.' + file_format
+
+
+if __name__ == '__main__':
+    from shared.data_loader import get_dataset
+
+    dataset = get_dataset()
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else len(dataset)
+    if rows != len(dataset):
+        # Real rows resampled, then kept in dataset order like the loader does
+        frame = dataset.frame.sample(rows, replace=True, random_state=0, ignore_index=True)
+        dataset = SalaryDataset(frame.sort_values(CLUSTER_KEYS, kind='stable', ignore_index=True), 'benchmark')
+    frame = dataset.frame
+    index = ExplorerIndex(frame)
+    # Arrow buffers are not seen by tracemalloc; count them in their own pool
+    pool = pa.proxy_memory_pool(pa.default_memory_pool())
+    pa.set_memory_pool(pool)
+
+    for name, spec in {
+        'Everything': ExplorerFilter(),
+        'Police Services, part-time': ExplorerFilter(divisions=('Police Services',), employment_types=('Part-time',)),
+        'Full-time, $50k-$90k': ExplorerFilter(employment_types=('Full-time',), salary_range=(50_000, 90_000)),
+    }.items():
+        for file_format in EXPORT_FORMATS:
+            tracemalloc.start()
+            start = time.perf_counter()
+            size = largest = 0
+            blocks, row_mask = export_rows(dataset, index, spec)
+            for chunk in export_chunks(frame, file_format, row_mask, blocks):
+                size += len(chunk)
+                largest = max(largest, len(chunk))
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(
+                f"{name:28} {file_format:8} {size / 1e6:8.1f} MB in {elapsed:5.2f}s, "
+                f"largest piece {largest / 1e6:5.1f} MB, Python heap peak {peak / 1e6:5.1f} MB"
+            )
+    print(f"Arrow buffers peak {pool.max_memory() / 1e6:.1f} MB across every export")
@@ -0,0 +1,204 @@
+# ====================
+# Job title normalization and fuzzy title search
+# ====================
+# The payroll file abbreviates job titles heavily ("Police Svcs Director",
+# "Compensation Coord Sr"). Titles are spelled out once at ingest, so every
+# page, table and search sees the same readable title. Fuzzy search runs over
+# the distinct titles only (under a thousand, however many employees), using
+# a trigram index so misspelled queries still find their title.
+import sys
+import time
+import numpy as np
+import pandas as pd
+import streamlit as st
+from shared.dataset import SalaryDataset
+from shared.directory import normalize
+
+
+# Abbreviated word pairs, expanded before single words
+PHRASE_ABBREVIATIONS = {
+    'Info Tech': 'IT',
+    'Spec Oper': 'Special Operations',
+}
+
+# Abbreviated words -> spelled-out words. Only abbreviations with a single
+# meaning across the payroll file; "Eng" (engineer or engineering), "Comm"
+# (community or communications) and "Admin" are left as they are.
+ABBREVIATIONS = {
+    'Admr': 'Administrator',
+    'Asst': 'Assistant',
+    'Bldg': 'Building',
+    'Const': 'Construction',
+    'Coord': 'Coordinator',
+    'Ctr': 'Center',
+    'Cust': 'Customer',
+    'Dept': 'Department',
+    'Dev': 'Development',
+    'Environ': 'Environmental',
+    'Equip': 'Equipment',
+    'Grds': 'Grounds',
+    'Hcd': 'HCD',
+    'Info': 'Information',
+    'Insp': 'Inspector',
+    'Jr': 'Junior',
+    'Ld': 'Lead',
+    'Lep': 'LEP',
+    'Maint': 'Maintenance',
+    'Mech': 'Mechanic',
+    'Mgmt': 'Management',
+    'Mgr': 'Manager',
+    'Mnt': 'Maintenance',
+    'On-line': 'Online',
+    'Oper': 'Operator',
+    'Ops': 'Operations',
+    'Osha': 'OSHA',
+    'Prog': 'Program',
+    'Proj': 'Project',
+    'Pub': 'Public',
+    'Rec': 'Records',
+    'Spec': 'Specialist',
+    'Sr': 'Senior',
+    'Super': 'Supervisor',
+    'Svc': 'Service',
+    'Svcs': 'Services',
+    'Tech': 'Technician',
+    'Tvb': 'TVB',
+    'Wks': 'Works',
+    'Wtp': 'WTP',
+}
+
+# Rank words the file puts last ("Court Records Clerk Senior"), moved to the
+# front. Deputy only moves after a title of two or more words ("Treasury
+# Deputy" is a job), and Chief only after Officer ("Battalion Fire Chief"
+# reads right as it is). A trailing Assistant stays: it is the job far more
+# often ("Office Assistant") than a rank.
+RANK_SUFFIXES = ['Senior', 'Junior', 'Lead']
+TWO_WORD_RANK_SUFFIXES = ['Deputy']
+OFFICER_CHIEF = 'Officer Chief'
+
+# Whole titles that the rules above don't read naturally
+TITLE_OVERRIDES = {
+    'Internship Urban Fellow': 'Internship (Urban Fellow)',
+}
+
+# Statistics shown with each matching title, from AggregateCube.rollup
+TITLE_STATISTICS = ['Employees', 'Average Salary', 'Max Salary', 'Average Hourly Rate', 'Max Hourly Rate']
+
+
+def normalize_job_title(title: str) -> str:
+    """
+    Spell out a payroll job title: abbreviations expanded and trailing ranks
+    moved to the front, e.g. "Compensation Coord Sr" -> "Senior Compensation
+    Coordinator", "Financial Officer Chief" -> "Chief Financial Officer".
+
+    :param title: Job title as published
+    """
+    if title in TITLE_OVERRIDES:
+        return TITLE_OVERRIDES[title]
+    title = f' {title} '
+    for phrase, expansion in PHRASE_ABBREVIATIONS.items():
+        title = title.replace(f' {phrase} ', f' {expansion} ')
+    words = [ABBREVIATIONS.get(word, word) for word in title.split()]
+
+    # "Council Admin Officer Chief Deputy" -> "Deputy Chief Council Admin Officer"
+    ranks = []
+    while len(words) > 1 and (
+        words[-1] in RANK_SUFFIXES
+        or (words[-1] in TWO_WORD_RANK_SUFFIXES and len(words) > 2)
+        or ' '.join(words[-2:]) == OFFICER_CHIEF
+    ):
+        ranks.append(words.pop())
+    return ' '.join(ranks + words)
+
+def normalize_job_titles(titles: pd.Series) -> pd.Series:
+    """
+    normalize_job_title() for a whole column, computed once per distinct title.
+
+    :param titles: Job Title column; missing titles stay missing
+    """
+    distinct = titles.dropna().unique()
+    return titles.map(dict(zip(distinct, map(normalize_job_title, distinct))))
+
+def trigrams(text: str) -> list[str]:
+    """
+    Distinct three-letter sequences of each word of normalized text, with the
+    word boundaries marked so word starts and ends count.
+
+    :param text: Title or query
+    """
+    grams = set()
+    for word in normalize(text).split():
+        padded = f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return sorted(grams)
+
+
+class TitleIndex:
+    """
+    Typo-tolerant search over the distinct job titles. Titles are ranked by
+    trigram similarity to the query (shared trigrams over all trigrams of
+    both), so "polce officr" still ranks Police Officer titles first.
+
+    :param stats: One row per job title, indexed by title, e.g. from
+        AggregateCube.rollup(by=['Job Title'])
+    """
+
+    def __init__(self, stats: pd.DataFrame):
+        self.stats = stats.reset_index()
+        titles = self.stats['Job Title'].astype(str)
+        grams = [trigrams(title) for title in titles]
+        self.title_sizes = np.array([len(title_grams) for title_grams in grams])
+
+        # Trigram -> titles containing it, as one sorted vocabulary and flat postings
+        title_ids = np.repeat(np.arange(len(grams)), self.title_sizes)
+        self.vocabulary, gram_ids = np.unique(np.concatenate(grams), return_inverse=True)
+        order = np.argsort(gram_ids, kind='stable')
+        self.postings = title_ids[order]
+        self.offsets = np.searchsorted(gram_ids[order], np.arange(len(self.vocabulary) + 1))
+
+    def search(self, query: str, limit: int = 10, min_score: float = 0.2) -> pd.DataFrame:
+        """
+        Titles most similar to the query, best first, with their statistics.
+
+        :param query: Title or part of one, possibly misspelled
+        :param limit: Maximum number of titles returned
+        :param min_score: Lowest similarity (0 to 1) returned
+        """
+        query_grams = trigrams(query)
+        # Only trigrams some title has can be shared
+        positions = np.searchsorted(self.vocabulary, query_grams)
+        positions = positions[positions < len(self.vocabulary)]
+        known = positions[np.isin(self.vocabulary[positions], query_grams)]
+        postings = [self.postings[self.offsets[i]:self.offsets[i + 1]] for i in known]
+        shared = np.bincount(np.concatenate(postings or [np.empty(0, dtype=int)]), minlength=len(self.title_sizes))
+        scores = shared / np.maximum(len(query_grams) + self.title_sizes - shared, 1)
+
+        best = np.flatnonzero(scores >= min_score)
+        # Highest score first, then the most common title
+        best = best[np.lexsort([-self.stats['Employees'].to_numpy()[best], -scores[best]])][:limit]
+        return self.stats.iloc[best][['Job Title'] + TITLE_STATISTICS].assign(Score=scores[best]).reset_index(drop=True)
+
+
+@st.cache_resource(show_spinner="Indexing job titles...")
+def build_title_index(_dataset: SalaryDataset, version: str) -> TitleIndex:
+    """
+    Job title index for one dataset version, shared by all sessions.
+
+    :param _dataset: Shared dataset (not hashed)
+    :param version: Dataset version the index is cached against
+    """
+    return TitleIndex(_dataset.cube.rollup(by=['Job Title']))
+
+
+if __name__ == '__main__':
+    from shared.data_loader import get_dataset
+
+    dataset = get_dataset()
+    start = time.perf_counter()
+    index = build_title_index(dataset, dataset.version)
+    print(f"Indexed {len(index.title_sizes):,} titles, {len(index.vocabulary):,} trigrams in {(time.perf_counter() - start) * 1e3:.0f} ms")
+    for query in sys.argv[1:] or ['polce officr', 'fire fighter', 'libarian', 'sanitation']:
+        start = time.perf_counter()
+        matches = index.search(query, limit=5)
+        print(f"\n{query!r} ({(time.perf_counter() - start) * 1e3:.2f} ms)")
+        print(matches.round(2).to_string(index=False))
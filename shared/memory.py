@@ -0,0 +1,161 @@
+# ====================
+# Per-session memory accounting
+# ====================
+# Sessions share one read-only dataset and the caches built from it, so what
+# each session holds on its own (widget values and anything a page keeps in
+# st.session_state) should stay small and constant however many connect.
+# Every page run records its session's footprint, and the data server
+# reports them with the shared memory at /memory when DATA_SERVER_MEMORY is
+# set. measure_sessions() runs the real page scripts in growing numbers of
+# sessions to check it offline.
+import gc
+import statistics
+import sys
+import threading
+import tracemalloc
+import pandas as pd
+import streamlit as st
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from shared.data_loader import get_dataset
+from shared.dataset import SalaryDataset
+from shared.result_cache import get_result_cache, result_size
+
+
+def session_footprint(state=None) -> int:
+    """
+    Bytes held by one session's state, excluding the shared dataset.
+
+    :param state: Mapping to measure, defaults to the current st.session_state
+    """
+    state = st.session_state.to_dict() if state is None else state
+    return sum(
+        result_size(value)
+        for value in state.values()
+        if not isinstance(value, SalaryDataset)
+    )
+
+
+class SessionFootprints:
+    """Footprint of every connected session, as of its latest page run"""
+
+    def __init__(self):
+        self._bytes = {}                # session id -> bytes
+        self._lock = threading.Lock()
+
+    def record(self, session_id: str, footprint: int):
+        """
+        Store a session's footprint.
+
+        :param session_id: Streamlit session id
+        :param footprint: Bytes from session_footprint()
+        """
+        with self._lock:
+            new_session = session_id not in self._bytes
+            self._bytes[session_id] = footprint
+        if new_session:
+            self.prune()
+
+    def prune(self):
+        """Forget sessions that have disconnected"""
+        if not runtime.exists():
+            return
+        app = runtime.get_instance()
+        with self._lock:
+            for session_id in [s for s in self._bytes if not app.is_active_session(s)]:
+                del self._bytes[session_id]
+
+    def values(self) -> list[int]:
+        """Footprints of the connected sessions"""
+        self.prune()
+        with self._lock:
+            return list(self._bytes.values())
+
+
+@st.cache_resource
+def get_session_footprints() -> SessionFootprints:
+    """Session footprints of the running app"""
+    return SessionFootprints()
+
+def track_session():
+    """Record the current session's footprint; called by every page run"""
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        get_session_footprints().record(ctx.session_id, session_footprint())
+
+def memory_report() -> dict:
+    """Memory shared by every session of the running app, and held by each"""
+    footprints = get_session_footprints().values()
+    return {
+        'dataset_bytes': result_size(get_dataset().frame),
+        'result_cache_bytes': get_result_cache().stats()['Bytes'],
+        'sessions': len(footprints),
+        'session_bytes': sum(footprints),
+        'median_session_bytes': statistics.median(footprints) if footprints else 0,
+        'max_session_bytes': max(footprints, default=0),
+    }
+
+
+def run_session(page: str = None):
+    """
+    A new AppTest session that has run one page, as a browser tab would.
+
+    :param page: Page script path, or None for the overview page
+    """
+    # Only needed offline, so the app itself never imports the testing harness
+    from streamlit.testing.v1 import AppTest
+    from shared.page_timing import APP_SCRIPT
+
+    app = AppTest.from_file(APP_SCRIPT, default_timeout=60)
+    if page:
+        app.switch_page(page)
+    app.run()
+    if app.exception:
+        raise RuntimeError(f"{page or APP_SCRIPT} raised: {app.exception[0].value}")
+    return app
+
+def measure_sessions(session_counts=(10, 50, 100, 250, 500), pages: list[str] = None) -> pd.DataFrame:
+    """
+    Open growing numbers of concurrent sessions, each running one page
+    script, and report the memory they retain as traced by tracemalloc. The
+    sessions are kept until their count has been measured. Traced memory also
+    includes the elements AppTest keeps of each page, which a browser would
+    hold, so it overstates what a session costs the server.
+
+    :param session_counts: Numbers of concurrent sessions to open
+    :param pages: Page scripts the sessions run, in turn; defaults to the
+        overview and the category pages
+    """
+    from shared.page_timing import PAGES
+
+    pages = pages or PAGES
+    # Every page runs once first, so the dataset and the caches every session
+    # shares exist before tracing starts
+    for page in pages:
+        run_session(page)
+
+    results = []
+    tracemalloc.start()
+    for count in session_counts:
+        gc.collect()
+        baseline = tracemalloc.get_traced_memory()[0]
+        sessions = [run_session(pages[i % len(pages)]) for i in range(count)]
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+        footprints = [session_footprint(app.session_state.filtered_state) for app in sessions]
+        results.append({
+            'Sessions': count,
+            'Retained bytes': retained,
+            'Bytes per session': retained / count,
+            'Median session state bytes': statistics.median(footprints),
+        })
+        del sessions
+    tracemalloc.stop()
+
+    return pd.DataFrame(results)
+
+
+if __name__ == '__main__':
+    counts = [int(count) for count in sys.argv[1:]] or (10, 50, 100, 250, 500)
+    print(f"Shared dataset: {result_size(get_dataset().frame):,} bytes")
+    print(measure_sessions(counts).round(0).to_string(index=False))
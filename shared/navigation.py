@@ -1,63 +1,38 @@
+import hashlib
+from pathlib import Path
 import streamlit as st
+from shared.memory import track_session
 
 
-LOGO_URL = "https://i.imgur.com/iUhtm5p.png"
+# Files in static/ are served by Streamlit at app/static/ (server.enableStaticServing)
+STATIC_DIR = Path(__file__).parent.parent / 'static'
+
+LOGO_FILE = 'images/memphis-logo.png'
+LOGO_CDN_URL = "https://i.imgur.com/iUhtm5p.png"
 
-def render_navigation():
-    """Render consistent navigation sidebar across all pages"""
 
-    st.markdown("""
-        <style>
-            /* Hide Streamlit's auto-generated navigation */
-            [data-testid="stSidebarNav"] {
-                display: none;
-            }
-            
-            /* Remove border radius from sidebar logo */
-            /* Target the main container for st.image and the image itself */
-            [data-testid="stImageContainer"] img {
-                border-radius: 0px !important;
-            }
-        </style>
-    """, unsafe_allow_html=True)
+def static_url(name: str) -> str:
+    """
+    URL of a file in static/, versioned by its content. Requests carrying a
+    version are served with a long-lived Cache-Control header, and the URL
+    changes whenever the file does.
 
-    # Inject custom CSS for per-link background colors
-    st.markdown("""
-    <style>
-        /* Remove default rounded borders */
-        [data-testid="stPageLink-NavLink"] {
-            border-radius: 0 0.5rem 0.5rem 0;
-        }
-        
-        /* Background colors for hovering over navigation links */
-        a[href=""]:hover {
-            background: #0097A7 !important; /* #9AA0A6 */      
-        }
-        a[href="public-safety"]:hover {
-            background: #EA4335 !important;
-        }
-        a[href="public-works"]:hover {
-            background: #4285F4 !important;
-        }
-        a[href="stronger-neighborhoods"]:hover {
-            background: #34A853 !important;
-        }
-        a[href="good-government"]:hover {
-            background: #FBBC04 !important;
-        }
+    :param name: Path of the file within static/
+    """
+    digest = hashlib.md5((STATIC_DIR / name).read_bytes()).hexdigest()[:12]
+    return f"app/static/{name}?v={digest}"
 
-        /* Adjust text color for hovering over navigation links */
-        [data-testid="stPageLink-NavLink"][href=""]:hover span,
-        [data-testid="stPageLink-NavLink"][href="public-safety"]:hover span,
-        [data-testid="stPageLink-NavLink"][href="public-works"]:hover span,
-        [data-testid="stPageLink-NavLink"][href="stronger-neighborhoods"]:hover span {
-            color: white !important;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+# Served from static/ once the official artwork is committed there (see
+# static/README.md); until then the sidebar keeps drawing it from imgur
+LOGO_URL = static_url(LOGO_FILE) if (STATIC_DIR / LOGO_FILE).is_file() else LOGO_CDN_URL
+
+def render_navigation():
+    """Render consistent navigation sidebar across all pages"""
+    # Every page starts here, so this is where a session's memory is accounted
+    track_session()
 
     with st.sidebar:    
-        st.image(LOGO_URL, width=50)
+        st.markdown(f'<img src="{LOGO_URL}" width="50" alt="City of Memphis logo">', unsafe_allow_html=True)
         st.markdown('<h1 style="padding-top:0;">City of Memphis</h1>', unsafe_allow_html=True)
         st.subheader("Employee Insights")
         # Navigation links
@@ -66,6 +41,10 @@ def render_navigation():
         st.page_link("pages/public-works.py", label="Public Works", icon=":material/tram:")  # traffic
         st.page_link("pages/stronger-neighborhoods.py", label="Stronger Neighborhoods", icon=":material/psychiatry:")  # other_houses
         st.page_link("pages/good-government.py", label="Good Government", icon=":material/account_balance:")
+        st.page_link("pages/explorer.py", label="Explorer", icon=":material/filter_alt:")
+        st.page_link("pages/pay-distribution.py", label="Pay Distribution", icon=":material/bar_chart:")
+        st.page_link("pages/directory.py", label="Employee Directory", icon=":material/person_search:")
+        st.page_link("pages/year-over-year.py", label="Year over Year", icon=":material/compare_arrows:")
         st.markdown("---")
         st.markdown(
             '<h6>Made by <a href="https://jasonniebauer.com" style="text-decoration:underline;">Jason Niebauer</a></h6>',
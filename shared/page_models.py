@@ -0,0 +1,195 @@
+# ====================
+# Cached page models
+# ====================
+# Everything a page displays is built once per dataset version and shared by
+# all sessions, so a rerun only reads these records and renders them.
+from typing import NamedTuple
+import pandas as pd
+import streamlit as st
+from shared.chart_data import stacked_bars
+from shared.data_loader import get_dataset
+from shared.dataset import SalaryDataset
+from shared.processing import DivisionDetails, get_all_division_details
+from shared.taxonomy import DIVISION_TAXONOMY
+
+
+class OverviewPageModel(NamedTuple):
+    """Data shown on the overview page (streamlit_app.py)"""
+    total_divisions: int
+    total_city_salaries: float
+    total_city_employees: int
+    total_salaried_employees: int
+    total_part_time_employees: int
+    category_salaries: dict
+    division_category_salary_totals: pd.DataFrame
+    division_salary_totals: pd.DataFrame
+    employment_type_totals: pd.DataFrame
+    public_safety_employee_percentage: float
+    counts_df: pd.DataFrame
+    public_safety_full_time_employee_percentage: float
+    stronger_neighborhoods_part_time_employee_percentage: float
+    employment_type_by_division_category: pd.DataFrame
+    police_services_full_time_employee_percentage: float
+    employment_type_by_division: pd.DataFrame
+    employees_by_division: pd.DataFrame
+
+
+class CategoryPageModel(NamedTuple):
+    """Data shown on a Division Category page"""
+    total_salary: float
+    total_employees: int
+    total_full_time_employees: int
+    total_part_time_employees: int
+    employment_type_totals: pd.DataFrame
+    division_salary_totals: pd.DataFrame
+    salary_shares: dict[str, float]
+    divisions: dict[str, DivisionDetails]
+
+
+@st.cache_resource(show_spinner=False)
+def build_overview_page_model(_dataset: SalaryDataset, version: str) -> OverviewPageModel:
+    """
+    Build the overview page data for one dataset version.
+
+    :param _dataset: Shared dataset (not hashed)
+    :param version: Dataset version the model is cached against
+    """
+    cube = _dataset.cube
+
+    # Statistics for the whole city, and for each Division Category, Division, and Employment Type
+    city_totals = cube.total()
+    category_totals = cube.rollup(['Division Category'])
+    division_totals = cube.rollup(['Division Name'])
+    employment_type_totals = cube.rollup(['Employment Type'])
+
+    total_city_salaries = city_totals['Annual Salary']
+    total_city_employees = city_totals['Employees']
+    total_salaried_employees = employment_type_totals.loc['Full-time', 'Employees']
+    total_part_time_employees = employment_type_totals.loc['Part-time', 'Employees']
+
+    # Sum of all salaries in each Division Category, with its share of all city salaries
+    division_category_salary_totals = (
+        category_totals[['Annual Salary']]
+        .reset_index()
+        .sort_values(by='Annual Salary', ascending=False)
+    )
+    division_category_salary_totals['Percentage'] = division_category_salary_totals['Annual Salary'] / total_city_salaries
+
+    # Sum of all salaries in each Division
+    division_salary_totals = (
+        division_totals[['Annual Salary']]
+        .reset_index()
+        .sort_values(by='Annual Salary', ascending=False)
+    )
+
+    return OverviewPageModel(
+        total_divisions=len(division_totals),
+        total_city_salaries=total_city_salaries,
+        total_city_employees=total_city_employees,
+        total_salaried_employees=total_salaried_employees,
+        total_part_time_employees=total_part_time_employees,
+        category_salaries=category_totals['Annual Salary'].to_dict(),
+        division_category_salary_totals=division_category_salary_totals,
+        division_salary_totals=division_salary_totals,
+        employment_type_totals=cube.employment_type_totals(),
+        public_safety_employee_percentage=(
+            category_totals.loc['Public Safety', 'Employees'] / total_city_employees
+        ),
+        counts_df=(
+            category_totals['Employees']
+            .rename('Total Employees')
+            .reset_index()
+            .sort_values(by='Total Employees', ascending=False)
+        ),
+        public_safety_full_time_employee_percentage=(
+            cube.total(category='Public Safety', employment_type='Full-time')['Employees']
+            / total_salaried_employees
+        ) * 100,
+        stronger_neighborhoods_part_time_employee_percentage=(
+            cube.total(category='Stronger Neighborhoods', employment_type='Part-time')['Employees']
+            / total_part_time_employees
+        ) * 100,
+        # Stacked bar data, already in bar and segment order
+        employment_type_by_division_category=stacked_bars(
+            cube.rollup(['Division Category', 'Employment Type'])['Employees'].reset_index(name='Count'),
+            bar='Division Category',
+            segment='Employment Type',
+        ),
+        police_services_full_time_employee_percentage=(
+            cube.total(division='Police Services', employment_type='Full-time')['Employees']
+            / total_salaried_employees
+        ) * 100,
+        employment_type_by_division=stacked_bars(
+            cube.rollup(['Division Name', 'Employment Type'])['Employees'].reset_index(name='Count'),
+            bar='Division Name',
+            segment='Employment Type',
+        ),
+        employees_by_division=(
+            division_totals['Employees']
+            .rename('Count')
+            .reset_index()
+            .sort_values(by='Count', ascending=False)
+        ),
+    )
+
+@st.cache_resource(show_spinner=False)
+def build_category_page_model(_dataset: SalaryDataset, version: str, category: str, by: str) -> CategoryPageModel:
+    """
+    Build a Division Category page's data for one dataset version.
+
+    :param _dataset: Shared dataset (not hashed)
+    :param version: Dataset version the model is cached against
+    :param category: Division Category shown on the page
+    :param by: Column the page breaks salaries down by (Division Name or Division Group)
+    """
+    cube = _dataset.cube
+    totals = cube.total(category=category)
+    employment_type_totals = cube.employment_type_totals(category=category)
+    total_full_time_employees, total_part_time_employees = employment_type_totals['Count']
+
+    # Details for each sub-group and division on the page
+    division_details = get_all_division_details(_dataset, version)
+    divisions = {
+        name: division_details[name]
+        for group, group_divisions in DIVISION_TAXONOMY[category].items()
+        for name in [group, *group_divisions]
+        if name in division_details
+    }
+
+    # Share of the category's salaries paid in each sub-group and division
+    salary_shares = {
+        name: salary / totals['Annual Salary']
+        for dimension in ['Division Group', 'Division Name']
+        for name, salary in cube.rollup([dimension], category=category)['Annual Salary'].items()
+    }
+
+    return CategoryPageModel(
+        total_salary=totals['Annual Salary'],
+        total_employees=totals['Employees'],
+        total_full_time_employees=total_full_time_employees,
+        total_part_time_employees=total_part_time_employees,
+        employment_type_totals=employment_type_totals,
+        # Sum of all salaries in each division, largest first
+        division_salary_totals=(
+            cube.rollup([by], category=category)[['Annual Salary']]
+            .reset_index()
+            .sort_values(by='Annual Salary', ascending=False)
+        ),
+        salary_shares=salary_shares,
+        divisions=divisions,
+    )
+
+def get_overview_page_model() -> OverviewPageModel:
+    """Overview page data for the current dataset"""
+    dataset = get_dataset()
+    return build_overview_page_model(dataset, dataset.version)
+
+def get_category_page_model(category: str, by: str = 'Division Name') -> CategoryPageModel:
+    """
+    Division Category page data for the current dataset.
+
+    :param category: Division Category shown on the page
+    :param by: Column the page breaks salaries down by (Division Name or Division Group)
+    """
+    dataset = get_dataset()
+    return build_category_page_model(dataset, dataset.version, category, by)
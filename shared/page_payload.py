@@ -0,0 +1,78 @@
+# ====================
+# Per-page websocket payload
+# ====================
+# Measures what a browser receives per run of each page from a running app
+# (`streamlit run streamlit_app.py`), reporting its cached messages back the
+# way the browser does so reruns are measured after message caching.
+import asyncio
+import sys
+import pandas as pd
+from tornado.websocket import websocket_connect
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from shared.taxonomy import CATEGORY_SLUGS
+
+
+# Page names as the browser requests them, '' being the overview page
+PAGE_NAMES = [''] + list(CATEGORY_SLUGS.values())
+
+
+async def measure_page(url: str, page_name: str, runs: int = 3) -> dict:
+    """
+    Bytes received for each run of one page in a single session.
+
+    :param url: App websocket URL, e.g. ws://localhost:8501/_stcore/stream
+    :param page_name: Page name, '' for the overview page
+    :param runs: Number of runs, the first being the initial page load
+    """
+    connection = await websocket_connect(url, subprotocols=['streamlit'])
+    cached_hashes = set()
+    result = {'Page': page_name or 'overview'}
+
+    for run in range(runs):
+        request = BackMsg()
+        request.rerun_script.page_name = page_name
+        request.rerun_script.cached_message_hashes.extend(sorted(cached_hashes))
+        await connection.write_message(request.SerializeToString(), binary=True)
+
+        total_bytes = style_bytes = 0
+        while True:
+            raw = await connection.read_message()
+            msg = ForwardMsg()
+            msg.ParseFromString(raw)
+            if msg.WhichOneof('type') == 'new_session':
+                continue
+            total_bytes += len(raw)
+            if msg.WhichOneof('type') == 'delta' and msg.delta.WhichOneof('type') == 'new_element':
+                if msg.delta.new_element.markdown.body.startswith('<style>'):
+                    style_bytes += len(raw)
+                if msg.metadata.cacheable:
+                    cached_hashes.add(msg.hash)
+            if msg.WhichOneof('type') == 'script_finished':
+                break
+
+        label = 'First run' if run == 0 else f'Rerun {run}'
+        result[f'{label} (KB)'] = total_bytes / 1024
+        result[f'{label} styles (B)'] = style_bytes
+
+    connection.close()
+    return result
+
+def measure_pages(port: int = 8501, runs: int = 3) -> pd.DataFrame:
+    """
+    Websocket payload for every page of an app running on localhost.
+
+    :param port: Port the app is served on
+    :param runs: Number of runs per page
+    """
+    url = f'ws://localhost:{port}/_stcore/stream'
+
+    async def measure_all():
+        return [await measure_page(url, page_name, runs) for page_name in PAGE_NAMES]
+
+    return pd.DataFrame(asyncio.run(measure_all()))
+
+
+if __name__ == '__main__':
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8501
+    print(measure_pages(port, runs=2).round(1).to_string(index=False))
@@ -0,0 +1,62 @@
+# ====================
+# Per-page script timing
+# ====================
+import statistics
+import time
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+from shared.chart_cache import get_chart_spec_cache
+from shared.taxonomy import CATEGORY_SLUGS
+
+
+# Entry script and the pages reached from it
+APP_SCRIPT = 'streamlit_app.py'
+PAGES = [None] + [f'pages/{slug}.py' for slug in CATEGORY_SLUGS.values()]
+
+
+def time_page(page: str = None, reruns: int = 10) -> dict:
+    """
+    Time one page's script: the first run, then reruns in the same session.
+
+    :param page: Page script path, or None for the overview page
+    :param reruns: Number of reruns to time after the first run
+    """
+    app = AppTest.from_file(APP_SCRIPT, default_timeout=60)
+    if page:
+        app.switch_page(page)
+
+    timings = []
+    for _ in range(reruns + 1):
+        start = time.perf_counter()
+        app.run()
+        timings.append(time.perf_counter() - start)
+        if app.exception:
+            raise RuntimeError(f"{page or APP_SCRIPT} raised: {app.exception[0].value}")
+        # AppTest only sends single-select segmented controls back as a list,
+        # and an empty one as an empty list
+        for control in app.button_group:
+            if control.value is None:
+                control.set_value([])
+            elif isinstance(control.value, str):
+                control.set_value([control.value])
+
+    return {
+        'Page': page or APP_SCRIPT,
+        'First run (ms)': timings[0] * 1e3,
+        'Median rerun (ms)': statistics.median(timings[1:]) * 1e3,
+    }
+
+def time_pages(reruns: int = 10) -> pd.DataFrame:
+    """
+    Script execution time for every page, run from the repository root.
+
+    :param reruns: Number of reruns to time per page
+    """
+    return pd.DataFrame([time_page(page, reruns) for page in PAGES])
+
+
+if __name__ == '__main__':
+    print(time_pages().round(1).to_string(index=False))
+    print()
+    # Every page's charts are served from the spec cache after its first run
+    print(pd.Series(get_chart_spec_cache().stats()).round(3).to_string())
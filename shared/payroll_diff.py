@@ -0,0 +1,325 @@
+# ====================
+# Year-over-year payroll diff
+# ====================
+# Two payroll snapshots are compared person by person. Rows are matched by
+# hash joins on integer keys: first on normalized Person Name + Division
+# Name, then the rows left over on Person Name + Job Title, which finds
+# people who moved division. The n-th row of a key in one snapshot pairs
+# with the n-th in the other, so namesakes in one division still pair one
+# to one. Unmatched rows are hires and separations. Every per-division
+# delta is computed once per pair of snapshots and cached.
+import sys
+import time
+from typing import NamedTuple
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import streamlit as st
+from shared.aggregates import to_dollars
+from shared.dataset import SalaryDataset
+
+
+# Status of each person in a diff
+STAYED = 'Stayed'
+TRANSFERRED = 'Transferred'
+HIRED = 'Hired'
+SEPARATED = 'Separated'
+STATUSES = [STAYED, TRANSFERRED, HIRED, SEPARATED]
+
+# Columns of PayrollDiff.divisions and PayrollDiff.totals
+DELTA_COLUMNS = [
+    'Employees Before',
+    'Employees After',
+    'Headcount Change',
+    'Hires',
+    'Separations',
+    'Transfers In',
+    'Transfers Out',
+    'Title Changes',
+    'Payroll Before',
+    'Payroll After',
+    'Payroll Change',
+    'Median Raise',
+    'Median Raise %',
+]
+
+
+class PayrollDiff(NamedTuple):
+    """Changes between two payroll snapshots"""
+    before: str                     # Snapshot keys, e.g. '2024' and '2025'
+    after: str
+    divisions: pd.DataFrame         # DELTA_COLUMNS by Division Name; pay in dollars
+    totals: pd.Series               # DELTA_COLUMNS for the whole city
+    people: pd.DataFrame            # One row per person: Status, Person Name, Division, Job Title,
+                                    # Annual Salary and Hourly Rate Before and After, Raise, Raise %
+
+
+def name_keys(names: pd.Series) -> pd.Series:
+    """
+    Person names normalized for matching: lowercase ASCII words separated
+    by single spaces, like directory.normalize, so 'O'Neal, José' and
+    'Oneal, Jose' match.
+
+    :param names: Person Name column
+    """
+    values = pc.fill_null(pa.array(names.astype(pd.StringDtype('pyarrow')).array), '')
+    # Most names are plain ASCII; decomposing accents is only paid for if any aren't
+    if not pc.all(pc.string_is_ascii(values)).as_py():
+        values = pc.utf8_normalize(values, 'NFKD')
+        values = pc.replace_substring_regex(values, r'[^\x00-\x7f]', '')
+    values = pc.ascii_lower(values)
+    values = pc.replace_substring(pc.replace_substring(values, "'", ''), '`', '')
+    values = pc.utf8_trim_whitespace(pc.replace_substring_regex(values, r'[^a-z0-9]+', ' '))
+    # Typed explicitly: no names leave no chunk to take the type from
+    return pd.Series(pd.arrays.ArrowStringArray(pa.chunked_array([values], type=pa.large_string())), index=names.index)
+
+def _joint_codes(before: pd.Series, after: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    # Integer codes of two columns' values, equal values getting equal codes in both
+    if isinstance(before.dtype, pd.CategoricalDtype) and isinstance(after.dtype, pd.CategoricalDtype):
+        categories = before.cat.categories.union(after.cat.categories)
+        return (
+            before.cat.set_categories(categories).cat.codes.to_numpy().astype(np.int64),
+            after.cat.set_categories(categories).cat.codes.to_numpy().astype(np.int64),
+        )
+    codes, _ = pd.factorize(pd.concat([before, after], ignore_index=True))
+    return codes[:len(before)].astype(np.int64), codes[len(before):].astype(np.int64)
+
+def _composite(columns: list[np.ndarray]) -> np.ndarray:
+    # One int64 key per row from several code columns (codes are >= -1)
+    keys = np.zeros(len(columns[0]), dtype=np.int64)
+    for codes in columns:
+        keys = keys * (int(codes.max(initial=0)) + 2) + (codes + 1)
+    return keys
+
+def _occurrence(keys: np.ndarray) -> np.ndarray:
+    # 0 for the first row of each key, 1 for the second, and so on, in row order
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(np.concatenate([[True], sorted_keys[1:] != sorted_keys[:-1]]))
+    run_starts = np.repeat(starts, np.diff(np.append(starts, len(keys))))
+    occurrence = np.empty(len(keys), dtype=np.int64)
+    occurrence[order] = np.arange(len(keys)) - run_starts
+    return occurrence
+
+def hash_join(before_keys: list[np.ndarray], after_keys: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Positions of the rows paired by equal keys, the n-th row of a key in one
+    side with the n-th in the other. A hash table of the after keys is probed
+    with the before keys.
+
+    :param before_keys: Key code columns of the before rows, coded jointly with the after rows
+    :param after_keys: The same key code columns of the after rows
+    """
+    # Keys of both sides packed together, so equal keys pack to equal integers
+    size = len(before_keys[0])
+    keys = _composite([np.concatenate([b, a]) for b, a in zip(before_keys, after_keys)])
+    occurrence = np.concatenate([_occurrence(keys[:size]), _occurrence(keys[size:])])
+    keys = _composite([keys, occurrence])
+    before, after = keys[:size], keys[size:]
+    # (key, occurrence) is unique on each side, so the index is a plain hash table
+    after_positions = pd.Index(after).get_indexer(before)
+    matched = after_positions >= 0
+    return np.flatnonzero(matched), after_positions[matched]
+
+
+def match_people(before: pd.DataFrame, after: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pairs of rows that are the same person in two snapshots.
+
+    Returns before positions, after positions, and for each pair whether it
+    was matched on name + division (True) or only on name + job title.
+
+    :param before: Earlier payroll frame
+    :param after: Later payroll frame
+    """
+    # Names repeat from one year to the next, so each distinct one is normalized once
+    raw_codes, raw_names = pd.factorize(pd.concat([before['Person Name'], after['Person Name']], ignore_index=True))
+    key_codes, _ = pd.factorize(name_keys(pd.Series(raw_names)))
+    codes = key_codes[raw_codes].astype(np.int64)
+    # A missing name matches nobody
+    missing = raw_codes < 0
+    codes[missing] = len(raw_names) + np.arange(missing.sum())
+    names = codes[:len(before)], codes[len(before):]
+    divisions = _joint_codes(before['Division Name'], after['Division Name'])
+    titles = _joint_codes(before['Job Title'], after['Job Title'])
+
+    before_pairs, after_pairs = hash_join([names[0], divisions[0]], [names[1], divisions[1]])
+
+    # Fallback on the rows not matched yet: same name and title, another division
+    before_left = np.setdiff1d(np.arange(len(before)), before_pairs, assume_unique=True)
+    after_left = np.setdiff1d(np.arange(len(after)), after_pairs, assume_unique=True)
+    moved_before, moved_after = hash_join(
+        [names[0][before_left], titles[0][before_left]],
+        [names[1][after_left], titles[1][after_left]],
+    )
+    return (
+        np.concatenate([before_pairs, before_left[moved_before]]),
+        np.concatenate([after_pairs, after_left[moved_after]]),
+        np.concatenate([np.ones(len(before_pairs), dtype=bool), np.zeros(len(moved_before), dtype=bool)]),
+    )
+
+def _take(column: pd.Series, positions: np.ndarray) -> pd.Series:
+    # Values at some row positions, missing where the position is -1
+    return pd.Series(column.array.take(positions, allow_fill=True))
+
+def diff_payrolls(before: pd.DataFrame, after: pd.DataFrame, before_key: str = 'before', after_key: str = 'after') -> PayrollDiff:
+    """
+    Compare two payroll snapshots.
+
+    :param before: Earlier payroll frame
+    :param after: Later payroll frame
+    :param before_key: Name of the earlier snapshot
+    :param after_key: Name of the later snapshot
+    """
+    before_pairs, after_pairs, same_division = match_people(before, after)
+    separated = np.setdiff1d(np.arange(len(before)), before_pairs, assume_unique=True)
+    hired = np.setdiff1d(np.arange(len(after)), after_pairs, assume_unique=True)
+
+    # Row of each person in either snapshot, -1 where they aren't in it
+    before_positions = np.concatenate([before_pairs, np.full(len(hired), -1), separated])
+    after_positions = np.concatenate([after_pairs, hired, np.full(len(separated), -1)])
+    status = np.concatenate([
+        np.where(same_division, STAYED, TRANSFERRED),
+        np.full(len(hired), HIRED),
+        np.full(len(separated), SEPARATED),
+    ])
+
+    people = pd.DataFrame({
+        'Status': pd.Categorical(status, categories=STATUSES),
+        'Person Name': _take(after['Person Name'], after_positions).fillna(_take(before['Person Name'], before_positions)),
+    })
+    for column, label in [('Division Name', 'Division'), ('Job Title', 'Job Title')]:
+        # Both snapshots' values in one set of categories, so they compare
+        categories = before[column].cat.categories.union(after[column].cat.categories, sort=False)
+        people[f'{label} Before'] = _take(before[column].cat.set_categories(categories), before_positions)
+        people[f'{label} After'] = _take(after[column].cat.set_categories(categories), after_positions)
+    for column, label in [('Annual Salary', 'Annual Salary'), ('Hourly/Per Event Rate', 'Hourly Rate')]:
+        people[f'{label} Before'] = to_dollars(_take(before[column], before_positions))
+        people[f'{label} After'] = to_dollars(_take(after[column], after_positions))
+    people['Raise'] = people['Annual Salary After'] - people['Annual Salary Before']
+    people['Raise %'] = people['Raise'] / people['Annual Salary Before']
+
+    codes = [people[f'Division {side}'].cat.codes.to_numpy().astype(np.int64) for side in ['Before', 'After']]
+    city = [np.where(side >= 0, 0, -1) for side in codes]
+    divisions = _deltas(people, *codes, people['Division Before'].cat.categories)
+    return PayrollDiff(
+        before=before_key,
+        after=after_key,
+        # Divisions in neither snapshot are left out
+        divisions=divisions[(divisions['Employees Before'] > 0) | (divisions['Employees After'] > 0)],
+        # Always one row, all zeros if both snapshots are empty; as objects,
+        # so counts stay integers next to the dollar amounts
+        totals=_deltas(people, *city, pd.Index(['City'])).astype(object).iloc[0],
+        people=people,
+    )
+
+def _deltas(people: pd.DataFrame, before_codes: np.ndarray, after_codes: np.ndarray, labels: pd.Index) -> pd.DataFrame:
+    # DELTA_COLUMNS for each label, given each person's label before and after
+    # as codes into labels (-1 where not in that snapshot). Before figures
+    # count by the earlier label and after figures by the later one. Every
+    # label gets a row, even with nobody in it.
+    size = len(labels)
+
+    def count(mask, codes):
+        return np.bincount(codes[mask & (codes >= 0)], minlength=size)
+
+    def total(values, codes):
+        present = (codes >= 0) & ~np.isnan(values)
+        return np.bincount(codes[present], weights=values[present], minlength=size)
+
+    status = people['Status'].cat.codes.to_numpy()
+    everyone = np.ones(len(people), dtype=bool)
+    moved = status == STATUSES.index(TRANSFERRED)
+    titles = [people[f'Job Title {side}'].cat.codes.to_numpy() for side in ['Before', 'After']]
+    raised = people['Raise'].notna().to_numpy()
+    raises = people.loc[raised, ['Raise', 'Raise %']].groupby(after_codes[raised]).median().reindex(range(size))
+
+    deltas = pd.DataFrame({
+        'Employees Before': count(everyone, before_codes),
+        'Employees After': count(everyone, after_codes),
+        'Hires': count(status == STATUSES.index(HIRED), after_codes),
+        'Separations': count(status == STATUSES.index(SEPARATED), before_codes),
+        'Transfers In': count(moved, after_codes),
+        'Transfers Out': count(moved, before_codes),
+        'Title Changes': count((titles[0] >= 0) & (titles[1] >= 0) & (titles[0] != titles[1]), after_codes),
+        'Payroll Before': total(people['Annual Salary Before'].to_numpy(), before_codes),
+        'Payroll After': total(people['Annual Salary After'].to_numpy(), after_codes),
+        'Median Raise': raises['Raise'].to_numpy(),
+        'Median Raise %': raises['Raise %'].to_numpy(),
+    }, index=labels.rename('Division Name'))
+    deltas['Headcount Change'] = deltas['Employees After'] - deltas['Employees Before']
+    deltas['Payroll Change'] = deltas['Payroll After'] - deltas['Payroll Before']
+    return deltas[DELTA_COLUMNS]
+
+
+@st.cache_resource(show_spinner="Comparing payroll snapshots...", max_entries=8)
+def build_payroll_diff(_before: SalaryDataset, _after: SalaryDataset, before_key: str, after_key: str,
+                       before_version: str, after_version: str) -> PayrollDiff:
+    """
+    Diff of two snapshots, computed once per pair of dataset versions and
+    shared by all sessions.
+
+    :param _before: Earlier dataset (not hashed)
+    :param _after: Later dataset (not hashed)
+    :param before_key: Earlier snapshot key
+    :param after_key: Later snapshot key
+    :param before_version: Version the earlier dataset is cached against
+    :param after_version: Version the later dataset is cached against
+    """
+    return diff_payrolls(_before.frame, _after.frame, before_key, after_key)
+
+def get_payroll_diff(before: str, after: str) -> PayrollDiff:
+    """
+    Diff of two payroll snapshots, loading each the first time it is needed.
+
+    :param before: Earlier snapshot key, e.g. '2024'
+    :param after: Later snapshot key
+    """
+    from shared.data_loader import get_dataset
+
+    before_dataset, after_dataset = get_dataset(before), get_dataset(after)
+    return build_payroll_diff(before_dataset, after_dataset, before, after, before_dataset.version, after_dataset.version)
+
+
+def synthetic_year(df: pd.DataFrame, seed: int = 0, turnover: float = 0.1) -> pd.DataFrame:
+    """
+    A plausible next year of a payroll, for trying the diff out: some people
+    leave and are replaced, some move division, some change title, and
+    salaries get raises.
+
+    :param df: Payroll frame
+    :param seed: Random seed
+    :param turnover: Share of people who leave, and of people hired
+    """
+    rng = np.random.default_rng(seed)
+    df = df.copy()
+    leaving = rng.random(len(df)) < turnover
+    # Hires take over the leavers' jobs under new names
+    df['Person Name'] = df['Person Name'].where(~leaving, pd.Series([f"Hire, Person {i}" for i in range(len(df))], dtype=df['Person Name'].dtype))
+    moving = ~leaving & (rng.random(len(df)) < 0.02)
+    df['Division Name'] = df['Division Name'].where(~moving, rng.choice(df['Division Name'].cat.categories, len(df)))
+    promoted = ~leaving & ~moving & (rng.random(len(df)) < 0.05)
+    df['Job Title'] = df['Job Title'].where(~promoted, rng.choice(df['Job Title'].cat.categories, len(df)))
+    raises = 1 + rng.normal(0.03, 0.02, len(df)).clip(0, None)
+    df['Annual Salary'] = (df['Annual Salary'].astype('float64') * raises).round().astype('Int64')
+    return df
+
+
+if __name__ == '__main__':
+    from shared.data_loader import get_dataset
+
+    frame = get_dataset().frame
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else len(frame)
+    if rows != len(frame):
+        # Real rows resampled, with made-up names so people stay distinct
+        frame = frame.sample(rows, replace=True, random_state=0, ignore_index=True)
+        frame['Person Name'] = pd.Series([f"Employee, Number {i}" for i in range(rows)], dtype=frame['Person Name'].dtype)
+    later = synthetic_year(frame)
+
+    start = time.perf_counter()
+    diff = diff_payrolls(frame, later, 'before', 'after')
+    print(f"Compared {rows:,} rows with {len(later):,} in {time.perf_counter() - start:.2f}s")
+    print(diff.people['Status'].value_counts().to_string())
+    print(diff.divisions.round(3).to_string())
+    print(diff.totals.round(3).to_string())
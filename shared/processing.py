@@ -1,81 +1,85 @@
 # Data processing utilities
 
 # Library imports
+from typing import NamedTuple
 import pandas as pd
-from shared.data_loader import initialize_data
+import streamlit as st
+from shared.aggregates import employment_type_frame
+from shared.data_loader import get_dataset
+from shared.dataset import SalaryDataset
 
 
-# Get data from session state
-SOURCE_DF = initialize_data()
+class DivisionDetails(NamedTuple):
+    """Summary statistics for one division or sub-group (e.g. Governance, Legal)"""
+    top_paying_job: str
+    max_salary: float
+    min_salary: float
+    top_paying_part_time_job: str
+    max_hourly_rate: float
+    min_hourly_rate: float
+    average_salary: float
+    average_hourly_rate: float
+    total_unique_jobs: int
+    total_employees: int
+    total_full_time_employees: int
+    total_part_time_employees: int
+    employment_type_totals: pd.DataFrame
 
-def get_division_details(division):
-    """"""
-    # Make a copy of the original DataFrame
-    df = SOURCE_DF.copy()
 
-    # Check if division a category from Good Government
-    if division in ['Governance', 'Legal']:
-        # Define Governance and Legal category groups of divisions
-        governance = ['Executive', 'Legislative', 'Judicial']
-        legal = ['City Attorney', 'City Court Clerk']
+@st.cache_resource(show_spinner=False)
+def get_all_division_details(_dataset: SalaryDataset, version: str) -> dict:
+    """
+    Details for every division and sub-group, computed together once per
+    dataset version.
 
-        # Filter employees to only those in the category specified
-        if division == 'Governance':
-            df = df[df['Division Name'].isin(governance)]
-        elif division == 'Legal':
-            df = df[df['Division Name'].isin(legal)]
-    else:    
-        # Filter employees to only those in the division specified
-        df = df[df['Division Name'] == division]
+    :param _dataset: Shared dataset (not hashed)
+    :param version: Dataset version the details are cached against
+    """
+    details = {}
+    # Divisions first, so a sub-group named after its only division doesn't replace it
+    for dimension in ['Division Name', 'Division Group']:
+        totals = _dataset.cube.rollup([dimension])
+        employment_types = (
+            _dataset.cube.rollup([dimension, 'Employment Type'])['Employees']
+            .unstack(fill_value=0)
+        )
+        for name, row in totals.to_dict('index').items():
+            if name in details:
+                continue
+            employment_type_totals = employment_type_frame(employment_types.loc[name])
+            total_full_time_employees, total_part_time_employees = employment_type_totals['Count']
+            details[name] = DivisionDetails(
+                top_paying_job=row['Top Paying Job'],
+                max_salary=row['Max Salary'],
+                min_salary=row['Min Salary'],
+                top_paying_part_time_job=row['Top Paying Part-Time Job'],
+                max_hourly_rate=row['Max Hourly Rate'],
+                min_hourly_rate=row['Min Hourly Rate'],
+                average_salary=row['Average Salary'],
+                average_hourly_rate=row['Average Hourly Rate'],
+                total_unique_jobs=row['Job Titles'],
+                total_employees=row['Employees'],
+                total_full_time_employees=total_full_time_employees,
+                total_part_time_employees=total_part_time_employees,
+                employment_type_totals=employment_type_totals,
+            )
+    return details
 
-    # Get the highest salary for the division
-    max_salary = df['Annual Salary'].max()
-    # Get the lowest salary for the division
-    min_salary = df['Annual Salary'].min()
-    # Get the job paying the highest salary
-    top_paying_job = df.loc[df['Annual Salary'].idxmax(), 'Job Title']
-    # Get the highest hourly rate
-    max_hourly_rate = df['Hourly/Per Event Rate'].max()
-    # Get the lowest hourly rate
-    min_hourly_rate = df['Hourly/Per Event Rate'].min()
-    # Get the job paying the highest hourly rate
-    top_paying_part_time_job = df.loc[df['Hourly/Per Event Rate'].idxmax(), 'Job Title']
-    # Get the average of all annual salaries
-    average_salary = df['Annual Salary'].mean()
-    # Get the average of all hourly rates
-    average_hourly_rate = df['Hourly/Per Event Rate'].mean()
-    # Get the total number of unique jobs
-    total_unique_jobs = len(df['Job Title'].unique())
-    # Get total number of employees
-    total_employees = len(df)
-    # Get total number of full-time employees
-    total_full_time_employees = (df['Employment Type'] == 'Full-time').sum()
-    # Get total number of part-time employees
-    total_part_time_employees = (df['Employment Type'] == 'Part-time').sum()
+def get_division_details(division) -> DivisionDetails:
+    """
+    Details for a division, or a sub-group of divisions (e.g. Governance, Legal).
 
-    # Create DataFrame for categorizing employees by employment type
-    return (
-        top_paying_job,
-        max_salary,
-        min_salary,
-        top_paying_part_time_job,
-        max_hourly_rate,
-        min_hourly_rate,
-        average_salary,
-        average_hourly_rate,
-        total_unique_jobs,
-        total_employees,
-        total_full_time_employees,
-        total_part_time_employees,
-        pd.DataFrame({
-            "Employment Type": ["Full-time", "Part-time"],
-            "Value": [
-                total_full_time_employees / total_employees,
-                total_part_time_employees / total_employees
-            ],
-            "Count": [
-                total_full_time_employees,
-                total_part_time_employees
-            ]
-        })
-    )
\ No newline at end of file
+    :param division: Division Name or Division Group
+    """
+    dataset = get_dataset()
+    return get_all_division_details(dataset, dataset.version)[division]
+
+def warm_up() -> SalaryDataset:
+    """
+    Load the shared dataset and precompute division details ahead of the
+    first page that needs them. Nothing is loaded on import, so batch jobs
+    and workers can call this (or nothing at all) when it suits them.
+    """
+    dataset = get_dataset()
+    get_all_division_details(dataset, dataset.version)
+    return dataset
@@ -0,0 +1,112 @@
+# ====================
+# Query result cache
+# ====================
+# Explorer slices (and anything else computed from a filter) are cached once
+# per process, keyed by the dataset version and a canonical form of the
+# filter, so sessions asking for the same slice share one result. Keys are
+# small tuples: unlike st.cache_data, nothing hashes a DataFrame argument on
+# each call. The cache is bounded by the memory its results take, evicting
+# the least recently used first (see shared/bounded_cache.py).
+import sys
+import time
+from typing import Callable, Hashable
+import numpy as np
+import pandas as pd
+import streamlit as st
+from shared.bounded_cache import BoundedCache
+from shared.data_loader import get_dataset
+
+
+# Memory the cached results may take, in bytes
+RESULT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def result_size(value) -> int:
+    """
+    Approximate memory taken by a cached result, in bytes: frames, arrays and
+    containers of them (tuples, NamedTuples, lists, dicts), and scalars.
+
+    :param value: Result to measure
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(result_size(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(result_size(k) + result_size(v) for k, v in value.items())
+    return sys.getsizeof(value)
+
+
+class ResultCache(BoundedCache):
+    """
+    Process-wide LRU store of query results bounded by bytes.
+
+    :param max_bytes: Memory the cached results may take
+    """
+
+    def __init__(self, max_bytes: int = RESULT_CACHE_BYTES):
+        super().__init__(max_bytes, result_size)
+
+    def get(self, version: str, query: str, key: Hashable, compute: Callable[[], object]):
+        """
+        Result of a query, computed with compute() when it isn't cached.
+        Results are shared between sessions and must not be modified.
+
+        :param version: Dataset version the result is computed from
+        :param query: Name of the query, e.g. 'explorer/summary'
+        :param key: Canonical, hashable form of the query's parameters
+        :param compute: Function returning the result
+        """
+        return self.lookup((version, query, key), compute)
+
+
+@st.cache_resource
+def get_result_cache() -> ResultCache:
+    """Query result cache shared by all sessions"""
+    return ResultCache()
+
+def cached_result(query: str, key: Hashable, compute: Callable[[], object]):
+    """
+    Result of a query on the current dataset, from the shared result cache.
+
+    :param query: Name of the query, e.g. 'explorer/summary'
+    :param key: Canonical, hashable form of the query's parameters
+    :param compute: Function returning the result, called only on a cache miss
+    """
+    return get_result_cache().get(get_dataset().version, query, key, compute)
+
+
+if __name__ == '__main__':
+    from shared.explorer import ExplorerFilter, ExplorerIndex
+
+    dataset = get_dataset()
+    index = ExplorerIndex(dataset.frame)
+    rng = np.random.default_rng(0)
+
+    # A few hundred distinct slices, a handful of them asked for far more often
+    labels = {column: list(index.bitmaps.labels[column]) for column in ['Division Category', 'Division Name', 'Employment Type']}
+    slices = [
+        ExplorerFilter(
+            categories=tuple(rng.choice(labels['Division Category'], rng.integers(0, 3), replace=False)),
+            divisions=tuple(rng.choice(labels['Division Name'], rng.integers(0, 2), replace=False)),
+            employment_types=tuple(rng.choice(labels['Employment Type'], rng.integers(0, 2), replace=False)),
+        )
+        for _ in range(300)
+    ]
+    requests = rng.zipf(1.3, 5000) % len(slices)
+
+    max_bytes = int(sys.argv[1]) if len(sys.argv) > 1 else 2 * 1024 * 1024
+    cache = ResultCache(max_bytes)
+    start = time.perf_counter()
+    for i in requests:
+        spec = index.canonical(slices[i])
+        cache.get(dataset.version, 'explorer/summary', spec, lambda: index.summarize(index.filter(spec)))
+    elapsed = time.perf_counter() - start
+
+    uncached = len(requests) * cache.compute_seconds / max(cache.misses, 1)
+    print(f"{len(requests):,} requests in {elapsed:.2f}s (about {uncached:.2f}s without the cache)")
+    print(pd.Series(cache.stats()).round(3).to_string())
@@ -0,0 +1,281 @@
+# ====================
+# Static site export
+# ====================
+# The payroll snapshot never changes between deploys, so every page can be
+# rendered once, offline, to plain HTML: narrative, metrics and tables as
+# markup, charts as embedded Vega-Lite specs. The pages' own scripts are run
+# with Streamlit's AppTest and their element trees written out, so the export
+# always matches the live app. Pages built around widgets (the explorer, pay
+# distribution, directory and year over year) need a live session, so their
+# sidebar links point at the live app instead. Serve the output with any
+# static file server, mapping /<page> to <page>.html (nginx: try_files $uri
+# $uri.html =404).
+import html
+import json
+import re
+import shutil
+import sys
+from pathlib import Path
+import pyarrow as pa
+from streamlit.proto.Block_pb2 import Block
+from streamlit.proto.GapSize_pb2 import GapSize
+from streamlit.testing.v1 import AppTest
+from shared.data_server import STATIC_EXPORT
+from shared.navigation import STATIC_DIR
+from shared.styles import build_stylesheet
+from shared.taxonomy import CATEGORY_SLUGS
+
+
+APP_SCRIPT = 'streamlit_app.py'
+# Where the pages left out of the export are linked to
+LIVE_APP_URL = 'https://memphisinsights.com'
+
+# Output file, page script and stylesheet of each page
+PAGES = [('index.html', None, 'overview')] + [
+    (f'{slug}.html', f'pages/{slug}.py', slug) for slug in CATEGORY_SLUGS.values()
+]
+# URL paths of the exported pages, as page links give them
+EXPORTED_PATHS = {'' if page is None else filename.removesuffix('.html') for filename, page, _ in PAGES}
+
+# Approximates Streamlit's layout for the elements the pages use
+LAYOUT_CSS = """
+body { margin: 0; font-family: "Source Sans Pro", sans-serif; color: #202124; display: flex; }
+aside { width: 18rem; min-height: 100vh; padding: 1.5rem 1rem; background: #F1F3F4; box-sizing: border-box; flex-shrink: 0; }
+main { flex: 1; max-width: 80rem; padding: 0 3rem 4rem; box-sizing: border-box; min-width: 0; }
+a { color: #202124; }
+.row { display: flex; flex-wrap: wrap; gap: 1rem; width: 100%; }
+.stack { display: flex; flex-direction: column; gap: 0.5rem; }
+.row.gap-large { gap: 2rem; }
+.row.gap-xlarge { gap: 4rem; }
+.column { flex: 1 1 0; min-width: 15rem; }
+.space { height: 1.5rem; }
+.chart { width: 100%; }
+[data-testid="stText"] { white-space: pre-wrap; margin: 0 0 1rem; }
+[data-testid="stCaptionContainer"] { color: #5F6368; font-size: 0.875rem; }
+[data-testid="stMetric"] { margin-bottom: 1rem; }
+[data-testid="stMetricLabel"] { font-size: 0.875rem; }
+[data-testid="stMetricValue"] { font-size: 2.25rem; }
+[data-testid="stMetricDelta"] { display: inline-block; padding: 0 0.5rem; border-radius: 1rem; font-size: 0.875rem; }
+[data-testid="stPageLink-NavLink"] { display: flex; gap: 0.5rem; align-items: center; padding: 0.25rem 0.5rem; text-decoration: none; }
+.stAlert [data-baseweb="notification"] { display: flex; gap: 0.5rem; padding: 1rem; border-radius: 0.5rem; }
+span.stMarkdownBadge { display: inline-flex; gap: 0.25rem; align-items: center; padding: 0 0.5rem; border-radius: 0.5rem; font-size: 0.875rem; }
+.material-symbols-rounded { font-size: 1.25em; vertical-align: middle; }
+"""
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<base href="{base_url}">
+<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Source+Sans+Pro:wght@400;600&display=swap">
+<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Material+Symbols+Rounded">
+<script src="https://cdn.jsdelivr.net/npm/vega@6"></script>
+<script src="https://cdn.jsdelivr.net/npm/vega-lite@6"></script>
+<script src="https://cdn.jsdelivr.net/npm/vega-embed@7"></script>
+<style>{layout_css}</style>
+{stylesheet}
+</head>
+<body>
+<aside>
+{sidebar}
+</aside>
+<main>
+{main}
+</main>
+<script>
+document.querySelectorAll('.chart').forEach(function (element) {{
+    vegaEmbed(element, JSON.parse(element.dataset.spec), {{actions: false}});
+}});
+</script>
+</body>
+</html>
+"""
+
+# Inline markdown the pages use, applied in order
+INLINE_MARKDOWN = [
+    (re.compile(r':material/([a-z0-9_]+):'), r'<span class="material-symbols-rounded">\1</span>'),
+    (re.compile(r':[a-z]+-badge\[(.*?)\]'), r'<span class="stMarkdownBadge">\1</span>'),
+    (re.compile(r'\*\*(.+?)\*\*'), r'<strong>\1</strong>'),
+    (re.compile(r'\[([^\]]+)\]\(([^)]+)\)'), r'<a href="\2">\1</a>'),
+]
+
+
+def _inline(text: str) -> str:
+    for pattern, replacement in INLINE_MARKDOWN:
+        text = pattern.sub(replacement, text)
+    return text
+
+def markdown_to_html(text: str) -> str:
+    """
+    Convert the subset of markdown used by the pages: headings, bullet
+    lists, rules, paragraphs, raw HTML blocks, bold, links, badges and
+    material icons.
+
+    :param text: Markdown body of an st.markdown element
+    """
+    blocks = []
+    for block in re.split(r'\n\s*\n', text.strip()):
+        lines = [line.strip() for line in block.strip().splitlines()]
+        if not lines or not lines[0]:
+            continue
+        if lines[0].startswith('<'):
+            blocks.append(_inline(block.strip()))
+            continue
+
+        paragraph, items = [], []
+        for line in lines + ['']:
+            heading = re.match(r'(#{1,6})\s+(.*)', line)
+            if paragraph and (heading or line.startswith('- ') or line == '---' or not line):
+                blocks.append(f'<p>{_inline(" ".join(paragraph))}</p>')
+                paragraph = []
+            if line.startswith('- '):
+                items.append(f'<li>{_inline(line[2:])}</li>')
+                continue
+            if items:
+                blocks.append('<ul>' + ''.join(items) + '</ul>')
+                items = []
+            if heading or line == '---' or not line:
+                if heading:
+                    level = len(heading.group(1))
+                    blocks.append(f'<h{level}>{_inline(heading.group(2))}</h{level}>')
+                elif line == '---':
+                    blocks.append('<hr>')
+            else:
+                paragraph.append(line)
+    return '\n'.join(blocks)
+
+def _records(arrow_bytes: bytes) -> list[dict]:
+    table = pa.ipc.open_stream(arrow_bytes).read_all()
+    # Drop the pandas index Streamlit serializes along with the data
+    return table.select([name for name in table.column_names if not name.startswith('__index_level_')]).to_pylist()
+
+def _chart_spec(proto) -> dict:
+    # Put the chart's Arrow datasets back into the spec as inline values
+    spec = json.loads(proto.spec)
+    if proto.datasets:
+        spec['datasets'] = {dataset.name: _records(dataset.data.data) for dataset in proto.datasets}
+    if proto.data.data:
+        spec['data'] = {'values': _records(proto.data.data)}
+    spec.setdefault('width', 'container')
+    return spec
+
+def render_node(node, live_app_url: str = LIVE_APP_URL) -> str:
+    """
+    HTML for one node of an AppTest element tree and its children.
+
+    :param node: Element or block from AppTest
+    :param live_app_url: Where links to pages that aren't exported point
+    """
+    kind = getattr(node, 'type', None)
+    proto = getattr(node, 'proto', None)
+    children = getattr(node, 'children', None)
+    inner = ''
+    if isinstance(children, dict):
+        inner = '\n'.join(filter(None, (render_node(children[key], live_app_url) for key in sorted(children))))
+
+    if kind in ('main', 'sidebar') or kind is None:
+        return inner
+    if kind == 'column':
+        return f'<div class="column">\n{inner}\n</div>'
+    if kind == 'flex_container':
+        container = proto.flex_container
+        css_class = 'row' if container.direction == Block.FlexContainer.HORIZONTAL else 'stack'
+        gap = GapSize.Name(container.gap_config.gap_size).lower()
+        return f'<div class="{css_class} gap-{gap}">\n{inner}\n</div>'
+    if kind == 'markdown':
+        if proto.body.startswith('<style>'):
+            return ''
+        return markdown_to_html(proto.body)
+    if kind == 'title':
+        return f'<h1>{_inline(html.escape(proto.body))}</h1>'
+    if kind in ('header', 'subheader'):
+        return f'<{proto.tag}>{_inline(html.escape(proto.body))}</{proto.tag}>'
+    if kind == 'caption':
+        return f'<div data-testid="stCaptionContainer">{markdown_to_html(proto.body)}</div>'
+    if kind == 'text':
+        return f'<div data-testid="stText">{html.escape(proto.body)}</div>'
+    if kind == 'divider':
+        return '<hr>'
+    if kind == 'space':
+        return '<div class="space"></div>'
+    if kind in ('info', 'warning', 'success', 'error'):
+        return (
+            f'<div class="stAlert"><div data-baseweb="notification">'
+            f'{_inline(proto.icon)}<div>{markdown_to_html(proto.body)}</div></div></div>'
+        )
+    if kind == 'metric':
+        delta = ''
+        if proto.delta:
+            delta = f'<div data-testid="stMetricDelta">{html.escape(proto.delta)}</div>'
+        return (
+            f'<div data-testid="stMetric">'
+            f'<div data-testid="stMetricLabel">{_inline(html.escape(proto.label))}</div>'
+            f'<div data-testid="stMetricValue">{html.escape(proto.body)}</div>'
+            f'{delta}</div>'
+        )
+    if kind == 'page_link':
+        # Same relative hrefs as the live app, which the stylesheets select on
+        href = proto.page
+        if href not in EXPORTED_PATHS:
+            href = f"{live_app_url.rstrip('/')}/{href}"
+        return (
+            f'<a data-testid="stPageLink-NavLink" href="{html.escape(href)}">'
+            f'{_inline(proto.icon)}<span>{html.escape(proto.label)}</span></a>'
+        )
+    if kind == 'arrow_vega_lite_chart':
+        spec = html.escape(json.dumps(_chart_spec(proto), separators=(',', ':')), quote=True)
+        return f'<div class="chart" data-spec="{spec}"></div>'
+    # Widgets (segmented controls, toggles) need a live session
+    return inner
+
+def render_page(page: str = None) -> AppTest:
+    """
+    Run one page's script offline with every division section shown.
+
+    :param page: Page script path, or None for the overview page
+    """
+    app = AppTest.from_file(APP_SCRIPT, default_timeout=120)
+    if page:
+        app.switch_page(page)
+    app.session_state[STATIC_EXPORT] = True
+    app.run()
+    if app.exception:
+        raise RuntimeError(f"{page or APP_SCRIPT} raised: {app.exception[0].value}")
+    return app
+
+def export_site(output_dir: str = 'site', base_url: str = '/', live_app_url: str = LIVE_APP_URL) -> list[Path]:
+    """
+    Write every page in PAGES as static HTML, with the app's static files
+    alongside. Run from the repository root.
+
+    :param output_dir: Directory to write the site to
+    :param base_url: URL path the site is served from
+    :param live_app_url: URL of the live app, linked to for the other pages
+    """
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    if STATIC_DIR.is_dir():
+        shutil.copytree(STATIC_DIR, output / 'app' / 'static', dirs_exist_ok=True)
+
+    written = []
+    for filename, page, stylesheet in PAGES:
+        app = render_page(page)
+        title = app.title[0].value if app.title else 'Memphis Employee Insights'
+        path = output / filename
+        path.write_text(PAGE_TEMPLATE.format(
+            title=html.escape(f'Memphis Employee Insights – {title}' if page else title),
+            base_url=base_url,
+            layout_css=LAYOUT_CSS,
+            stylesheet=build_stylesheet(stylesheet),
+            sidebar=render_node(app.sidebar, live_app_url),
+            main=render_node(app.main, live_app_url),
+        ), encoding='utf-8')
+        written.append(path)
+    return written
+
+
+if __name__ == '__main__':
+    for path in export_site(*sys.argv[1:]):
+        print(f'{path} ({path.stat().st_size / 1024:,.1f} KB)')
@@ -1,80 +1,51 @@
+# ====================
+# Site stylesheet
+# ====================
+# All CSS lives in shared/css/ and reaches the browser as one <style>
+# element per page, built once per process. The element is identical on
+# every rerun, so Streamlit's message cache sends the browser a reference to
+# the copy it already holds instead of the styles themselves.
+import re
+from functools import cache
+from pathlib import Path
 import streamlit as st
-
-
-def render_reusable_styles():
-    """Render reusable styles across all pages"""
-    st.markdown(
-        """
-        <style>
-        /* Hide GitHub buttons on public site */
-        [data-testid="stToolbarActionButton"] {
-            display: none !important;
-        }
-
-        /* Remove padding from top of page */
-        #root > div:nth-child(1) > div > div > div > div > section > div {padding-top: 0rem;}
-
-        /* Remove white background from header section */
-        header { background: transparent !important; }
-
-        .xl-metric {
-            font-weight: 600;
-            line-height: 1.0;
-            font-size: 2.75rem !important;
-            margin-bottom: 0;
-            text-align: center; 
-        }
-
-        [data-testid="stCaptionContainer"] .small-label {
-            font-size: smaller !important;
-            margin-top: 0;
-            line-height: 1.0;
-        }
-
-        .center {
-            text-align: center;        
-        }
-        .left {
-            text-align: left;        
-        }
-                
-        .bold {
-            font-weight: 600;        
-        }
-
-        .mb-0 {
-            margin-bottom: 0 !important;        
-        }
-        .pt-0 {
-            padding-top: 0 !important;        
-        }
-                
-        .red {
-            color: #EA4335;        
-        }
-        .blue {
-            color: #4285F4;        
-        }
-        .green {
-            color: #34A853;        
-        }
-        .yellow {
-            color: #FBBC04;        
-        }
-        .grey {
-            color: #9AA0A6;
-        }
-
-        .table-row {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            width: 100%;
-            border-bottom: 1px solid #F1F3F4;
-            padding: 0.2rem 0;
-        }
-        .table-row:last-of-type {
-            border-bottom: none;
-        }
-        </style>
-        """, unsafe_allow_html=True)
\ No newline at end of file
+from shared.taxonomy import CATEGORIES, CATEGORY_COLORS, CATEGORY_SLUGS
+
+
+CSS_DIR = Path(__file__).parent / 'css'
+
+# Stylesheets shared by every page, in cascade order
+SHARED_STYLESHEETS = ['navigation.css', 'base.css']
+
+
+def _minify(css: str) -> str:
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};,>])\s*', r'\1', css).strip()
+
+@cache
+def build_stylesheet(page: str) -> str:
+    """
+    The shared stylesheet followed by one page's own rules, as a <style> element.
+
+    :param page: Page stylesheet name in shared/css/, e.g. 'public-safety'
+    """
+    # Hover color for each Division Category page link
+    category_hover_rules = "\n".join(
+        f'a[href="{CATEGORY_SLUGS[category]}"]:hover {{ background: {CATEGORY_COLORS[category]} !important; }}'
+        for category in CATEGORIES
+    )
+    css = "\n".join([
+        *[(CSS_DIR / name).read_text() for name in SHARED_STYLESHEETS],
+        category_hover_rules,
+        (CSS_DIR / f'{page}.css').read_text(),
+    ])
+    return f'<style>{_minify(css)}</style>'
+
+def render_reusable_styles(page: str):
+    """
+    Render reusable styles across all pages, plus the page's own styles.
+
+    :param page: Page stylesheet name in shared/css/, e.g. 'public-safety'
+    """
+    st.markdown(build_stylesheet(page), unsafe_allow_html=True)
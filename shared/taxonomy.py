@@ -0,0 +1,100 @@
+# ====================
+# Division Taxonomy
+# ====================
+# Single registry of how city divisions roll up into Division Categories and
+# the sub-groups shown on each category page. Everything else (loader columns,
+# chart color scales, navigation CSS) is derived from it.
+import numpy as np
+import pandas as pd
+from shared.colors import MEDIUM_RED, MEDIUM_BLUE, MEDIUM_GREEN, YELLOW
+
+
+# Division Category -> sub-group -> divisions, in display order
+DIVISION_TAXONOMY = {
+    'Public Safety': {
+        'Police Services': ['Police Services'],
+        'Fire Services': ['Fire Services'],
+    },
+    'Public Works': {
+        'Public Works': ['Public Works'],
+        'Solid Waste': ['Solid Waste'],
+        'General Services': ['General Services'],
+        'City Engineering': ['City Engineering'],
+    },
+    'Stronger Neighborhoods': {
+        'Memphis Parks': ['Memphis Parks'],
+        'Library Services': ['Library Services'],
+        'Housing and Community Development': ['Housing and Community Development'],
+    },
+    'Good Government': {
+        'Governance': ['Executive', 'Legislative', 'Judicial'],
+        'Finance': ['Finance and Administration'],
+        'HR': ['Human Resources'],
+        'IT': ['Information Technology'],
+        'Legal': ['City Attorney', 'City Court Clerk'],
+    },
+}
+
+# Page slug for each Division Category (matches the files in pages/)
+CATEGORY_SLUGS = {
+    'Public Safety': 'public-safety',
+    'Public Works': 'public-works',
+    'Stronger Neighborhoods': 'stronger-neighborhoods',
+    'Good Government': 'good-government',
+}
+
+# Primary color for each Division Category
+CATEGORY_COLORS = {
+    'Public Safety': MEDIUM_RED,
+    'Public Works': MEDIUM_BLUE,
+    'Stronger Neighborhoods': MEDIUM_GREEN,
+    'Good Government': YELLOW,
+}
+
+# Row filters accepted by the dataset and aggregate cube, mapped to their columns
+ROW_KEYS = {
+    'category': 'Division Category',
+    'group': 'Division Group',
+    'division': 'Division Name',
+    'employment_type': 'Employment Type',
+}
+
+# Flattened views of the taxonomy
+CATEGORIES = list(DIVISION_TAXONOMY)
+DIVISION_GROUPS = [group for groups in DIVISION_TAXONOMY.values() for group in groups]
+GROUP_DIVISIONS = {
+    group: divisions
+    for groups in DIVISION_TAXONOMY.values()
+    for group, divisions in groups.items()
+}
+DIVISIONS = [division for divisions in GROUP_DIVISIONS.values() for division in divisions]
+DIVISION_CATEGORY = {
+    division: category
+    for category, groups in DIVISION_TAXONOMY.items()
+    for divisions in groups.values()
+    for division in divisions
+}
+DIVISION_GROUP = {
+    division: group
+    for group, divisions in GROUP_DIVISIONS.items()
+    for division in divisions
+}
+
+
+def _map_divisions(divisions: pd.Series, mapping: dict, categories: list) -> pd.Categorical:
+    # Encode each row's division once (hash lookup in C), then translate the
+    # integer codes through a small lookup table instead of calling Python per row.
+    # The trailing -1 sends unknown divisions (code -1) to a missing value.
+    codes = pd.Categorical(divisions, categories=DIVISIONS).codes
+    lookup = np.array([categories.index(mapping[division]) for division in DIVISIONS] + [-1])
+    return pd.Categorical.from_codes(lookup[codes], categories=categories)
+
+def add_division_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Derive the Division Category and Division Group columns from Division Name.
+
+    :param df: DataFrame with a Division Name column
+    """
+    df['Division Category'] = _map_divisions(df['Division Name'], DIVISION_CATEGORY, CATEGORIES)
+    df['Division Group'] = _map_divisions(df['Division Name'], DIVISION_GROUP, DIVISION_GROUPS)
+    return df
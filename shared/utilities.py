@@ -43,4 +43,39 @@ def employment_type_pie_chart(df, ft_color, pt_color):
             alt.Tooltip("Count:Q", format=",", title="Employees"),
             alt.Tooltip("Value:Q", format=".1%", title="Percentage")
         ]
-    )
\ No newline at end of file
+    )
+def salary_share_table(shares, category):
+    """
+    Table for displaying each division's share of a category's salaries.
+
+    :param shares: Mapping of division label to share of salaries (0-1), in display order
+    :param category: Division Category the shares are of
+    """
+    rows = "".join(
+        f"""
+            <div class="table-row">
+                <span>{label}</span>
+                <span>{share:.1%}</span>
+            </div>"""
+        for label, share in shares.items()
+    )
+    return f"""
+            <div class="table-row">
+                <span class="bold">Division</span>
+                <span class="bold">Percent of {category} Salaries</span>
+            </div>{rows}
+            <div class="table-row">
+                <span class="bold">Total</span>
+                <span class="bold">100%</span>
+            </div>
+            """
+
+def format_thousands(amount):
+    """
+    Dollar amount in thousands, e.g. $145k or $227.5k.
+
+    :param amount: Dollar amount
+    """
+    if round(amount) % 1000 == 0:
+        return f"${amount/1e3:,.0f}k"
+    return f"${amount/1e3:,.1f}k"
@@ -1,11 +1,14 @@
 import streamlit as st
 import altair as alt
-import pandas as pd
 from shared.navigation import render_navigation
 from shared.styles import render_reusable_styles
-from shared.data_loader import initialize_data, get_department_summary
+from shared.processing import warm_up
+from shared.data_server import start_data_server
+from shared.page_models import get_overview_page_model
+from shared.chart_cache import cached_altair_chart
 from shared.utilities import employment_type_table, employment_type_pie_chart
-from shared.colors import TEAL, LIGHT_TEAL, MEDIUM_RED, MEDIUM_BLUE, MEDIUM_GREEN, YELLOW, LIGHT_GREY, GREY, BLACK
+from shared.taxonomy import CATEGORY_COLORS, DIVISION_CATEGORY
+from shared.colors import TEAL, LIGHT_TEAL, LIGHT_GREY, GREY, BLACK
 
 
 ##################################################
@@ -23,232 +26,46 @@ st.set_page_config(
 render_navigation()
 
 # Render reusable styles
-render_reusable_styles()
+render_reusable_styles('overview')
 
-# Load data
-df = initialize_data()
+# Load the shared dataset (once per process) and precompute division details
+# so the division pages open without loading anything
+warm_up()
 
-# Page-specific CSS (only runs here on page)
-st.markdown(
-    """
-    <style>
-    /* Set info alert background color */
-    .stAlert [data-baseweb="notification"] {
-        background-color: #F1F3F4 !important;
-    }
-    /* Set info alert text color */
-    .st-al {
-        color: #202124;
-    }
-    /* Set background color for active page link */
-    [data-testid="stPageLink-NavLink"][href=""] {
-        background-color: #DAE2E5 !important;
-    }
-
-    /* Set background color for active page link */
-    [data-testid="stPageLink-NavLink"][href=""],
-    [data-testid="stPageLink-NavLink"][href=""]:hover {
-        background: transparent;
-        border-left: 5px solid #0097A7;
-        padding-left: 0.2rem;
-    }
-
-    /* Override metric delta colors */
-    [data-testid="stMetricDelta"] {
-        background: #80DEEA !important;
-        color: #202124 !important;
-    }
-
-    /* Override Badge colors */
-    span.stMarkdownBadge {
-        background-color: #80DEEA !important;
-        color: #202124 !important;
-    }
-    </style>
-    """, unsafe_allow_html=True
-)
+# Serve exports and the JSON API from the first visit on
+start_data_server()
 
 ##################################################
 # Data Preparation
 ##################################################
 
-#
-total_divisions = df['Division Name'].nunique()
-
-# 
-total_city_salaries = df['Annual Salary'].sum()
-total_city_salaries_formatted = total_city_salaries / 1e6
-
-#
-total_city_employees = len(df)
-# Get total number of unique job titles
-total_city_job_titles = df['Job Title'].nunique()
-
-#
-average_city_salary = df['Annual Salary'].mean()
-# Get total number of salaried employees
-total_salaried_employees = (df['Employment Type'] == 'Full-time').sum()
-#
-total_salaried_job_titles = df[df['Employment Type'] == 'Full-time']['Job Title'].nunique()
-
-#
-average_city_hourly_pay = df['Hourly/Per Event Rate'].mean()
-# Get total number of part-time employees
-total_part_time_employees = (df['Employment Type'] == 'Part-time').sum()
-#
-total_hourly_job_titles = df[df['Employment Type'] == 'Part-time']['Job Title'].nunique()
-
-#
-percent_salaried_employees = total_salaried_employees / total_city_employees
-percent_part_time_employees = total_part_time_employees / total_city_employees
-
-# Calculating the sum of all Salaries in each Division Category
-division_category_salary_totals = pd.DataFrame(df.groupby('Division Category')['Annual Salary'].sum()).reset_index()
-
-# Sort Division Categories by the sum of all Salaries in descending order
-division_category_salary_totals.sort_values(by='Annual Salary', ascending=False, inplace=True)
-
-def custom_logic(row):
-    return (row['Annual Salary'] / total_city_salaries) 
-
-# Apply the function to each row (axis=1)
-division_category_salary_totals['Percentage'] = division_category_salary_totals.apply(custom_logic, axis=1)
-
-#
-public_safety_salary = division_category_salary_totals.loc[
-    division_category_salary_totals['Division Category'] == 'Public Safety', 'Annual Salary'
-].values[0] / 1e6
-
-#
-public_works_salary = division_category_salary_totals.loc[
-    division_category_salary_totals['Division Category'] == 'Public Works', 'Annual Salary'
-].values[0] / 1e6
-
-#
-stronger_neighborhoods_salary = division_category_salary_totals.loc[
-    division_category_salary_totals['Division Category'] == 'Stronger Neighborhoods', 'Annual Salary'
-].values[0] / 1e6
-
-#
-good_government_salary = division_category_salary_totals.loc[
-    division_category_salary_totals['Division Category'] == 'Good Government', 'Annual Salary'
-].values[0] / 1e6
-
-# Calculating the sum of all Salaries in each Division
-division_salary_totals = pd.DataFrame(df.groupby('Division Name')['Annual Salary'].sum()).reset_index()
-
-# Sort Divisions by the sum of all Salaries in descending order
-division_salary_totals.sort_values(by='Annual Salary', ascending=False, inplace=True)
-
-#
-employment_type_totals_df = pd.DataFrame({
-    "Employment Type": ["Full-time", "Part-time"],
-    "Value": [percent_salaried_employees, percent_part_time_employees],
-    "Count": [total_salaried_employees, total_part_time_employees]
-})
-
-# REUSABLE SNIPPET - utils.py
-division_category = 'Public Safety'  # Adjust based on page
-public_safety_employees = df.groupby('Division Category').size()[division_category]
-
-# Get division category employee percentage of total city employees
-public_safety_employee_percentage = (public_safety_employees / total_city_employees) * 100
-
-public_safety_employee_count = len(df.loc[
-    df['Division Category'] == 'Public Safety'
-])
-
-public_safety_employee_percentage = (
-    public_safety_employee_count / total_city_employees
-)
-
-public_works_employee_count = len(df.loc[
-    df['Division Category'] == 'Public Works'
-])
-
-public_works_employee_percentage = (
-    public_works_employee_count / total_city_employees
-)
-
-stronger_neighborhoods_employee_count = len(df.loc[
-    df['Division Category'] == 'Stronger Neighborhoods'
-])
-
-stronger_neighborhoods_employee_percentage = (
-    stronger_neighborhoods_employee_count / total_city_employees
-)
-
-good_government_employee_count = len(df.loc[
-    df['Division Category'] == 'Good Government'
-])
-
-good_government_employee_percentage = (
-    good_government_employee_count / total_city_employees
-)
-
-df_division_category_employee = pd.DataFrame({
-    "Division Category": ["Public Safety", "Public Works", "Stronger Neighborhoods", "Good Government"],
-    "Value": [public_safety_employee_percentage, public_works_employee_percentage, stronger_neighborhoods_employee_percentage, good_government_employee_percentage],
-    "Employees": [public_safety_employee_count, public_works_employee_count, stronger_neighborhoods_employee_count, good_government_employee_count]
-})
-
-counts_df = df.groupby('Division Category').size().reset_index(name='Total Employees').sort_values(by='Total Employees', ascending=False)
-
-# Get count of full-time employees for Public Safety
-public_safety_full_time_employee_count = len(df.loc[
-    (df['Division Category'] == 'Public Safety') & (df['Employment Type'] == 'Full-time')
-])
-
-# Get Public Safety full-time employee percentage of total full-time employees 
-public_safety_full_time_employee_percentage = (
-    public_safety_full_time_employee_count / total_salaried_employees
-) * 100
-
-# Get count of full-time employees for Stronger Neighborhoods
-stronger_neighborhoods_part_time_employee_count = len(df.loc[
-    (df['Division Category'] == 'Stronger Neighborhoods') & (df['Employment Type'] == 'Part-time')
-])
-
-# Get Stronger Neighborhoods pull-time employee percentage of total full-time employees 
-stronger_neighborhoods_part_time_employee_percentage = (
-    stronger_neighborhoods_part_time_employee_count / total_part_time_employees
-) * 100
-
-#
-employment_type_by_division_category = (
-    df['Employment Type']
-    .groupby(df['Division Category'])
-    .value_counts()
-    .reset_index(name='Count')
-    .sort_values(by='Count', ascending=False)
-)
-
-# RESUSABLE SNIPPET - utils.py
-division = 'Police Services'  # Adjust based on page
-police_services_employees = df.groupby('Division Name').size()[division]
-
-# Get division employee percentage of total city employees
-divison_employee_percentage = (police_services_employees / total_city_employees) * 100
-
-# Get count of full-time employees for Police Services
-police_services_full_time_employee_count = len(df.loc[
-        (df['Division Name'] == 'Police Services') & (df['Employment Type'] == 'Full-time')
-])
-
-# Get Police Services Full-time employee percentage of total full-time employees 
-police_services_full_time_employee_percentage = (
-    police_services_full_time_employee_count / total_salaried_employees
-) * 100
-
-result = (
-    df['Employment Type']
-    .groupby(df['Division Name'])
-    .value_counts()
-    .reset_index(name='Count')
-)
-
-#
-employees_by_division = df.groupby('Division Name').size().reset_index(name="Count").sort_values(by='Count', ascending=False)
+# Cached page data for the current dataset version
+model = get_overview_page_model()
+
+total_divisions = model.total_divisions
+total_city_salaries_formatted = model.total_city_salaries / 1e6
+total_city_employees = model.total_city_employees
+total_salaried_employees = model.total_salaried_employees
+total_part_time_employees = model.total_part_time_employees
+
+# Sum of all Salaries in each Division Category (in millions)
+public_safety_salary = model.category_salaries['Public Safety'] / 1e6
+public_works_salary = model.category_salaries['Public Works'] / 1e6
+stronger_neighborhoods_salary = model.category_salaries['Stronger Neighborhoods'] / 1e6
+good_government_salary = model.category_salaries['Good Government'] / 1e6
+
+division_category_salary_totals = model.division_category_salary_totals
+division_salary_totals = model.division_salary_totals
+employment_type_totals_df = model.employment_type_totals
+
+public_safety_employee_percentage = model.public_safety_employee_percentage
+counts_df = model.counts_df
+public_safety_full_time_employee_percentage = model.public_safety_full_time_employee_percentage
+stronger_neighborhoods_part_time_employee_percentage = model.stronger_neighborhoods_part_time_employee_percentage
+employment_type_by_division_category = model.employment_type_by_division_category
+police_services_full_time_employee_percentage = model.police_services_full_time_employee_percentage
+result = model.employment_type_by_division
+employees_by_division = model.employees_by_division
 
 ##################################################
 # UI Content
@@ -299,34 +116,27 @@ with st.spinner('Loading data and calculations...'):
     st.space()
 
     with salary_cols[1]:
-        # Define colors
-        color_map = {
-            "Public Safety": MEDIUM_RED,
-            "Public Works": MEDIUM_BLUE,
-            "Stronger Neighborhoods": MEDIUM_GREEN,
-            "Good Government": YELLOW,
-        }
-        
-        salary_distribution_by_division_category = alt.Chart(division_category_salary_totals).mark_arc().encode(
-            theta=alt.Theta("Percentage:Q", stack=True),
-            color=alt.Color(
-                "Division Category:N",
-                title="Category",
-                scale=alt.Scale(
-                    domain=list(color_map.keys()),
-                    range=list(color_map.values())
-                )
-            ),
-            tooltip=[
-                alt.Tooltip("Division Category:N", title="Category"),
-                alt.Tooltip("Annual Salary:Q", format="$,.2f", title="Total Salary"),
-                alt.Tooltip("Percentage:Q", format=".1%", title="Percentage")
-            ]
-        ).properties(
-            title='Total Salaries by Division Category'
-        )
+        def build_category_salaries_chart():
+            return alt.Chart(division_category_salary_totals).mark_arc().encode(
+                theta=alt.Theta("Percentage:Q", stack=True),
+                color=alt.Color(
+                    "Division Category:N",
+                    title="Category",
+                    scale=alt.Scale(
+                        domain=list(CATEGORY_COLORS.keys()),
+                        range=list(CATEGORY_COLORS.values())
+                    )
+                ),
+                tooltip=[
+                    alt.Tooltip("Division Category:N", title="Category"),
+                    alt.Tooltip("Annual Salary:Q", format="$,.2f", title="Total Salary"),
+                    alt.Tooltip("Percentage:Q", format=".1%", title="Percentage")
+                ]
+            ).properties(
+                title='Total Salaries by Division Category'
+            )
 
-        st.altair_chart(salary_distribution_by_division_category, width="stretch")
+        cached_altair_chart('overview/category-salaries', build_category_salaries_chart, colors=tuple(CATEGORY_COLORS.values()), width="stretch")
         
     st.space()
 
@@ -353,82 +163,47 @@ with st.spinner('Loading data and calculations...'):
     st.space()
 
     with st.container():
-        # Define colors
+        # Color each division by its Division Category
         division_color_scale = alt.Scale(
-            domain=[
-                "Police Services",
-                "Fire Services",
-                "Public Works",
-                "Solid Waste",
-                "General Services",
-                "Memphis Parks",
-                "Library Services",
-                "City Engineering",
-                "Executive",
-                "Finance and Administration",
-                "Human Resources",
-                "Information Technology",
-                "City Attorney",
-                "Housing and Community Development",
-                "City Court Clerk",
-                "Legislative",
-                "Judicial",
-            ],
-            range=[
-                MEDIUM_RED,
-                MEDIUM_RED,
-                MEDIUM_BLUE,
-                MEDIUM_BLUE,
-                MEDIUM_BLUE,
-                MEDIUM_GREEN,
-                MEDIUM_GREEN,
-                MEDIUM_BLUE,
-                YELLOW,
-                YELLOW,
-                YELLOW,
-                YELLOW,
-                YELLOW,
-                MEDIUM_GREEN,
-                YELLOW,
-                YELLOW,
-                YELLOW,
-            ]
+            domain=list(DIVISION_CATEGORY.keys()),
+            range=[CATEGORY_COLORS[category] for category in DIVISION_CATEGORY.values()]
         )
 
-        chart = alt.Chart(division_salary_totals).mark_bar().encode(
-            x=alt.X(
-                'Annual Salary',
-                axis=alt.Axis(
-                    title='Annual Salary Total',
-                    format='$,s'
-                )
-            ),
-            y=alt.Y(
-                'Division Name',
-                sort=None,
-                axis=alt.Axis(
-                    title=None,
-                    labelLimit=300
+        def build_division_salaries_chart():
+            return alt.Chart(division_salary_totals).mark_bar().encode(
+                x=alt.X(
+                    'Annual Salary',
+                    axis=alt.Axis(
+                        title='Annual Salary Total',
+                        format='$,s'
+                    )
+                ),
+                y=alt.Y(
+                    'Division Name',
+                    sort=None,
+                    axis=alt.Axis(
+                        title=None,
+                        labelLimit=300
+                    )
+                ),
+                color=alt.Color(
+                    'Division Name:N',
+                    scale=division_color_scale,
+                    legend=None
+                ),
+                tooltip=[
+                    alt.Tooltip('Division Name'),
+                    alt.Tooltip('Annual Salary', format="$,.2f")
+                ]
+            ).properties(
+                title=alt.TitleParams(
+                    text='Total Salaries by Division',
+                    subtitle=['Fiscal Year 2025 | Source: City of Memphis'],
+                    anchor='start'
                 )
-            ),
-            color=alt.Color(
-                'Division Name:N',
-                scale=division_color_scale,
-                legend=None
-            ),
-            tooltip=[
-                alt.Tooltip('Division Name'),
-                alt.Tooltip('Annual Salary', format="$,.2f")
-            ]
-        ).properties(
-            title=alt.TitleParams(
-                text='Total Salaries by Division',
-                subtitle=['Fiscal Year 2025 | Source: City of Memphis'],
-                anchor='start'
             )
-        )
 
-        st.altair_chart(chart, width="stretch")
+        cached_altair_chart('overview/division-salaries', build_division_salaries_chart, colors=tuple(division_color_scale.range), width="stretch")
 
     #--------------------------------------------------------
     st.space()
@@ -453,14 +228,13 @@ with st.spinner('Loading data and calculations...'):
         )
 
     with overview_col_2:
-        pie_chart_employment_type = employment_type_pie_chart(
-            employment_type_totals_df,
-            TEAL,
-            LIGHT_TEAL
+        cached_altair_chart(
+            'overview/employment-type',
+            lambda: employment_type_pie_chart(employment_type_totals_df, TEAL, LIGHT_TEAL),
+            colors=(TEAL, LIGHT_TEAL),
+            width="stretch"
         )
 
-        st.altair_chart(pie_chart_employment_type, width="stretch")
-
     st.space()
 
     st.markdown('### Employees by Division Category')
@@ -497,23 +271,24 @@ with st.spinner('Loading data and calculations...'):
             )
 
     with employees_by_division_category_cols[1]:
-        chart = alt.Chart(counts_df).mark_bar(color=TEAL).encode(
-            x=alt.X(
-                'Division Category',
-                axis=alt.Axis(labelAngle=0),  # Rotate labels
-                sort=None,
-                title=None,
-            ),
-            y=alt.Y(
-                'Total Employees',
-                axis=alt.Axis(format=',d'),  # Format numbers with comma 
-            ),
-            tooltip=[
-                alt.Tooltip("Division Category:N", title="Category"),
-                alt.Tooltip("Total Employees:Q", format=",d", title="Employees")
-            ]
-        )
-        st.altair_chart(chart)
+        def build_category_employees_chart():
+            return alt.Chart(counts_df).mark_bar(color=TEAL).encode(
+                x=alt.X(
+                    'Division Category',
+                    axis=alt.Axis(labelAngle=0),  # Rotate labels
+                    sort=None,
+                    title=None,
+                ),
+                y=alt.Y(
+                    'Total Employees',
+                    axis=alt.Axis(format=',d'),  # Format numbers with comma 
+                ),
+                tooltip=[
+                    alt.Tooltip("Division Category:N", title="Category"),
+                    alt.Tooltip("Total Employees:Q", format=",d", title="Employees")
+                ]
+            )
+        cached_altair_chart('overview/category-employees', build_category_employees_chart, colors=(TEAL,))
 
     st.space()
 
@@ -546,45 +321,46 @@ with st.spinner('Loading data and calculations...'):
 
     st.space()
 
-    employment_type_by_division_category_chart = alt.Chart(employment_type_by_division_category).mark_bar().encode(
-        x=alt.X(
-            'Division Category:N',
-            axis=alt.Axis(labelAngle=0),  # Rotate labels
-            sort=None,
-            title=None,
-        ),
-        y=alt.Y(
-            'sum(Count):Q',
-            axis=alt.Axis(
-                format=',d',
-                title='Total Employees',
+    def build_category_employment_types_chart():
+        return alt.Chart(employment_type_by_division_category).mark_bar().encode(
+            x=alt.X(
+                'Division Category:N',
+                axis=alt.Axis(labelAngle=0),  # Rotate labels
+                sort=None,
+                title=None,
             ),
+            y=alt.Y(
+                'Count:Q',
+                axis=alt.Axis(
+                    format=',d',
+                    title='Total Employees',
+                ),
             
-        ),
-        # Sort the segments within each bar by the 'Employment Type' field in descending order
-        order=alt.Order('Employment Type', sort='ascending'),
-        color=alt.Color('Employment Type:N',
-            title='Employment Type',
-            scale=alt.Scale(
-                domain=['Full-time', 'Part-time'],
-                range=[TEAL, LIGHT_TEAL]
+            ),
+            # Sort the segments within each bar by the 'Employment Type' field in descending order
+            order=alt.Order('Employment Type', sort='ascending'),
+            color=alt.Color('Employment Type:N',
+                title='Employment Type',
+                scale=alt.Scale(
+                    domain=['Full-time', 'Part-time'],
+                    range=[TEAL, LIGHT_TEAL]
                 
+                ),
             ),
-        ),
-        tooltip=[
-            alt.Tooltip('Division Category:N', title='Category'),
-            alt.Tooltip('Employment Type:N', title='Employment Type'),
-            alt.Tooltip('sum(Count):Q', title='Employees', format=',d')
-        ]
-    ).properties(
-        title=alt.TitleParams(
-            text='Employment Type Breakdown: Full-Time vs. Part-Time by Division Category',
-            subtitle=['Fiscal Year 2025 | Source: City of Memphis'],
-            anchor='start'
+            tooltip=[
+                alt.Tooltip('Division Category:N', title='Category'),
+                alt.Tooltip('Employment Type:N', title='Employment Type'),
+                alt.Tooltip('Count:Q', title='Employees', format=',d')
+            ]
+        ).properties(
+            title=alt.TitleParams(
+                text='Employment Type Breakdown: Full-Time vs. Part-Time by Division Category',
+                subtitle=['Fiscal Year 2025 | Source: City of Memphis'],
+                anchor='start'
+            )
         )
-    )
 
-    st.altair_chart(employment_type_by_division_category_chart, width="stretch")
+    cached_altair_chart('overview/category-employment-types', build_category_employment_types_chart, colors=(TEAL, LIGHT_TEAL), width="stretch")
 
     st.space()
 
@@ -604,31 +380,34 @@ with st.spinner('Loading data and calculations...'):
             """
         )
 
-        employees_by_division_chart = alt.Chart(employees_by_division).mark_bar(color=TEAL).encode(
-            x=alt.X(
-                'Count',
-                title='Total Employees'
-            ),
-            y=alt.Y(
-                'Division Name',
-                sort=None,
-                axis=alt.Axis(title=None, labelLimit=300)
-            ),
-            tooltip=[
-                alt.Tooltip('Division Name:N', title='Division'),
-                alt.Tooltip('Count:Q', title='Total Employees', format=',d')
-            ]
-        ).properties(
-            title=alt.TitleParams(
-                text='Employees by Division',
-                subtitle=['Fiscal Year 2025 | Source: City of Memphis'],
-                anchor='start'
+        def build_division_employees_chart():
+            return alt.Chart(employees_by_division).mark_bar(color=TEAL).encode(
+                x=alt.X(
+                    'Count',
+                    title='Total Employees'
+                ),
+                y=alt.Y(
+                    'Division Name',
+                    sort=None,
+                    axis=alt.Axis(title=None, labelLimit=300)
+                ),
+                tooltip=[
+                    alt.Tooltip('Division Name:N', title='Division'),
+                    alt.Tooltip('Count:Q', title='Total Employees', format=',d')
+                ]
+            ).properties(
+                title=alt.TitleParams(
+                    text='Employees by Division',
+                    subtitle=['Fiscal Year 2025 | Source: City of Memphis'],
+                    anchor='start'
+                )
             )
-        )
 
-        st.altair_chart(
-            employees_by_division_chart,
-            width='stretch'
+        cached_altair_chart(
+            'overview/division-employees',
+            build_division_employees_chart,
+            colors=(TEAL,),
+            width='stretch',
         )
 
     with new_cols[1]:
@@ -776,36 +555,33 @@ with st.spinner('Loading data and calculations...'):
     st.space()
     # st.space()
 
-    chart = alt.Chart(result).mark_bar().encode(
-        x=alt.X('sum(Count):Q',
-            axis=alt.Axis(format=',d', title='Number of Employees')
-        ),
-        y=alt.Y('Division Name:N',
-            sort=alt.EncodingSortField(
-                field='Count',
-                op='sum',
-                order='descending'
+    def build_division_employment_types_chart():
+        return alt.Chart(result).mark_bar().encode(
+            x=alt.X('Count:Q',
+                axis=alt.Axis(format=',d', title='Number of Employees')
+            ),
+            y=alt.Y('Division Name:N',
+                sort=None,  # Largest division first, ordered on the server
+                axis=alt.Axis(title=None, labelLimit=300)
             ),
-            axis=alt.Axis(title=None, labelLimit=300)
-        ),
-        color=alt.Color('Employment Type:N',
-            title='Employment Type',
-            scale=alt.Scale(
-                domain=['Full-time', 'Part-time'],
-                range=[TEAL, LIGHT_TEAL]
+            color=alt.Color('Employment Type:N',
+                title='Employment Type',
+                scale=alt.Scale(
+                    domain=['Full-time', 'Part-time'],
+                    range=[TEAL, LIGHT_TEAL]
                 
-            )),
-        tooltip=[
-            alt.Tooltip('Division Name:N', title='Division'),
-            alt.Tooltip('Employment Type:N', title='Employment Type'),
-            alt.Tooltip('sum(Count):Q', title='Count', format=',d')
-        ]
-    ).properties(
-        title=alt.TitleParams(
-            text='Employment Type Breakdown: Full-Time vs. Part-Time by Division',
-            subtitle=['Fiscal Year 2025 | Source: City of Memphis'],
-            anchor='start'
+                )),
+            tooltip=[
+                alt.Tooltip('Division Name:N', title='Division'),
+                alt.Tooltip('Employment Type:N', title='Employment Type'),
+                alt.Tooltip('Count:Q', title='Count', format=',d')
+            ]
+        ).properties(
+            title=alt.TitleParams(
+                text='Employment Type Breakdown: Full-Time vs. Part-Time by Division',
+                subtitle=['Fiscal Year 2025 | Source: City of Memphis'],
+                anchor='start'
+            )
         )
-    )
 
-    st.altair_chart(chart, width="stretch")
\ No newline at end of file
+    cached_altair_chart('overview/division-employment-types', build_division_employment_types_chart, colors=(TEAL, LIGHT_TEAL), width="stretch")
\ No newline at end of file
@@ -0,0 +1,28 @@
+import os
+import sys
+from pathlib import Path
+import pytest
+
+
+# Tests import shared/ and run page scripts the way `streamlit run` does,
+# from the repository root
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def repository_root(monkeypatch):
+    """Run every test from the repository root, where data/ and pages/ are"""
+    monkeypatch.chdir(ROOT)
+
+@pytest.fixture(scope='session')
+def dataset():
+    """The payroll dataset under data/, loaded once for the whole run"""
+    from shared.data_loader import get_dataset
+
+    cwd = os.getcwd()
+    os.chdir(ROOT)
+    try:
+        return get_dataset()
+    finally:
+        os.chdir(cwd)
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+from shared.aggregates import AggregateCube, to_dollars
+from shared.taxonomy import ROW_KEYS
+
+
+def scan(rows: pd.DataFrame) -> dict:
+    # The statistics of some rows computed from the rows themselves, the way
+    # the pages did before the cube
+    salaries = to_dollars(rows['Annual Salary'])
+    rates = to_dollars(rows['Hourly/Per Event Rate'])
+    return {
+        'Employees': len(rows),
+        'Job Titles': rows['Job Title'].nunique(),
+        'Annual Salary': salaries.sum(),
+        'Average Salary': salaries.mean(),
+        'Min Salary': salaries.min(),
+        'Max Salary': salaries.max(),
+        'Top Paying Job': None if salaries.isna().all() else rows.loc[salaries.idxmax(), 'Job Title'],
+        'Average Hourly Rate': rates.mean(),
+        'Min Hourly Rate': rates.min(),
+        'Max Hourly Rate': rates.max(),
+        'Top Paying Part-Time Job': None if rates.isna().all() else rows.loc[rates.idxmax(), 'Job Title'],
+    }
+
+def assert_matches(statistics: pd.Series, expected: dict):
+    for column, value in expected.items():
+        if pd.isna(value):
+            assert pd.isna(statistics[column]), column
+        elif isinstance(value, float):
+            assert statistics[column] == pytest.approx(value), column
+        else:
+            assert statistics[column] == value, column
+
+def row_filters(frame: pd.DataFrame):
+    # Every single-key filter, and every division with each employment type
+    for key, column in ROW_KEYS.items():
+        for value in frame[column].cat.categories:
+            yield {key: value}
+    for division in frame['Division Name'].unique():
+        for employment_type in frame['Employment Type'].unique():
+            yield {'division': division, 'employment_type': employment_type}
+
+
+def test_totals_match_a_scan_of_the_rows(dataset):
+    frame = dataset.frame
+    assert_matches(dataset.cube.total(), scan(frame))
+    for filters in row_filters(frame):
+        mask = np.logical_and.reduce([frame[ROW_KEYS[key]] == value for key, value in filters.items()])
+        if mask.any():
+            assert_matches(dataset.cube.total(**filters), scan(frame[mask]))
+
+def test_rollups_match_a_scan_of_each_group(dataset):
+    frame = dataset.frame
+    for by in [['Division Category'], ['Division Name'], ['Division Group', 'Employment Type']]:
+        rollup = dataset.cube.rollup(by)
+        groups = frame.groupby(by, observed=True)
+        assert len(rollup) == groups.ngroups
+        for key, rows in groups:
+            assert_matches(rollup.loc[key if len(by) > 1 else key[0]], scan(rows))
+
+def test_employment_type_totals_add_up(dataset):
+    totals = dataset.cube.employment_type_totals(category='Public Safety')
+    rows = dataset.frame[dataset.frame['Division Category'] == 'Public Safety']
+    assert totals['Count'].tolist() == [
+        (rows['Employment Type'] == 'Full-time').sum(),
+        (rows['Employment Type'] == 'Part-time').sum(),
+    ]
+    assert totals['Value'].sum() == pytest.approx(1)
+
+def test_top_paying_job_is_the_first_row_with_the_highest_pay():
+    frame = pd.DataFrame({
+        'Division Category': ['Public Safety'] * 3,
+        'Division Name': ['Fire Services'] * 3,
+        'Division Group': ['Fire Services'] * 3,
+        'Employment Type': ['Full-time'] * 3,
+        'Job Title': ['Fire Captain', 'Fire Chief', 'Fire Marshal'],
+        'Annual Salary': pd.array([9_000_000, 12_000_000, 12_000_000], dtype='Int64'),
+        'Hourly/Per Event Rate': pd.array([None, None, None], dtype='Int64'),
+    }).astype({column: 'category' for column in ['Division Category', 'Division Name', 'Division Group', 'Employment Type', 'Job Title']})
+    total = AggregateCube(frame).total()
+    assert total['Top Paying Job'] == 'Fire Chief'
+    assert total['Max Salary'] == 120_000
+    assert pd.isna(total['Top Paying Part-Time Job'])
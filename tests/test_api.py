@@ -0,0 +1,86 @@
+import json
+import pytest
+import tornado.testing
+from shared.api import API_DOCUMENTS, api_etag, build_api_documents
+from shared.data_server import make_app
+
+
+def test_etag_follows_the_dataset_version():
+    assert api_etag('2025.v5.abc') == api_etag('2025.v5.abc')
+    assert api_etag('2025.v5.abc') != api_etag('2025.v5.abd')
+    # Identical files of two snapshots still get different ETags
+    assert api_etag('2024.v5.abc') != api_etag('2025.v5.abc')
+
+def test_documents_carry_their_version(dataset):
+    documents = build_api_documents(dataset, dataset.version)
+    for path in ['/api', '/api/city', '/api/categories', '/api/divisions', '/api/groups', '/api/divisions/Police Services']:
+        assert json.loads(documents[path])['version'] == dataset.version
+    city = json.loads(documents['/api/city'])['data']
+    assert city['employees'] == len(dataset)
+
+
+class TestApiHandler(tornado.testing.AsyncHTTPTestCase):
+
+    @pytest.fixture(autouse=True)
+    def use_dataset(self, dataset):
+        self.dataset = dataset
+
+    def get_app(self):
+        return make_app(memory=False)
+
+    def test_document_is_sent_with_its_etag(self):
+        response = self.fetch('/api/city')
+        assert response.code == 200
+        assert response.headers['ETag'] == api_etag(self.dataset.version)
+        assert response.headers['Cache-Control'] == 'no-cache'
+        assert response.headers['Content-Type'] == 'application/json'
+        assert json.loads(response.body)['data']['employees'] == len(self.dataset)
+
+    def test_current_etag_gets_not_modified(self):
+        etag = self.fetch('/api/divisions').headers['ETag']
+        response = self.fetch('/api/divisions', headers={'If-None-Match': etag})
+        assert response.code == 304
+        assert response.body == b''
+        assert response.headers['ETag'] == etag
+
+    def test_stale_etag_gets_the_document(self):
+        response = self.fetch('/api/divisions', headers={'If-None-Match': api_etag('2024.v5.0000000000000000')})
+        assert response.code == 200
+        assert json.loads(response.body)['version'] == self.dataset.version
+
+    def test_every_document_shares_one_etag(self):
+        etags = {self.fetch(path).headers['ETag'] for path in ['/api', '/api/', '/api/city', '/api/groups']}
+        assert etags == {api_etag(self.dataset.version)}
+        assert json.loads(self.fetch('/api').body)['data'] == API_DOCUMENTS
+
+    def test_unknown_document(self):
+        response = self.fetch('/api/divisions/Nowhere')
+        assert response.code == 404
+        assert json.loads(response.body) == {'error': 'Not Found'}
+
+    def test_memory_report_is_not_served(self):
+        assert self.fetch('/memory').code == 404
+
+
+class TestMemoryHandler(tornado.testing.AsyncHTTPTestCase):
+
+    @pytest.fixture(autouse=True)
+    def use_dataset(self, dataset):
+        self.dataset = dataset
+
+    def get_app(self):
+        return make_app(memory=True)
+
+    def get_httpserver_options(self):
+        # Take the client address from X-Real-Ip, to make requests from elsewhere
+        return {'xheaders': True}
+
+    def test_memory_report_is_served_on_this_machine(self):
+        response = self.fetch('/memory')
+        assert response.code == 200
+        assert response.headers['Cache-Control'] == 'no-store'
+        assert {'dataset_bytes', 'sessions', 'session_bytes'} <= set(json.loads(response.body))
+
+    def test_memory_report_is_not_served_to_other_machines(self):
+        assert self.fetch('/memory', headers={'X-Real-Ip': '203.0.113.7'}).code == 404
+        assert self.fetch('/memory', headers={'X-Real-Ip': '::1'}).code == 200
@@ -0,0 +1,40 @@
+from shared.bounded_cache import BoundedCache
+
+
+def cache(max_bytes: int) -> BoundedCache:
+    # Values are their own size in bytes
+    return BoundedCache(max_bytes, lambda value: value)
+
+
+def test_values_are_computed_once():
+    store = cache(100)
+    calls = []
+    for _ in range(3):
+        assert store.lookup(('v1', 'a'), lambda: calls.append(1) or 10) == 10
+    assert len(calls) == 1
+    stats = store.stats()
+    assert (stats['Hits'], stats['Misses'], stats['Entries'], stats['Bytes']) == (2, 1, 1, 10)
+
+def test_least_recently_used_is_evicted_first():
+    store = cache(30)
+    for key in 'abc':
+        store.lookup(('v1', key), lambda: 10)
+    store.lookup(('v1', 'a'), lambda: 10)
+    store.lookup(('v1', 'd'), lambda: 10)
+    assert list(store._entries) == [('v1', 'c'), ('v1', 'a'), ('v1', 'd')]
+    assert store.evictions == 1
+    assert store.bytes == 30
+
+def test_older_versions_are_dropped():
+    store = cache(100)
+    store.lookup(('v1', 'a'), lambda: 10)
+    store.lookup(('v2', 'a'), lambda: 20)
+    assert list(store._entries) == [('v2', 'a')]
+    assert store.bytes == 20
+    assert store.evictions == 0
+
+def test_values_larger_than_the_budget_are_not_kept():
+    store = cache(10)
+    store.lookup(('v1', 'a'), lambda: 5)
+    assert store.lookup(('v1', 'b'), lambda: 50) == 50
+    assert list(store._entries) == [('v1', 'a')]
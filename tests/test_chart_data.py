@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+from shared.chart_data import aggregate, histogram, stacked_bars, top_n
+
+
+def test_histogram_counts_values_per_bin():
+    values = np.array([0, 4, 5, 9, 10, 31])
+    bins = histogram(np.floor(values / 5), 5)
+    assert bins['Bin Start'].tolist() == [0, 5, 10, 30]
+    assert bins['Bin End'].tolist() == [5, 10, 15, 35]
+    assert bins['Count'].tolist() == [2, 2, 1, 1]
+
+def test_histogram_sums_counts_and_drops_empty_bins():
+    bins = histogram([3, 1, 3, 2], 100, counts=[2, 5, 1, 0], scale=100)
+    assert bins['Bin Start'].tolist() == [1, 3]
+    assert bins['Bin End'].tolist() == [2, 4]
+    assert bins['Count'].tolist() == [5, 3]
+    assert bins['Count'].dtype == np.int64
+
+def test_histogram_of_nothing_is_empty():
+    bins = histogram([], 10, name='Employees')
+    assert bins.empty
+    assert list(bins.columns) == ['Bin Start', 'Bin End', 'Employees']
+
+def test_histogram_matches_numpy():
+    rng = np.random.default_rng(0)
+    values = rng.integers(1_500_000, 20_000_000, 10_000)
+    step = 500_000
+    bins = histogram(values // step, step)
+    expected, edges = np.histogram(values, bins=np.arange(0, 20_500_000, step))
+    non_empty = expected > 0
+    assert bins['Count'].tolist() == expected[non_empty].tolist()
+    assert bins['Bin Start'].tolist() == edges[:-1][non_empty].tolist()
+
+
+def test_aggregate_counts_and_reduces():
+    df = pd.DataFrame({'Division': ['a', 'b', 'a'], 'Pay': [1, 2, 3]})
+    assert aggregate(df, ['Division']).to_dict('list') == {'Division': ['a', 'b'], 'Count': [2, 1]}
+    assert aggregate(df, ['Division'], 'Pay', 'max', 'Max').to_dict('list') == {'Division': ['a', 'b'], 'Max': [3, 2]}
+
+def test_stacked_bars_orders_bars_by_total():
+    df = pd.DataFrame({
+        'Division': ['a', 'a', 'b', 'b'],
+        'Type': ['Part-time', 'Full-time', 'Full-time', 'Part-time'],
+        'Count': [1, 1, 5, 1],
+    })
+    bars = stacked_bars(df, 'Division', 'Type')
+    assert bars[['Division', 'Type']].values.tolist() == [
+        ['b', 'Full-time'], ['b', 'Part-time'], ['a', 'Full-time'], ['a', 'Part-time'],
+    ]
+
+def test_top_n_sums_the_rest_into_other():
+    df = pd.DataFrame({'Title': pd.Categorical(['a', 'b', 'c', 'd']), 'Rows': [1, 4, 2, 4], 'Pay': [10, 40, 20, 40]})
+    top = top_n(df, 'Title', 'Rows', 2, other='Rest')
+    assert top.to_dict('list') == {'Title': ['b', 'd', 'Rest'], 'Rows': [4, 4, 3], 'Pay': [40, 40, 30]}
+    assert top['Rows'].dtype == np.int64
+
+def test_top_n_without_a_remainder():
+    df = pd.DataFrame({'Title': ['a', 'b'], 'Rows': [1, 2]})
+    assert top_n(df, 'Title', 'Rows', 2).to_dict('list') == {'Title': ['b', 'a'], 'Rows': [2, 1]}
+    assert top_n(df.iloc[:0], 'Title', 'Rows', 2).empty
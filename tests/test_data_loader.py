@@ -0,0 +1,78 @@
+import datetime
+import os
+import pandas as pd
+import pytest
+from shared import data_loader
+from shared.data_loader import discover_snapshots, get_dataset, get_snapshots, load_snapshot, snapshot_path
+
+
+PAYROLL_CSV = 'data/City of Memphis Employee Salaries 2025.csv'
+
+
+def touch(directory, *names):
+    for name in names:
+        (directory / name).write_text('')
+
+
+def test_discover_snapshots_orders_by_date(tmp_path):
+    touch(tmp_path, 'Salaries 2025.csv', 'Salaries 2024-06-30.csv', 'Salaries 2024.csv', 'Salaries 2024-07.csv')
+    snapshots = discover_snapshots(tmp_path)
+    assert list(snapshots) == ['2024', '2024-06-30', '2024-07', '2025']
+    assert snapshots['2024-06-30'].date == datetime.date(2024, 6, 30)
+    assert snapshots['2024-07'].date == datetime.date(2024, 7, 1)
+    assert snapshots['2025'].path == os.path.join(tmp_path, 'Salaries 2025.csv')
+
+def test_discover_snapshots_skips_other_files(tmp_path):
+    touch(
+        tmp_path,
+        'Salaries 2025.csv',
+        'Salaries.csv',                 # no date
+        'Salaries 2024.xlsx',           # not a CSV
+        '.Salaries 2023.csv',           # hidden
+        'Salaries 2022-13.csv',         # no such month
+        'Salaries 2021-02-30.csv',      # no such day
+        'Salaries 120250.csv',          # digits of a longer number
+    )
+    assert list(discover_snapshots(tmp_path)) == ['2025']
+
+def test_discover_snapshots_rejects_two_files_per_date(tmp_path):
+    touch(tmp_path, 'Salaries 2025.csv', 'Payroll 2025.csv')
+    with pytest.raises(ValueError):
+        discover_snapshots(tmp_path)
+
+def test_get_dataset_without_snapshots_names_the_expected_files(tmp_path, monkeypatch):
+    touch(tmp_path, 'Salaries.csv')
+    monkeypatch.setattr(data_loader, 'discover_snapshots', lambda: discover_snapshots(tmp_path))
+    get_snapshots.clear()
+    try:
+        with pytest.raises(FileNotFoundError, match=r'\*_YYYY\*\.csv'):
+            get_dataset()
+    finally:
+        get_snapshots.clear()
+
+
+@pytest.fixture
+def snapshot(tmp_path, monkeypatch):
+    # The first rows of the real payroll file, with partitions kept in tmp_path
+    path = tmp_path / 'Salaries 2025.csv'
+    pd.read_csv(PAYROLL_CSV, nrows=200).to_csv(path, index=False)
+    monkeypatch.setattr(data_loader, 'SNAPSHOT_DIR', str(tmp_path / '.snapshots'))
+    return discover_snapshots(tmp_path)['2025']
+
+def test_load_snapshot_writes_and_reads_its_partition(snapshot):
+    parsed = load_snapshot(snapshot)
+    partition = snapshot_path(snapshot, data_loader.file_digest(snapshot.path))
+    assert os.path.exists(partition)
+    pd.testing.assert_frame_equal(load_snapshot(snapshot), parsed)
+
+def test_load_snapshot_leaves_no_partial_partition(snapshot, monkeypatch):
+    def fail(df, path, **kwargs):
+        with open(path, 'wb') as f:
+            f.write(b'partial')
+        raise OSError('disk full')
+
+    monkeypatch.setattr(data_loader.feather, 'write_feather', fail)
+    # Still loads, from the CSV
+    assert len(load_snapshot(snapshot)) == 200
+    partition_dir = os.path.dirname(snapshot_path(snapshot, 'x'))
+    assert os.listdir(partition_dir) == []
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+from shared.dataset import CLUSTER_KEYS, SalaryDataset
+from shared.taxonomy import GROUP_DIVISIONS, ROW_KEYS
+
+
+def block_rows(blocks) -> np.ndarray:
+    starts, stops = blocks
+    return np.concatenate([np.arange(start, stop) for start, stop in zip(starts, stops)] or [np.empty(0, dtype=int)])
+
+def matching_rows(frame: pd.DataFrame, **filters) -> np.ndarray:
+    mask = np.ones(len(frame), dtype=bool)
+    for key, values in filters.items():
+        values = values if isinstance(values, list) else [values]
+        mask &= frame[ROW_KEYS[key]].isin(values).to_numpy()
+    return np.flatnonzero(mask)
+
+
+def test_rows_are_clustered(dataset):
+    frame = dataset.frame
+    codes = [frame[column].cat.codes.to_numpy() for column in CLUSTER_KEYS]
+    assert (np.lexsort(codes[::-1]) == np.arange(len(frame))).all()
+
+def test_blocks_hold_exactly_the_matching_rows(dataset):
+    frame = dataset.frame
+    filters = [{}]
+    for key, column in ROW_KEYS.items():
+        filters += [{key: value} for value in frame[column].unique()]
+    filters += [
+        {'division': 'Police Services', 'employment_type': 'Part-time'},
+        {'category': 'Public Works', 'employment_type': 'Full-time'},
+        {'division': ['Fire Services', 'Library Services']},
+        {'employment_type': ['Full-time', 'Part-time']},
+        {'division': 'No Such Division'},
+    ]
+    for spec in filters:
+        assert (block_rows(dataset.blocks(**spec)) == matching_rows(frame, **spec)).all(), spec
+
+def test_contiguous_selections_are_one_block(dataset):
+    for spec in [
+        {'category': 'Public Safety'},
+        {'division': 'Police Services'},
+        {'division': 'Police Services', 'employment_type': 'Full-time'},
+        {'group': 'Governance'},
+        {'division': GROUP_DIVISIONS['Governance']},
+    ]:
+        starts, stops = dataset.blocks(**spec)
+        assert len(starts) == len(stops) == 1, spec
+
+def test_blocks_are_sorted_and_apart(dataset):
+    starts, stops = dataset.blocks(employment_type='Part-time')
+    assert (starts < stops).all()
+    assert (stops[:-1] < starts[1:]).all()
+
+def test_frame_is_read_only(dataset):
+    frame = dataset.frame
+    salary, division = frame.loc[0, 'Annual Salary'], frame.loc[0, 'Division Name']
+    with pytest.raises(ValueError):
+        frame.loc[0, 'Annual Salary'] = 0
+    with pytest.raises(ValueError):
+        frame['Division Name'].array[0] = 'Fire Services'
+    # Arrow strings are immutable: the write replaces this frame's column only
+    frame.loc[0, 'Person Name'] = 'Nobody'
+    frame['Job Title'] = 'Nobody'
+    assert dataset.frame.loc[0, 'Person Name'] != 'Nobody'
+    assert (dataset.frame['Job Title'] != 'Nobody').all()
+    assert dataset.frame.loc[0, 'Annual Salary'] == salary
+    assert dataset.frame.loc[0, 'Division Name'] == division
+
+def test_empty_dataset_has_no_blocks(dataset):
+    empty = SalaryDataset(dataset.frame.iloc[:0], 'empty')
+    starts, stops = empty.blocks(division='Police Services')
+    assert len(starts) == len(stops) == 0
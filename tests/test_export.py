@@ -0,0 +1,133 @@
+import io
+from urllib.parse import parse_qs
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+from streamlit.testing.v1 import AppTest
+from shared import data_server
+from shared.explorer import ExplorerFilter, ExplorerIndex
+from shared.export import (
+    EXPORT_COLUMNS,
+    export_batches,
+    export_chunks,
+    export_filename,
+    export_query,
+    export_rows,
+    filter_from_query,
+)
+
+
+SPECS = [
+    ExplorerFilter(),
+    ExplorerFilter(divisions=('Police Services',), employment_types=('Part-time',)),
+    ExplorerFilter(categories=('Public Works', 'Good Government')),
+    ExplorerFilter(divisions=('Executive', 'Legislative', 'Judicial')),
+    ExplorerFilter(employment_types=('Full-time',), salary_range=(50_000, 90_000)),
+    ExplorerFilter(job_titles=('Police Officer II', 'Firefighter')),
+    ExplorerFilter(divisions=('Memphis Parks',), rate_range=(10, 15)),
+    ExplorerFilter(divisions=('No Such Division',)),
+]
+
+
+@pytest.fixture(scope='module')
+def index(dataset):
+    return ExplorerIndex(dataset.frame)
+
+def exported_rows(dataset, index, spec, chunk_rows=None) -> np.ndarray:
+    # Positions of the rows an export of a filter reads, in order
+    blocks, row_mask = export_rows(dataset, index, spec)
+    positions = []
+    for start, stop in zip(*blocks):
+        mask = np.ones(stop - start, dtype=bool) if row_mask is None else row_mask(start, stop)
+        positions.append(start + np.flatnonzero(mask))
+    return np.concatenate(positions or [np.empty(0, dtype=int)])
+
+
+@pytest.mark.parametrize('spec', SPECS)
+def test_export_rows_match_the_explorer_filter(dataset, index, spec):
+    expected = index.rows(index.filter(index.canonical(spec)))
+    assert (exported_rows(dataset, index, spec) == expected).all()
+
+@pytest.mark.parametrize('file_format', ['csv', 'parquet'])
+def test_export_files_hold_the_filtered_rows(dataset, index, file_format):
+    spec = ExplorerFilter(divisions=('Police Services', 'Fire Services'), employment_types=('Full-time',), salary_range=(60_000, 80_000))
+    blocks, row_mask = export_rows(dataset, index, spec)
+    data = b''.join(export_chunks(dataset.frame, file_format, row_mask, blocks))
+    exported = pd.read_csv(io.BytesIO(data)) if file_format == 'csv' else pq.read_table(io.BytesIO(data)).to_pandas()
+
+    rows = dataset.frame.iloc[index.rows(index.filter(index.canonical(spec)))]
+    assert list(exported.columns) == EXPORT_COLUMNS
+    assert exported['Person Name'].tolist() == rows['Person Name'].tolist()
+    assert exported['Annual Salary'].tolist() == pytest.approx((rows['Annual Salary'] / 100).tolist())
+    assert exported['Annual Salary'].between(60_000, 80_000, inclusive='left').all()
+
+def test_export_batches_split_blocks_into_chunks(dataset, index):
+    blocks, row_mask = export_rows(dataset, index, ExplorerFilter(employment_types=('Part-time',)))
+    batches = list(export_batches(dataset.frame, row_mask, blocks, chunk_rows=100))
+    assert max(len(batch) for batch in batches) <= 100
+    assert sum(len(batch) for batch in batches) == (dataset.frame['Employment Type'] == 'Part-time').sum()
+
+def test_empty_export_is_a_header(dataset, index):
+    blocks, row_mask = export_rows(dataset, index, ExplorerFilter(divisions=('No Such Division',)))
+    data = b''.join(export_chunks(dataset.frame, 'csv', row_mask, blocks))
+    assert data.decode().splitlines() == [','.join(f'"{column}"' for column in EXPORT_COLUMNS)]
+
+def test_unknown_export_format(dataset):
+    with pytest.raises(ValueError):
+        export_chunks(dataset.frame, 'xlsx')
+
+
+@pytest.mark.parametrize('spec', SPECS)
+def test_query_round_trips(spec):
+    assert filter_from_query(parse_qs(export_query(spec))) == spec
+
+def test_query_without_both_pay_bounds_ignores_them():
+    assert filter_from_query({'salary_min': ['50000']}).salary_range is None
+
+def test_export_filename():
+    assert export_filename(ExplorerFilter(divisions=('Police Services',), employment_types=('Part-time',)), 'csv') == 'memphis-employees-police-services-part-time.csv'
+    assert export_filename(ExplorerFilter(salary_range=(0, 10)), 'parquet') == 'memphis-employees-filtered.parquet'
+    assert export_filename(ExplorerFilter(), 'csv') == 'memphis-employees.csv'
+
+
+@pytest.fixture
+def explorer(monkeypatch):
+    """Runs the explorer page, whose export popover takes the data server as running"""
+    monkeypatch.setattr(data_server, 'start_data_server', lambda: data_server.DATA_SERVER_PORT)
+    monkeypatch.setattr(data_server, 'DATA_SERVER_URL', None)
+
+    def run() -> AppTest:
+        app = AppTest.from_file('streamlit_app.py', default_timeout=120)
+        app.switch_page('pages/explorer.py')
+        app.run()
+        assert not app.exception
+        return app
+    return run
+
+def export_links(app: AppTest) -> list[str]:
+    return [button.proto.url for button in app.get('link_button') if '/export.' in button.proto.url]
+
+def test_local_browsers_stream_from_the_data_server(explorer):
+    # AppTest has no browser URL, so the app counts as opened on localhost
+    app = explorer()
+    port = data_server.DATA_SERVER_PORT
+    assert export_links(app) == [f'http://localhost:{port}/export.csv', f'http://localhost:{port}/export.parquet']
+    assert not app.get('download_button')
+
+def test_configured_url_reaches_the_data_server(explorer, monkeypatch):
+    monkeypatch.setattr(data_server, 'LOCAL_HOSTS', set())
+    monkeypatch.setattr(data_server, 'DATA_SERVER_URL', 'https://data.example.org/')
+    app = explorer()
+    assert export_links(app) == ['https://data.example.org/export.csv', 'https://data.example.org/export.parquet']
+
+def test_other_browsers_download_from_the_app(explorer, monkeypatch):
+    monkeypatch.setattr(data_server, 'LOCAL_HOSTS', set())
+    app = explorer()
+    assert export_links(app) == []
+    assert len(app.get('download_button')) == 2
+
+def test_export_file_builds_the_whole_file(dataset, index):
+    spec = ExplorerFilter(divisions=('Police Services',), employment_types=('Part-time',))
+    data = data_server.export_file(spec, 'csv')()
+    assert len(pd.read_csv(io.BytesIO(data))) == len(exported_rows(dataset, index, spec))
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+from shared.job_titles import TITLE_STATISTICS, TitleIndex, normalize_job_title, normalize_job_titles, trigrams
+
+
+TITLES = ['Police Officer II', 'Police Lieutenant', 'Firefighter', 'Fire Captain', 'Librarian', 'Library Assistant']
+
+
+def title_stats(titles: list[str]) -> pd.DataFrame:
+    stats = pd.DataFrame({column: np.arange(len(titles), dtype=float) for column in TITLE_STATISTICS}, index=pd.Index(titles, name='Job Title'))
+    stats['Employees'] = np.arange(len(titles), 0, -1)
+    return stats
+
+def similarity(query: str, title: str) -> float:
+    # Trigrams shared over all trigrams of both, computed directly
+    a, b = set(trigrams(query)), set(trigrams(title))
+    return len(a & b) / max(len(a | b), 1)
+
+
+@pytest.mark.parametrize('title, expected', [
+    ('Compensation Coord Sr', 'Senior Compensation Coordinator'),
+    ('Financial Officer Chief', 'Chief Financial Officer'),
+    ('Police Svcs Director', 'Police Services Director'),
+])
+def test_normalize_job_title(title, expected):
+    assert normalize_job_title(title) == expected
+
+def test_normalize_job_titles_keeps_missing_titles():
+    titles = normalize_job_titles(pd.Series(['Maint Mgr', None, 'Maint Mgr']))
+    assert titles[0] == titles[2] == 'Maintenance Manager'
+    assert pd.isna(titles[1])
+
+def test_trigrams_mark_word_boundaries():
+    assert trigrams('Fire') == ['  f', ' fi', 'fir', 'ire', 're ']
+    assert trigrams('') == []
+
+@pytest.mark.parametrize('query', ['polce officr', 'fire', 'libarian', 'captain fire', 'zzz', ''])
+def test_search_scores_match_direct_similarity(query):
+    index = TitleIndex(title_stats(TITLES))
+    results = index.search(query, limit=len(TITLES), min_score=0)
+    expected = {title: similarity(query, title) for title in TITLES}
+    assert sorted(results['Job Title']) == sorted(TITLES)
+    for title, score in zip(results['Job Title'], results['Score']):
+        assert score == pytest.approx(expected[title]), title
+    assert (np.diff(results['Score']) <= 0).all()
+
+def test_search_ranks_misspellings_and_ties():
+    index = TitleIndex(title_stats(TITLES))
+    assert index.search('polce officr')['Job Title'][0] == 'Police Officer II'
+    assert index.search('libarian')['Job Title'][0] == 'Librarian'
+    # Equal scores put the title with more employees first
+    tied = TitleIndex(title_stats(['Clerk A', 'Clerk B']))
+    assert tied.search('clerk')['Job Title'].tolist() == ['Clerk A', 'Clerk B']
+
+def test_search_limits_and_thresholds():
+    index = TitleIndex(title_stats(TITLES))
+    assert len(index.search('police', limit=1)) == 1
+    assert index.search('zzz').empty
+    assert (index.search('fire', min_score=0.3)['Score'] >= 0.3).all()
+
+def test_search_over_the_payroll(dataset):
+    index = TitleIndex(dataset.cube.rollup(by=['Job Title']))
+    results = index.search('polce officr')
+    assert results['Job Title'][0].startswith('Police Officer')
+    assert list(results.columns) == ['Job Title'] + TITLE_STATISTICS + ['Score']
@@ -0,0 +1,142 @@
+import pandas as pd
+import pytest
+from streamlit.testing.v1 import AppTest
+from shared import category_page, data_loader
+from shared.data_loader import PayrollSnapshot, get_snapshots
+from shared.navigation import LOGO_URL
+
+
+APP_SCRIPT = 'streamlit_app.py'
+PAGES = [
+    None,
+    'pages/public-safety.py',
+    'pages/public-works.py',
+    'pages/stronger-neighborhoods.py',
+    'pages/good-government.py',
+    'pages/explorer.py',
+    'pages/pay-distribution.py',
+    'pages/directory.py',
+    'pages/year-over-year.py',
+]
+# Pages with several division sections, and the sections' labels
+DIVISION_SECTIONS = {
+    'pages/public-works.py': ['Public Works', 'Solid Waste Management', 'General Services', 'City Engineering'],
+    'pages/good-government.py': ['Governance', 'Finance', 'HR', 'IT', 'Legal'],
+}
+
+
+def open_page(page: str = None) -> AppTest:
+    app = AppTest.from_file(APP_SCRIPT, default_timeout=120)
+    if page:
+        app.switch_page(page)
+    rerun(app)
+    return app
+
+def resubmit_controls(app: AppTest):
+    # AppTest only sends single-select segmented controls back as a list,
+    # and an empty one as an empty list
+    for control in app.button_group:
+        if control.value is None:
+            control.set_value([])
+        elif isinstance(control.value, str):
+            control.set_value([control.value])
+
+def rerun(app: AppTest):
+    app.run()
+    assert not app.exception, app.exception[0].value if app.exception else ''
+
+def division_headings(app: AppTest) -> list[str]:
+    # Labels of the division sections shown, from their '### <label> ...' headings
+    labels = [label for labels in DIVISION_SECTIONS.values() for label in labels]
+    headings = [element.value for element in app.markdown if element.value.startswith('### ')]
+    return [label for heading in headings for label in labels if heading.startswith(f'### {label} ')]
+
+
+@pytest.fixture
+def lazy_layout(request, monkeypatch):
+    """Render category pages with the layout given as parameter instead of their own"""
+    render = category_page.render_category_page
+    monkeypatch.setattr(category_page, 'render_category_page', lambda page: render(page._replace(layout=request.param)))
+    return request.param
+
+
+@pytest.mark.parametrize('page', PAGES)
+def test_page_renders(page):
+    app = open_page(page)
+    assert app.title or app.markdown
+    assert [link.proto.page for link in app.sidebar.get('page_link')][:1] == ['']
+    assert any(f'src="{LOGO_URL}"' in element.value for element in app.sidebar.markdown)
+
+@pytest.mark.parametrize('page', DIVISION_SECTIONS)
+def test_stacked_page_shows_every_division(page):
+    app = open_page(page)
+    assert division_headings(app) == DIVISION_SECTIONS[page]
+
+@pytest.mark.parametrize('lazy_layout', ['tabs'], indirect=True)
+@pytest.mark.parametrize('page, label', [(page, label) for page, labels in DIVISION_SECTIONS.items() for label in labels])
+def test_every_division_tab_renders(lazy_layout, page, label):
+    app = open_page(page)
+    control = next(control for control in app.button_group if control.key.endswith('division tab'))
+    assert [option.content for option in control.proto.options] == DIVISION_SECTIONS[page]
+    resubmit_controls(app)
+    control.set_value([label])
+    rerun(app)
+    assert division_headings(app) == [label]
+
+@pytest.mark.parametrize('lazy_layout', ['expanders'], indirect=True)
+@pytest.mark.parametrize('page', DIVISION_SECTIONS)
+def test_expanded_divisions_render(lazy_layout, page):
+    app = open_page(page)
+    assert [toggle.label for toggle in app.toggle] == DIVISION_SECTIONS[page]
+    assert division_headings(app) == []
+    resubmit_controls(app)
+    for toggle in app.toggle:
+        toggle.set_value(True)
+    rerun(app)
+    assert division_headings(app) == DIVISION_SECTIONS[page]
+
+def test_directory_search():
+    app = open_page('pages/directory.py')
+    assert [tab.label for tab in app.tabs] == ['Employees', 'Job Titles']
+    app.text_input[0].set_value('police officer')
+    resubmit_controls(app)
+    rerun(app)
+    assert app.dataframe and len(app.dataframe[0].value) > 0
+
+def test_explorer_filters():
+    app = open_page('pages/explorer.py')
+    everyone = app.metric[0].value
+    app.multiselect[1].set_value(['Police Services'])
+    resubmit_controls(app)
+    rerun(app)
+    assert app.metric[0].value != everyone
+
+
+@pytest.fixture
+def two_snapshots(tmp_path, monkeypatch):
+    # A made-up earlier year next to the real payroll file: a tenth of the
+    # people missing and everyone paid 3% less
+    latest = next(reversed(data_loader.discover_snapshots().values()))
+    earlier = pd.read_csv(latest.path).sample(frac=0.9, random_state=0).sort_index()
+    earlier['Annual Salary'] = (pd.to_numeric(earlier['Annual Salary'], errors='coerce') * 0.97).round(2)
+    earlier_path = tmp_path / 'Salaries 2024.csv'
+    earlier.to_csv(earlier_path, index=False)
+
+    snapshots = {
+        '2024': PayrollSnapshot('2024', pd.Timestamp('2024-01-01').date(), str(earlier_path)),
+        latest.key: latest,
+    }
+    monkeypatch.setattr(data_loader, 'discover_snapshots', lambda: snapshots)
+    monkeypatch.setattr(data_loader, 'SNAPSHOT_DIR', str(tmp_path / '.snapshots'))
+    get_snapshots.clear()
+    yield snapshots
+    get_snapshots.clear()
+
+def test_year_over_year_compares_two_snapshots(two_snapshots):
+    app = open_page('pages/year-over-year.py')
+    assert not app.info
+    selected = {box.label: box.value for box in app.selectbox}
+    assert (selected['With'], selected['Compare']) == ('2024', '2025')
+    metrics = {metric.label: metric.value for metric in app.metric}
+    assert metrics['Hires'] != '0'
+    assert [tab.label.split(' (')[0] for tab in app.tabs] == ['Hires', 'Separations', 'Transfers', 'Title Changes', 'Largest Raises']
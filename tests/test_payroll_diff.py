@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+from shared.payroll_diff import HIRED, SEPARATED, STAYED, TRANSFERRED, diff_payrolls, hash_join, name_keys, synthetic_year
+
+
+def payroll(rows: list[tuple]) -> pd.DataFrame:
+    # (Person Name, Division Name, Job Title, Annual Salary in dollars) rows
+    # as a compact payroll frame
+    names, divisions, titles, salaries = zip(*rows) if rows else ([], [], [], [])
+    return pd.DataFrame({
+        'Person Name': pd.array(names, dtype=pd.StringDtype('pyarrow')),
+        'Division Name': pd.Categorical(divisions),
+        'Job Title': pd.Categorical(titles),
+        'Annual Salary': pd.array([None if s is None else s * 100 for s in salaries], dtype='Int64'),
+        'Hourly/Per Event Rate': pd.array([None] * len(names), dtype='Int64'),
+    })
+
+def statuses(diff) -> dict:
+    return dict(zip(diff.people['Person Name'], diff.people['Status']))
+
+
+def test_name_keys_ignore_case_accents_and_punctuation():
+    keys = name_keys(pd.Series(["O'Neal, José", 'Oneal,  Jose', 'ONEAL, JOSE', None]))
+    assert keys.tolist() == ['oneal jose'] * 3 + ['']
+
+def test_hash_join_pairs_the_nth_row_of_each_key():
+    before = [np.array([1, 1, 2, 3]), np.array([0, 0, 0, 0])]
+    after = [np.array([3, 1, 4]), np.array([0, 0, 0])]
+    before_positions, after_positions = hash_join(before, after)
+    # The first 1 pairs with the only 1 after, the second is left over
+    assert sorted(zip(before_positions.tolist(), after_positions.tolist())) == [(0, 1), (3, 0)]
+
+def test_people_are_matched_by_division_then_title():
+    before = payroll([
+        ('Smith, Ann', 'Fire Services', 'Fire Captain', 90_000),
+        ('Jones, Bo', 'Police Services', 'Police Officer II', 60_000),
+        ('Lee, Cy', 'Library Services', 'Librarian', 50_000),
+    ])
+    after = payroll([
+        ('SMITH, ANN', 'Fire Services', 'Fire Chief', 120_000),
+        ('Jones, Bo', 'Memphis Parks', 'Police Officer II', 61_000),
+        ('Park, Di', 'Library Services', 'Librarian', 48_000),
+    ])
+    diff = diff_payrolls(before, after, '2024', '2025')
+    assert statuses(diff) == {'SMITH, ANN': STAYED, 'Jones, Bo': TRANSFERRED, 'Park, Di': HIRED, 'Lee, Cy': SEPARATED}
+
+    smith = diff.people.set_index('Person Name').loc['SMITH, ANN']
+    assert (smith['Job Title Before'], smith['Job Title After']) == ('Fire Captain', 'Fire Chief')
+    assert smith['Raise'] == 30_000
+    assert smith['Raise %'] == pytest.approx(1 / 3)
+
+    totals = diff.totals
+    assert (totals['Employees Before'], totals['Employees After']) == (3, 3)
+    assert (totals['Hires'], totals['Separations'], totals['Transfers In'], totals['Title Changes']) == (1, 1, 1, 1)
+    assert totals['Payroll Change'] == pytest.approx(229_000 - 200_000)
+
+def test_namesakes_in_one_division_pair_one_to_one():
+    before = payroll([('Brown, Al', 'Fire Services', 'Firefighter', 50_000)] * 2)
+    after = payroll([('Brown, Al', 'Fire Services', 'Firefighter', 52_000)] * 3)
+    diff = diff_payrolls(before, after)
+    assert diff.people['Status'].value_counts().to_dict() == {STAYED: 2, HIRED: 1, TRANSFERRED: 0, SEPARATED: 0}
+
+def test_division_deltas_count_each_side_by_its_own_division():
+    before = payroll([('Jones, Bo', 'Police Services', 'Police Officer II', 60_000)])
+    after = payroll([('Jones, Bo', 'Memphis Parks', 'Police Officer II', 61_000)])
+    divisions = diff_payrolls(before, after).divisions
+    assert divisions.loc['Police Services', 'Transfers Out'] == 1
+    assert divisions.loc['Police Services', 'Employees After'] == 0
+    assert divisions.loc['Memphis Parks', 'Transfers In'] == 1
+    assert divisions.loc['Memphis Parks', 'Median Raise'] == 1_000
+
+@pytest.mark.parametrize('before_rows, after_rows', [(0, 0), (0, 2), (2, 0)])
+def test_empty_snapshots_diff_to_zeros(before_rows, after_rows):
+    rows = [('Smith, Ann', 'Fire Services', 'Fire Captain', 90_000), ('Lee, Cy', 'Library Services', 'Librarian', None)]
+    diff = diff_payrolls(payroll(rows[:before_rows]), payroll(rows[:after_rows]))
+    assert diff.totals['Hires'] == after_rows
+    assert diff.totals['Separations'] == before_rows
+    assert pd.isna(diff.totals['Median Raise'])
+    assert len(diff.divisions) == max(before_rows, after_rows)
+
+def test_synthetic_year_diff_adds_up(dataset):
+    frame = dataset.frame
+    diff = diff_payrolls(frame, synthetic_year(frame))
+    counts = diff.people['Status'].value_counts()
+    assert counts[STAYED] + counts[TRANSFERRED] + counts[SEPARATED] == len(frame)
+    assert diff.totals['Hires'] == counts[HIRED]
+    assert diff.divisions['Transfers In'].sum() == diff.divisions['Transfers Out'].sum() == counts[TRANSFERRED]
+    assert diff.divisions['Headcount Change'].sum() == diff.totals['Headcount Change']